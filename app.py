@@ -6,6 +6,9 @@
 CustomTkinter 기반 데스크톱 애플리케이션
 """
 
+import time
+STARTUP_TIME = time.perf_counter()
+
 import sys
 import os
 
@@ -14,13 +17,24 @@ src_path = os.path.join(os.path.dirname(__file__), 'src')
 if src_path not in sys.path:
     sys.path.insert(0, src_path)
 
-from src.main_window import MainWindow
+from startup import StartupProfile
 
 def main():
     """Main application entry point"""
+    # --startup-profile: 모듈별 임포트 시간과 첫 화면 표시까지의 시간 출력
+    startup_profile = None
+    if "--startup-profile" in sys.argv[1:]:
+        startup_profile = StartupProfile(STARTUP_TIME)
+        startup_profile.imports.install()
+
     try:
+        # UI 모듈은 프로파일러 설치 후에 임포트
+        from main_window import MainWindow
+        if startup_profile:
+            startup_profile.mark("main window imported")
+
         # Create and run main window
-        app = MainWindow()
+        app = MainWindow(startup_profile=startup_profile)
         app.run()
 
     except KeyboardInterrupt:
@@ -31,4 +45,8 @@ def main():
         traceback.print_exc()
 
 if __name__ == "__main__":
+    if sys.argv[1:2] == ["batch"]:
+        # python app.py batch ...: GUI 없이 여러 회사 보고서 일괄 생성
+        from batch_report import main as batch_main
+        sys.exit(batch_main(sys.argv[2:]))
     main()
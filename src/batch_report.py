@@ -0,0 +1,198 @@
+import argparse
+import json
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from models import ChecklistParser
+from checklist_cache import load_checklist
+from state_manager import StateManager
+from state_storage import write_file_atomic
+
+MANIFEST_NAME = "manifest.json"
+
+# Checklist of this worker process, loaded once by _init_worker
+_worker_checklist: Optional[List] = None
+
+
+def find_state_files(states_dir: str) -> List[str]:
+    """state_<company>.json files of a data directory, in name order"""
+    return [os.path.join(states_dir, file_name) for file_name in sorted(os.listdir(states_dir))
+            if file_name.startswith("state_") and file_name.endswith(".json")]
+
+
+def write_text_report(company_name: str, title1_nodes: List, state_manager: StateManager,
+                      template: Optional[str], output_dir: str) -> Tuple[str, Dict[str, float]]:
+    """Plain text summary of the checked items; needs no HWP installation"""
+    from hwp_converter import format_checklist_summary
+
+    output_path = os.path.join(output_dir, f"{_safe_file_name(company_name)}.txt")
+    summary = format_checklist_summary(title1_nodes, state_manager)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(f"{company_name}\n{summary}\n")
+    return output_path, {}
+
+
+def write_hwp_report(company_name: str, title1_nodes: List, state_manager: StateManager,
+                     template: Optional[str], output_dir: str) -> Tuple[str, Dict[str, float]]:
+    """Report filled from an HWP or HWPX template.
+
+    HWPConverter picks the backend from the template type: .hwpx files are
+    edited directly, .hwp files go through the HWP COM automation.
+    """
+    from hwp_converter import HWPConverter
+    from conversion_payload import ConversionPayload
+    from template_cache import get_template_cache
+
+    if not template:
+        raise ValueError("The hwp backend needs a --template file")
+
+    # The template is compiled once per worker process, then every company reuses the plan
+    converter = HWPConverter(template_cache=get_template_cache())
+    success, message = converter.convert_checklist_to_hwp(
+        template,
+        company_name,
+        ConversionPayload.from_state_manager(state_manager, title1_nodes, company_name),
+        title1_nodes
+    )
+    if not success or not os.path.exists(converter.output_path):
+        raise RuntimeError(message)
+
+    # 변환기는 템플릿 옆에 저장하므로 결과 디렉토리로 옮김
+    output_path = os.path.join(output_dir, os.path.basename(converter.output_path))
+    if os.path.abspath(output_path) != os.path.abspath(converter.output_path):
+        shutil.move(converter.output_path, output_path)
+    return output_path, dict(converter.timings)
+
+
+# Output backend name -> writer(company_name, title1_nodes, state_manager, template, output_dir),
+# returning the output path and the writer's stage timings in seconds
+OUTPUT_BACKENDS: Dict[str, Callable[..., Tuple[str, Dict[str, float]]]] = {
+    "text": write_text_report,
+    "hwp": write_hwp_report,
+}
+
+
+def _safe_file_name(name: str) -> str:
+    return "".join(c for c in name if c.isalnum() or c in (' ', '-', '_')).rstrip() or "default"
+
+
+def _init_worker(checklist_path: str):
+    """Load the checklist once per worker process (from the compiled cache)"""
+    global _worker_checklist
+    _worker_checklist = load_checklist(checklist_path)
+
+
+def generate_report(state_file: str, backend: str, template: Optional[str],
+                    output_dir: str) -> Dict:
+    """Write one company's report; errors are returned in the result, not raised"""
+    start = time.perf_counter()
+    result = {"state_file": state_file, "company_name": None, "status": "ok",
+              "output": None, "checked_items": 0, "error": None, "timings": {}}
+    state_manager = None
+    try:
+        with open(state_file, 'r', encoding='utf-8') as f:
+            state_data = json.load(f)
+        file_name = os.path.basename(state_file)
+        company_name = state_data.get("company_name") or file_name[len("state_"):-len(".json")]
+        result["company_name"] = company_name
+
+        # The GUI's storage mode, so unfolded journals are included; read-only, so the
+        # state file and journal are left as they are for a GUI that has the company open
+        state_manager = StateManager(data_dir=os.path.dirname(state_file), company_name=company_name,
+                                     title1_nodes=_worker_checklist, storage_mode="journal",
+                                     save_delay=None, read_only=True)
+        if os.path.abspath(state_manager.state_file) != os.path.abspath(state_file):
+            raise ValueError(f"Company name '{company_name}' does not match the file name")
+        result["checked_items"] = state_manager.get_overall_progress(_worker_checklist)[0]
+        output, timings = OUTPUT_BACKENDS[backend](company_name, _worker_checklist, state_manager,
+                                                   template, output_dir)
+        result["output"] = output
+        result["timings"] = {stage: round(seconds, 4) for stage, seconds in timings.items()}
+    except Exception as e:
+        result["status"] = "error"
+        result["error"] = f"{type(e).__name__}: {e}"
+    finally:
+        if state_manager:
+            state_manager.close()
+    result["seconds"] = round(time.perf_counter() - start, 4)
+    return result
+
+
+def run_batch(checklist_path: str, states_dir: str, output_dir: str, backend: str = "text",
+              template: Optional[str] = None, workers: Optional[int] = None) -> Dict:
+    """Generate reports for every state file in states_dir and write the manifest.
+
+    The checklist is parsed (and its compiled cache written) once here;
+    worker processes then load it from the cache. workers=1 runs everything
+    in this process. Returns the manifest.
+    """
+    if backend not in OUTPUT_BACKENDS:
+        raise ValueError(f"Unknown output backend: {backend}")
+
+    started_at = datetime.now().isoformat()
+    start = time.perf_counter()
+    title1_nodes = load_checklist(checklist_path)
+    if not ChecklistParser.validate_structure(title1_nodes):
+        raise ValueError("Invalid checklist structure")
+    load_seconds = time.perf_counter() - start
+
+    os.makedirs(output_dir, exist_ok=True)
+    state_files = find_state_files(states_dir)
+    jobs = [(state_file, backend, template, output_dir) for state_file in state_files]
+
+    if workers == 1:
+        global _worker_checklist
+        _worker_checklist = title1_nodes
+        results = [generate_report(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(checklist_path,)) as executor:
+            futures = [executor.submit(generate_report, *job) for job in jobs]
+            results = [future.result() for future in futures]
+
+    manifest = {
+        "started_at": started_at,
+        "finished_at": datetime.now().isoformat(),
+        "backend": backend,
+        "template": template,
+        "checklist": checklist_path,
+        "workers": workers or os.cpu_count(),
+        "checklist_load_seconds": round(load_seconds, 4),
+        "total_seconds": round(time.perf_counter() - start, 4),
+        "succeeded": sum(result["status"] == "ok" for result in results),
+        "failed": sum(result["status"] != "ok" for result in results),
+        "results": results,
+    }
+    data = json.dumps(manifest, ensure_ascii=False, indent=2).encode('utf-8')
+    write_file_atomic(os.path.join(output_dir, MANIFEST_NAME), data)
+    return manifest
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """python app.py batch --states data/ [--template X.hwp] [--backend hwp]"""
+    parser = argparse.ArgumentParser(prog="app.py batch",
+                                     description="Generate reports for many companies without the GUI")
+    parser.add_argument("--states", default="data", help="directory with state_<company>.json files")
+    parser.add_argument("--checklist", default=os.path.join("data", "checklist.json"))
+    parser.add_argument("--template", help="HWP template (hwp backend)")
+    parser.add_argument("--output", default="reports", help="directory for reports and manifest.json")
+    parser.add_argument("--backend", choices=sorted(OUTPUT_BACKENDS), default="text")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    manifest = run_batch(args.checklist, args.states, args.output, backend=args.backend,
+                         template=args.template, workers=args.workers)
+    for result in manifest["results"]:
+        if result["status"] != "ok":
+            print(f"[ERROR] {result['company_name'] or result['state_file']}: {result['error']}")
+    print(f"[OK] {manifest['succeeded']} reports, {manifest['failed']} failed, "
+          f"{manifest['total_seconds']:.1f}s -> {os.path.join(args.output, MANIFEST_NAME)}")
+    return 1 if manifest["failed"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,263 @@
+import gc
+import hashlib
+import json
+import os
+import struct
+import sys
+from array import array
+from typing import Callable, List, Optional
+
+from models import ChecklistParser, ChecklistTree, Title1, Title2, Section
+from state_storage import write_file_atomic
+
+# Bump whenever the node classes or the cache layout change
+CACHE_VERSION = 2
+# Cache file header: magic, version, source size, source mtime_ns, source sha256.
+# Plain fixed-size fields; the cache dir is writable, so nothing in it is unpickled.
+CACHE_MAGIC = b"ERCC"
+SKELETON_MAGIC = b"ERCS"
+CACHE_HEADER = struct.Struct('<4sIQq32s')
+# Separates strings in the compiled blob (ASCII unit separator)
+STRING_SEPARATOR = "\x1f"
+# Compiled payload header: title1 count, shape array size in bytes
+PAYLOAD_HEADER = struct.Struct('<II')
+# Skeleton payload header: size of the JSON skeleton index in bytes
+SKELETON_HEADER = struct.Struct('<I')
+
+
+def get_user_cache_dir() -> str:
+    """Per-user cache directory for the application"""
+    if os.name == "nt":
+        base_dir = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+        return os.path.join(base_dir, "easy_report", "cache")
+    base_dir = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base_dir, "easy_report")
+
+
+def get_cache_path(file_path: str, cache_dir: Optional[str] = None, extension: str = ".cache") -> str:
+    """Get the compiled cache path for a checklist file.
+
+    The cache lives next to the JSON unless running from a PyInstaller
+    bundle (whose files are extracted to a temp dir on every launch) or the
+    directory isn't writable; then it goes to the user cache dir. Lazy
+    skeletons are cached under extension ".skeleton".
+    """
+    source_dir = os.path.dirname(os.path.abspath(file_path))
+    file_name = os.path.basename(file_path)
+    if cache_dir is None:
+        if not getattr(sys, 'frozen', False) and os.access(source_dir, os.W_OK):
+            return os.path.join(source_dir, f"{file_name}{extension}")
+        cache_dir = get_user_cache_dir()
+
+    # Several checklists may share the user cache dir
+    path_hash = hashlib.sha1(os.path.abspath(file_path).encode('utf-8')).hexdigest()[:12]
+    return os.path.join(cache_dir, f"{file_name}.{path_hash}{extension}")
+
+
+def _file_hash(file_path: str) -> bytes:
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def compile_nodes(nodes: List[Title1]) -> Optional[bytes]:
+    """Compile a checklist tree into the cache payload.
+
+    All ids, labels and items go into one UTF-8 blob in document order and
+    the tree shape into an array of child/item counts, so loading is one
+    decode, one split and a tight rebuild loop. Returns None if a string
+    contains the separator.
+    """
+    strings = []
+    shape = array('I')
+    for title1 in nodes:
+        title2_nodes = title1.get_title2_children()
+        strings += (title1.id, title1.label)
+        shape.append(len(title2_nodes))
+        for title2 in title2_nodes:
+            sections = title2.get_sections()
+            strings += (title2.id, title2.label)
+            shape.append(len(sections))
+            for section in sections:
+                strings += (section.id, section.label)
+                strings += section.items
+                shape.append(len(section.items))
+
+    if any(STRING_SEPARATOR in string for string in strings):
+        return None
+    blob = STRING_SEPARATOR.join(strings).encode('utf-8')
+    shape_bytes = shape.tobytes()
+    return PAYLOAD_HEADER.pack(len(nodes), len(shape_bytes)) + shape_bytes + blob
+
+
+def load_compiled_nodes(payload: bytes) -> List[Title1]:
+    """Rebuild the indexed checklist tree from a compile_nodes() payload"""
+    title1_count, shape_size = PAYLOAD_HEADER.unpack_from(payload)
+    shape_end = PAYLOAD_HEADER.size + shape_size
+    shape = array('I')
+    shape.frombytes(payload[PAYLOAD_HEADER.size:shape_end])
+    blob = payload[shape_end:]
+
+    # Allocation-heavy rebuild: keep the cyclic GC from rescanning young objects
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        strings = blob.decode('utf-8').split(STRING_SEPARATOR) if blob else []
+        counts = iter(shape)
+        position = 0
+        nodes = ChecklistTree()
+        for _ in range(title1_count):
+            title1_id, title1_label = strings[position], strings[position + 1]
+            position += 2
+            title2_nodes = []
+            for _ in range(next(counts)):
+                title2_id, title2_label = strings[position], strings[position + 1]
+                position += 2
+                sections = []
+                for _ in range(next(counts)):
+                    item_count = next(counts)
+                    items_start = position + 2
+                    sections.append(Section(id=strings[position], label=strings[position + 1],
+                                            items=strings[items_start:items_start + item_count]))
+                    position = items_start + item_count
+                title2_nodes.append(Title2(id=title2_id, label=title2_label, children=sections))
+            nodes.append(Title1(id=title1_id, label=title1_label, children=title2_nodes))
+        ChecklistParser.assign_item_indices(nodes)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return nodes
+
+
+def compile_skeletons(nodes: ChecklistTree) -> bytes:
+    """Compile lazily loaded title1 skeletons into the skeleton cache payload.
+
+    Ids, labels, counts, digests and byte ranges go into a JSON index; the
+    item-key hashes of all title1 nodes follow as one array.
+    """
+    index = {
+        "title1": [[title1.id, title1.label, title1.title2_count, title1.section_count,
+                    title1.item_count, title1.items_digest, *title1.byte_range]
+                   for title1 in nodes],
+        "duplicate_ids": sorted(nodes.duplicate_ids)
+    }
+    index_bytes = json.dumps(index, ensure_ascii=False).encode('utf-8')
+    hashes = array('Q')
+    for title1 in nodes:
+        hashes.extend(title1.item_hashes)
+    return SKELETON_HEADER.pack(len(index_bytes)) + index_bytes + hashes.tobytes()
+
+
+def load_skeletons(payload: bytes, file_path: str, stat: os.stat_result) -> List[Title1]:
+    """Rebuild LazyTitle1 skeletons of file_path from a compile_skeletons() payload"""
+    index_size, = SKELETON_HEADER.unpack_from(payload)
+    index_end = SKELETON_HEADER.size + index_size
+    index = json.loads(payload[SKELETON_HEADER.size:index_end].decode('utf-8'))
+    hashes = array('Q')
+    hashes.frombytes(payload[index_end:])
+
+    nodes = []
+    position = 0
+    for (title1_id, label, title2_count, section_count, item_count, items_digest,
+         start, end) in index["title1"]:
+        nodes.append(ChecklistParser.create_lazy_title1(
+            file_path, stat, (start, end), id=title1_id, label=label,
+            title2_count=title2_count, section_count=section_count, item_count=item_count,
+            items_digest=items_digest, item_hashes=hashes[position:position + item_count]))
+        position += item_count
+    if position != len(hashes):
+        raise ValueError("item hash count does not match the skeleton index")
+    ChecklistParser.assign_item_indices(nodes)
+    return ChecklistTree(nodes, duplicate_ids=set(index["duplicate_ids"]))
+
+
+def _read_cache(cache_path: str, stat: os.stat_result, file_path: str,
+                load: Callable[[bytes], List[Title1]] = load_compiled_nodes,
+                magic: bytes = CACHE_MAGIC) -> Optional[List[Title1]]:
+    """Load nodes from the cache if it matches the source file"""
+    try:
+        with open(cache_path, 'rb') as f:
+            header = f.read(CACHE_HEADER.size)
+            if len(header) != CACHE_HEADER.size:
+                return None
+            cache_magic, version, size, mtime_ns, sha256 = CACHE_HEADER.unpack(header)
+            if cache_magic != magic or version != CACHE_VERSION or size != stat.st_size:
+                return None
+            # Same size and mtime: trust the cache without reading the source.
+            # Otherwise (e.g. files re-extracted by PyInstaller) compare contents.
+            if mtime_ns != stat.st_mtime_ns and sha256 != _file_hash(file_path):
+                return None
+            nodes = load(f.read())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"[WARN] Ignoring unreadable checklist cache {cache_path}: {e}")
+        return None
+
+    if mtime_ns != stat.st_mtime_ns:
+        # Same content under a new mtime: record it, so the next launch skips hashing
+        try:
+            with open(cache_path, 'r+b') as f:
+                f.write(CACHE_HEADER.pack(magic, CACHE_VERSION, stat.st_size, stat.st_mtime_ns, sha256))
+        except OSError as e:
+            print(f"[WARN] Could not update checklist cache {cache_path}: {e}")
+    return nodes
+
+
+def _write_cache(cache_path: str, stat: os.stat_result, file_path: str, payload: Optional[bytes],
+                 magic: bytes = CACHE_MAGIC):
+    if payload is None:
+        return
+    header = CACHE_HEADER.pack(magic, CACHE_VERSION, stat.st_size, stat.st_mtime_ns,
+                               _file_hash(file_path))
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    write_file_atomic(cache_path, header + payload, fsync=False)
+
+
+def load_checklist(file_path: str, cache_dir: Optional[str] = None, lazy: bool = False) -> List[Title1]:
+    """Load a checklist through its compiled cache.
+
+    A cache hit skips JSON parsing and the recursive node factory: the tree
+    is rebuilt from the compiled payload (see compile_nodes). A missing or
+    stale cache is rebuilt from the JSON file. With lazy=True title1
+    subtrees are parsed on first access instead; their skeletons are cached
+    (see compile_skeletons), so only a changed file is scanned.
+    """
+    if lazy:
+        return _load_lazy(file_path, cache_dir)
+
+    stat = os.stat(file_path)
+    cache_path = get_cache_path(file_path, cache_dir)
+
+    nodes = _read_cache(cache_path, stat, file_path)
+    if nodes is not None:
+        return nodes
+
+    nodes = ChecklistParser.load_from_file(file_path)
+    try:
+        _write_cache(cache_path, stat, file_path, compile_nodes(nodes))
+    except Exception as e:
+        print(f"[WARN] Could not write checklist cache {cache_path}: {e}")
+    return nodes
+
+
+def _load_lazy(file_path: str, cache_dir: Optional[str]) -> List[Title1]:
+    """Load LazyTitle1 skeletons through the skeleton cache"""
+    stat = os.stat(file_path)
+    cache_path = get_cache_path(file_path, cache_dir, extension=".skeleton")
+
+    def load(payload: bytes) -> List[Title1]:
+        return load_skeletons(payload, file_path, stat)
+
+    nodes = _read_cache(cache_path, stat, file_path, load, SKELETON_MAGIC)
+    if nodes is not None:
+        return nodes
+
+    nodes = ChecklistParser.load_lazy(file_path)
+    try:
+        _write_cache(cache_path, stat, file_path, compile_skeletons(nodes), SKELETON_MAGIC)
+    except Exception as e:
+        print(f"[WARN] Could not write checklist skeleton cache {cache_path}: {e}")
+    return nodes
@@ -0,0 +1,58 @@
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from models import ChecklistIndex
+
+
+@dataclass(frozen=True)
+class ConversionPayload:
+    """What a report conversion needs from the checklist state, as a snapshot.
+
+    sections holds every checklist section in document order with its
+    checked items in checklist order, so the converter never has to look
+    keys up in the state. The payload is immutable and picklable; build it
+    on the UI thread and hand it to a worker thread or process as is.
+    """
+    company_name: str
+    # (section id, checked items) for every section, in document order
+    sections: Tuple[Tuple[str, Tuple[str, ...]], ...]
+    _checked: Dict[str, Tuple[str, ...]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_checked", dict(self.sections))
+
+    @classmethod
+    def from_state_manager(cls, state_manager, title1_nodes: List,
+                           company_name: Optional[str] = None) -> "ConversionPayload":
+        """Snapshot the checked items of a StateManager in one pass over the checklist"""
+        is_checked = state_manager.is_item_checked
+        sections = tuple(
+            (section.id, tuple(item for item in section.items if is_checked(section.id, item)))
+            for section in ChecklistIndex.of(title1_nodes).sections)
+        if company_name is None:
+            company_name = state_manager.company_name
+        return cls(company_name, sections)
+
+    @classmethod
+    def from_checked_keys(cls, checked_keys: Iterable[str], title1_nodes: List,
+                          company_name: str) -> "ConversionPayload":
+        """Build from "section_id::item_text" keys (the state file's checked_items)"""
+        checked_keys = set(checked_keys)
+        sections = tuple(
+            (section.id, tuple(item for item in section.items
+                               if f"{section.id}::{item}" in checked_keys))
+            for section in ChecklistIndex.of(title1_nodes).sections)
+        return cls(company_name, sections)
+
+    @property
+    def section_ids(self) -> List[str]:
+        """All section ids in document order"""
+        return [section_id for section_id, _ in self.sections]
+
+    @property
+    def checked_count(self) -> int:
+        return sum(len(items) for _, items in self.sections)
+
+    def checked_items(self, section_id: str) -> Tuple[str, ...]:
+        """Checked items of a section in checklist order; empty for unknown sections"""
+        return self._checked.get(section_id, ())
@@ -0,0 +1,271 @@
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Protocol
+
+# Seconds to wait for an opened document to answer field calls, and how often to ask
+READY_TIMEOUT = 30.0
+READY_POLL_INTERVAL = 0.05
+
+
+def wait_until(condition: Callable[[], bool], timeout: float,
+               interval: float = READY_POLL_INTERVAL) -> float:
+    """Poll condition until it holds; returns the seconds waited.
+
+    Raises TimeoutError when it still doesn't hold after timeout seconds.
+    """
+    start = time.perf_counter()
+    deadline = start + timeout
+    while not condition():
+        if time.perf_counter() >= deadline:
+            raise TimeoutError(f"Not ready after {timeout:.1f}s")
+        time.sleep(interval)
+    return time.perf_counter() - start
+
+
+@dataclass
+class FieldInventory:
+    """Fields of a template: distinct names in document order and how often each occurs"""
+    names: List[str] = field(default_factory=list)
+    counts: Dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def from_occurrences(cls, occurrences: Iterable[str]) -> "FieldInventory":
+        """Build from every field occurrence in document order (see list_fields)"""
+        counts: Dict[str, int] = {}
+        for name in occurrences:
+            counts[name] = counts.get(name, 0) + 1
+        return cls(list(counts), counts)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.counts
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def position(self, name: str) -> Optional[int]:
+        """Order of the name's first occurrence in the document"""
+        return self.names.index(name) if name in self.counts else None
+
+
+class DocumentBackend(Protocol):
+    """Document operations the report conversion needs.
+
+    Field text is written either whole (put_field_text) or at the cursor
+    after move_to_field (insert_text / insert_paragraph).
+    """
+
+    # Seconds the last open() spent waiting for the document to become ready
+    ready_wait: float
+
+    def open(self, file_path: str) -> None:
+        """Open a template; it replaces any open document.
+
+        Returns once the document answers field calls.
+        """
+
+    def list_fields(self) -> List[str]:
+        """Name of every field in the open document, in document order.
+
+        A name occurs once per field that has it.
+        """
+
+    def move_to_field(self, name: str) -> bool:
+        """Put the cursor into a field; False if the document has no such field"""
+
+    def put_field_text(self, name: str, text: str) -> None:
+        """Replace a field's text"""
+
+    def put_field_texts(self, texts: Dict[str, str]) -> None:
+        """Replace the text of several fields at once; newlines start new paragraphs"""
+
+    def insert_text(self, text: str) -> None:
+        """Insert text at the cursor"""
+
+    def insert_paragraph(self) -> None:
+        """Start a new paragraph at the cursor"""
+
+    def set_visible(self, visible: bool) -> None:
+        """Show or hide the document window, if there is one"""
+
+    def save_as(self, file_path: str) -> None:
+        """Save the open document under a new path"""
+
+    def save(self) -> None:
+        """Save the open document in place"""
+
+
+class ComDocumentBackend:
+    """DocumentBackend over an HWP automation object (see hwp_session)"""
+
+    # GetFieldList separates field names with this character
+    FIELD_SEPARATOR = "\x02"
+
+    def __init__(self, hwp, ready_timeout: float = READY_TIMEOUT,
+                 poll_interval: float = READY_POLL_INTERVAL):
+        self.hwp = hwp
+        self.ready_timeout = ready_timeout
+        self.poll_interval = poll_interval
+        self.ready_wait = 0.0
+
+    def open(self, file_path: str) -> None:
+        if self.hwp.Open(file_path) is False:
+            raise RuntimeError(f"HWP could not open {file_path}")
+        # 고정 대기 대신 문서가 열리고 필드 목록을 조회할 수 있을 때까지 확인
+        expected_path = self._normalize_path(file_path)
+        try:
+            self.ready_wait = wait_until(lambda: self._is_ready(expected_path),
+                                         self.ready_timeout, self.poll_interval)
+        except TimeoutError:
+            raise TimeoutError(f"HWP document was not ready after {self.ready_timeout:.1f}s: "
+                               f"{file_path}") from None
+
+    @staticmethod
+    def _normalize_path(file_path: str) -> str:
+        return os.path.normcase(os.path.abspath(file_path))
+
+    def _is_ready(self, expected_path: str) -> bool:
+        """Whether the opened file is the active document and answers field calls"""
+        try:
+            # HWP은 항상 빈 문서를 열어 두므로 문서 수가 아니라 활성 문서의 경로를 확인
+            path = self.hwp.Path
+            if not path or self._normalize_path(path) != expected_path:
+                return False
+            return self.hwp.GetFieldList(0, 0) is not None
+        except Exception:
+            # 문서를 불러오는 중에는 호출이 실패할 수 있음
+            return False
+
+    def list_fields(self) -> List[str]:
+        # 필드 목록을 한 번의 호출로 가져옴 (번호 없이, 같은 이름도 모두 나열)
+        field_list = self.hwp.GetFieldList(0, 0) or ""
+        return [name for name in field_list.split(self.FIELD_SEPARATOR) if name]
+
+    def move_to_field(self, name: str) -> bool:
+        return bool(self.hwp.MoveToField(name))
+
+    def put_field_text(self, name: str, text: str) -> None:
+        self.hwp.PutFieldText(name, text)
+
+    def put_field_texts(self, texts: Dict[str, str]) -> None:
+        if not texts:
+            return
+        # 필드 이름과 내용을 \x02로 이어 한 번의 호출로 입력 (문단 구분은 \r\n)
+        names = self.FIELD_SEPARATOR.join(texts)
+        values = self.FIELD_SEPARATOR.join(text.replace("\n", "\r\n") for text in texts.values())
+        self.hwp.PutFieldText(names, values)
+
+    def insert_text(self, text: str) -> None:
+        hwp = self.hwp
+        hwp.HAction.GetDefault("InsertText", hwp.HParameterSet.HInsertText.HSet)
+        hwp.HParameterSet.HInsertText.Text = text
+        hwp.HAction.Execute("InsertText", hwp.HParameterSet.HInsertText.HSet)
+
+    def insert_paragraph(self) -> None:
+        self.hwp.HAction.Run("BreakPara")  # Enter 키 입력
+
+    def set_visible(self, visible: bool) -> None:
+        self.hwp.XHwpWindows.Item(0).Visible = visible
+
+    def save_as(self, file_path: str) -> None:
+        self.hwp.SaveAs(file_path)
+
+    def save(self) -> None:
+        self.hwp.Save()
+
+
+class InMemoryDocumentBackend:
+    """DocumentBackend that keeps field texts in a dict.
+
+    Stands in for the word processor in tests and benchmarks. Every call
+    is counted in `calls` and, with call_latency, sleeps like a COM round
+    trip would. Saved documents are recorded in `saved` (path -> field
+    texts) and nothing is written to disk. Templates opened get the field
+    names given for their path in `templates`, or `fields` otherwise.
+    """
+
+    def __init__(self, fields: Iterable[str] = (), call_latency: float = 0.0,
+                 templates: Optional[Dict[str, Iterable[str]]] = None):
+        self.fields = list(fields)
+        self.call_latency = call_latency
+        self.templates = {os.path.abspath(path): list(names) for path, names in (templates or {}).items()}
+        self.calls: Dict[str, int] = {}
+        self.saved: Dict[str, Dict[str, str]] = {}
+        self.visible = False
+        self.ready_wait = 0.0
+
+        self.file_path: Optional[str] = None
+        self.field_texts: Dict[str, str] = {}
+        self.current_field: Optional[str] = None
+
+    def _call(self, operation: str):
+        self.calls[operation] = self.calls.get(operation, 0) + 1
+        if self.call_latency:
+            time.sleep(self.call_latency)
+
+    def _require_document(self):
+        if self.file_path is None:
+            raise RuntimeError("No document is open")
+
+    def open(self, file_path: str) -> None:
+        self._call("open")
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(file_path)
+        self.file_path = file_path
+        names = self.templates.get(os.path.abspath(file_path), self.fields)
+        self.field_texts = {name: "" for name in names}
+        self.current_field = None
+
+    def list_fields(self) -> List[str]:
+        self._call("list_fields")
+        return list(self.field_texts)
+
+    def move_to_field(self, name: str) -> bool:
+        self._call("move_to_field")
+        if name not in self.field_texts:
+            return False
+        self.current_field = name
+        return True
+
+    def put_field_text(self, name: str, text: str) -> None:
+        self._call("put_field_text")
+        if name in self.field_texts:
+            self.field_texts[name] = text
+
+    def put_field_texts(self, texts: Dict[str, str]) -> None:
+        self._call("put_field_texts")
+        for name, text in texts.items():
+            if name in self.field_texts:
+                self.field_texts[name] = text
+
+    def insert_text(self, text: str) -> None:
+        self._call("insert_text")
+        self._require_document()
+        if self.current_field is not None:
+            self.field_texts[self.current_field] += text
+
+    def insert_paragraph(self) -> None:
+        self._call("insert_paragraph")
+        self._require_document()
+        if self.current_field is not None:
+            self.field_texts[self.current_field] += "\n"
+
+    def set_visible(self, visible: bool) -> None:
+        self._call("set_visible")
+        self.visible = visible
+
+    def save_as(self, file_path: str) -> None:
+        self._call("save_as")
+        self._require_document()
+        self.saved[file_path] = dict(self.field_texts)
+
+    def save(self) -> None:
+        self._call("save")
+        self._require_document()
+        self.saved[self.file_path] = dict(self.field_texts)
+
+    def close(self) -> None:
+        """Drop the open document (what HwpSession's reset does for COM)"""
+        self.file_path = None
+        self.field_texts = {}
+        self.current_field = None
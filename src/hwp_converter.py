@@ -1,213 +1,310 @@
-import win32com.client as win32
+try:
+    import win32com.client as win32
+except ImportError:
+    # Windows + 한글(HWP)이 없는 환경 (텍스트 출력 배치 등)
+    win32 = None
 import os
 import time
-from typing import Dict, List, Tuple, Optional
+from contextlib import contextmanager
+from typing import Dict, List, Tuple, Optional, Union
 from datetime import datetime
 
+from models import ChecklistIndex, Title1, Title2
+from hwp_session import HwpSessionPool, get_default_pool
+from document_backend import DocumentBackend, ComDocumentBackend, FieldInventory, READY_TIMEOUT
+from hwpx_backend import HwpxDocumentBackend, is_hwpx_file
+from template_cache import TemplateInventoryCache, TemplatePlan
+from conversion_payload import ConversionPayload
+
+# 체크리스트 섹션이 아닌, 변환기가 직접 채우는 필드
+REPORT_FIELDS = ("company_name", "report_date")
+
 
 class HWPConverter:
     """HWP 파일 변환 및 필드 매핑 처리"""
 
-    def __init__(self):
-        self.hwp = None
+    def __init__(self, pool: Optional[HwpSessionPool] = None,
+                 document: Optional[DocumentBackend] = None,
+                 template_cache: Optional[TemplateInventoryCache] = None,
+                 bulk_fill: bool = True, ready_timeout: float = READY_TIMEOUT):
+        self.document = document
+        # 템플릿을 연 뒤 문서가 준비될 때까지 기다릴 최대 시간(초)
+        self.ready_timeout = ready_timeout
+        # 마지막 작업의 단계별 소요 시간(초): session, open, ready_wait, ...
+        self.timings: Dict[str, float] = {}
+        # 필드 내용을 한 번에 입력 (False면 필드로 이동해 항목별로 삽입)
+        self.bulk_fill = bulk_fill
+        # 알려진 템플릿은 문서를 열지 않고 필드 목록/변환 계획을 재사용
+        self.template_cache = template_cache
         self.hwp_file_path = ""
         self.output_path = ""
+        # 한글 인스턴스는 작업마다 새로 띄우지 않고 세션 풀에서 재사용
+        self.pool = pool or get_default_pool()
+
+    def _run(self, job, hwp_file_path: str):
+        """문서 백엔드로 작업 실행.
+
+        지정된 백엔드가 없으면 HWPX는 파일을 직접 편집하고,
+        HWP는 한글 세션 풀에서 자동화로 처리.
+        단계별 소요 시간은 self.timings에 기록
+        """
+        self.timings = {}
+        start = time.perf_counter()
+
+        def timed_job(document: DocumentBackend):
+            # 세션 대기/한글 실행에 걸린 시간
+            self.timings["session"] = time.perf_counter() - start
+            try:
+                return job(document)
+            finally:
+                self.timings["total"] = time.perf_counter() - start
+
+        if self.document is not None:
+            return timed_job(self.document)
+        if is_hwpx_file(hwp_file_path):
+            return timed_job(HwpxDocumentBackend())
+        return self.pool.run(lambda hwp: timed_job(ComDocumentBackend(hwp, self.ready_timeout)))
+
+    def _open(self, document: DocumentBackend, hwp_file_path: str):
+        """템플릿을 열고 문서가 준비될 때까지 기다린 시간을 기록"""
+        with self._timed("open"):
+            document.open(hwp_file_path)
+        self.timings["ready_wait"] = document.ready_wait
+
+    @contextmanager
+    def _timed(self, stage: str):
+        """with 블록의 소요 시간을 timings[stage]에 기록"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[stage] = time.perf_counter() - start
+
+    def format_timings(self) -> str:
+        """마지막 작업의 단계별 소요 시간 (예: "open 0.21s, ready_wait 0.05s, ...")"""
+        return ", ".join(f"{stage} {seconds:.2f}s" for stage, seconds in self.timings.items())
 
     def detect_hwp_fields(self, hwp_file_path: str) -> List[str]:
-        """HWP 파일의 모든 필드를 감지하여 리스트로 반환"""
-        fields = []
-        hwp = None
-        
+        """HWP 파일의 모든 필드를 감지하여 문서 순서의 리스트로 반환"""
         try:
-            hwp = win32.gencache.EnsureDispatch("HWPFrame.HwpObject")
-            hwp.XHwpWindows.Item(0).Visible = False  # 화면에 표시하지 않음
-            
-            try:
-                hwp.RegisterModule("FilePathCheckDLL", "FilePathCheckerModule")
-            except:
-                pass
-
-            if not os.path.exists(hwp_file_path):
-                raise FileNotFoundError(f"HWP 파일을 찾을 수 없습니다: {hwp_file_path}")
-
-            hwp.Open(hwp_file_path)
-            time.sleep(0.5)
-
-            # HWP에서 필드 목록을 가져오는 방법
-            # 일반적으로 사용되는 필드명들을 체크
-            common_field_names = [
-                # checklist.json의 id들과 매칭 가능한 필드명들
-                "summary", "please_do_this", "current_status_of_company",
-                "please_do_this_manager", "please_do_this_worker",
-                "current_status_of_company_strengths", "current_status_of_company_improvements",
-                "risk_assessment", "pre_preparation", "identify_factors", 
-                "implement_countermeasures", "share_results",
-                "pre_preparation_issues_and_improvements", "pre_preparation_consulting_contents",
-                "identify_factors_issues_and_improvements", "identify_factors_consulting_contents",
-                "implement_countermeasures_issues_and_improvements", "implement_countermeasures_consulting_contents",
-                "share_results_issues_and_improvements", "share_results_consulting_contents",
-                # 기타 가능한 필드들
-                "company_name", "report_date", "consultant_name"
-            ]
-
-            for field_name in common_field_names:
-                if hwp.MoveToField(field_name):
-                    fields.append(field_name)
-                    print(f"✓ 필드 발견: {field_name}")
-
-            return fields
+            return self.read_field_inventory(hwp_file_path).names
 
         except Exception as e:
             print(f"[오류] HWP 필드 감지 실패: {e}")
             return []
 
-        finally:
-            if hwp:
-                try:
-                    hwp.Quit()
-                except:
-                    pass
+    def read_field_inventory(self, hwp_file_path: str) -> FieldInventory:
+        """템플릿의 실제 필드 목록(이름, 문서 순서, 개수)을 한 번에 읽음"""
+        content_hash = None
+        if self.template_cache is not None and os.path.exists(hwp_file_path):
+            content_hash = self.template_cache.content_hash(hwp_file_path)
+            inventory = self.template_cache.lookup(hwp_file_path, content_hash)
+            if inventory is not None:
+                return inventory
+
+        inventory = self._run(lambda document: self._read_field_inventory(document, hwp_file_path),
+                              hwp_file_path)
+        if self.template_cache is not None:
+            self.template_cache.store(hwp_file_path, inventory, content_hash)
+        return inventory
+
+    def compile_template(self, hwp_file_path: str, section_ids: List[str]) -> TemplatePlan:
+        """템플릿 변환 계획 생성 (필드 목록을 아는 템플릿은 열지 않음).
+
+        같은 템플릿으로 여러 회사를 변환할 때는 계획대로만 필드를 채우므로
+        문서에 어떤 필드가 있는지 다시 확인하지 않음
+        """
+        if self.template_cache is not None:
+            plan = self.template_cache.get_plan(hwp_file_path, section_ids, REPORT_FIELDS)
+            if plan is not None:
+                return plan
+        inventory = self.read_field_inventory(hwp_file_path)
+        if self.template_cache is not None:
+            return self.template_cache.get_plan(hwp_file_path, section_ids, REPORT_FIELDS)
+        return TemplatePlan.compile(inventory, section_ids, REPORT_FIELDS)
+
+    def _read_field_inventory(self, document: DocumentBackend, hwp_file_path: str) -> FieldInventory:
+        if not os.path.exists(hwp_file_path):
+            raise FileNotFoundError(f"HWP 파일을 찾을 수 없습니다: {hwp_file_path}")
+
+        self._open(document, hwp_file_path)
+        with self._timed("list_fields"):
+            inventory = FieldInventory.from_occurrences(document.list_fields())
+        print(f"✓ 필드 {len(inventory)}개 발견: {', '.join(inventory.names)}")
+        return inventory
 
     def validate_field_mapping(self, hwp_file_path: str, checklist_ids: List[str]) -> Dict[str, bool]:
-        """체크리스트 ID와 HWP 필드 매핑 검증"""
-        hwp_fields = self.detect_hwp_fields(hwp_file_path)
-        mapping_result = {}
+        """체크리스트 ID(get_all_section_ids)와 HWP 필드 매핑 검증"""
+        try:
+            inventory = self.read_field_inventory(hwp_file_path)
+        except Exception as e:
+            print(f"[오류] HWP 필드 감지 실패: {e}")
+            inventory = FieldInventory()
+
+        template_fields = inventory.counts.keys()
+        matched = template_fields & set(checklist_ids)
+        missing = set(checklist_ids) - matched
+        unused = template_fields - matched - set(REPORT_FIELDS)
 
         print("\n=== 필드 매핑 검증 ===")
-        for checklist_id in checklist_ids:
-            if checklist_id in hwp_fields:
-                mapping_result[checklist_id] = True
-                print(f"✓ {checklist_id} → HWP 필드 매칭됨")
-            else:
-                mapping_result[checklist_id] = False
-                print(f"✗ {checklist_id} → HWP 필드 없음")
+        print(f"✓ 매칭된 필드: {len(matched)}/{len(set(checklist_ids))}")
+        if missing:
+            print(f"✗ HWP 필드 없음: {', '.join(sorted(missing))}")
+        if unused:
+            print(f"- 체크리스트에 없는 필드: {', '.join(sorted(unused))}")
 
-        return mapping_result
+        return {checklist_id: checklist_id in matched for checklist_id in checklist_ids}
 
     def convert_checklist_to_hwp(self, hwp_file_path: str, company_name: str, 
-                                checked_items: Dict[str, List[str]], 
+                                checked_items: Union[ConversionPayload, Dict[str, List[str]]],
                                 title1_nodes: List) -> Tuple[bool, str]:
-        """체크리스트 내용을 HWP 파일로 변환"""
-        self.hwp = None
-        
+        """체크리스트 내용을 HWP 파일로 변환.
+
+        checked_items는 ConversionPayload 또는 {'checked_items': [키, ...]} 형식
+        """
+        if not os.path.exists(hwp_file_path):
+            return False, f"HWP 파일을 찾을 수 없습니다: {hwp_file_path}"
+
         try:
-            self.hwp = win32.gencache.EnsureDispatch("HWPFrame.HwpObject")
-            self.hwp.XHwpWindows.Item(0).Visible = True  # 변환 중 표시
-            
-            try:
-                self.hwp.RegisterModule("FilePathCheckDLL", "FilePathCheckerModule")
-            except:
-                pass
-
-            if not os.path.exists(hwp_file_path):
-                return False, f"HWP 파일을 찾을 수 없습니다: {hwp_file_path}"
-
-            # HWP 파일 열기
-            self.hwp.Open(hwp_file_path)
-            time.sleep(1)
-
-            # 회사명 입력
-            if self.hwp.MoveToField("company_name"):
-                self.hwp.PutFieldText("company_name", company_name)
-                print(f"✓ 회사명 입력: {company_name}")
-
-            # 보고서 생성 날짜 입력
-            if self.hwp.MoveToField("report_date"):
-                current_date = datetime.now().strftime("%Y년 %m월 %d일")
-                self.hwp.PutFieldText("report_date", current_date)
-                print(f"✓ 보고서 날짜 입력: {current_date}")
-
-            # 체크리스트 내용을 HWP 필드에 매핑
-            success_count = 0
-            total_fields = 0
-
-            for title1 in title1_nodes:
-                for title2 in title1.get_title2_children():
-                    for section in title2.get_sections():
-                        total_fields += 1
-                        
-                        # 해당 섹션의 체크된 항목들 수집
-                        section_checked_items = []
-                        for item in section.items:
-                            item_key = f"{section.id}::{item}"
-                            if item_key in checked_items.get('checked_items', []):
-                                section_checked_items.append(item)
-
-                        # HWP 필드에 내용 입력 (각 항목을 개별적으로 삽입하여 줄바꿈 보장)
-                        if self.hwp.MoveToField(section.id):
-                            # 필드 내용 초기화
-                            self.hwp.PutFieldText(section.id, "")
-
-                            if section_checked_items:
-                                # 필드로 다시 이동하여 텍스트 삽입
-                                self.hwp.MoveToField(section.id)
-
-                                # 각 항목을 삽입하고 줄바꿈 추가
-                                for idx, item in enumerate(section_checked_items):
-                                    self.hwp.HAction.GetDefault("InsertText", self.hwp.HParameterSet.HInsertText.HSet)
-                                    self.hwp.HParameterSet.HInsertText.Text = f"- {item}"
-                                    self.hwp.HAction.Execute("InsertText", self.hwp.HParameterSet.HInsertText.HSet)
-
-                                    # 마지막 항목이 아니면 줄바꿈 추가
-                                    if idx < len(section_checked_items) - 1:
-                                        self.hwp.HAction.Run("BreakPara")  # Enter 키 입력 (한 번만)
-
-                                success_count += 1
-                                print(f"✓ {section.id} 필드 업데이트 완료 ({len(section_checked_items)}개 항목)")
-                            else:
-                                # 체크된 항목이 없을 때
-                                self.hwp.PutFieldText(section.id, "(체크된 항목 없음)")
-                                success_count += 1
-
-            # 출력 파일명 생성
-            base_name = os.path.splitext(os.path.basename(hwp_file_path))[0]
-            output_dir = os.path.dirname(hwp_file_path)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            self.output_path = os.path.join(output_dir, f"{base_name}_{company_name}_{timestamp}.hwp")
-
-            # 파일 저장
-            try:
-                self.hwp.SaveAs(self.output_path)
-                message = f"성공적으로 변환되었습니다!\n\n" \
-                         f"변환된 필드: {success_count}/{total_fields}\n" \
-                         f"저장 위치: {self.output_path}"
-                return True, message
-
-            except Exception as save_error:
-                self.hwp.Save()  # 원본에 저장
-                message = f"변환 완료 (원본 파일에 저장됨)\n\n" \
-                         f"변환된 필드: {success_count}/{total_fields}\n" \
-                         f"저장 실패 오류: {save_error}"
-                return True, message
+            if isinstance(checked_items, ConversionPayload):
+                payload = checked_items
+            else:
+                payload = ConversionPayload.from_checked_keys(
+                    checked_items.get('checked_items', []), title1_nodes, company_name)
+            # 컴파일된 계획이 있으면 템플릿을 다시 조사하지 않음
+            plan = None
+            if self.template_cache is not None:
+                plan = self.template_cache.get_plan(hwp_file_path, payload.section_ids, REPORT_FIELDS)
+            result = self._run(lambda document: self._fill_report(
+                document, hwp_file_path, company_name, payload, plan),
+                hwp_file_path)
+            print(f"✓ 변환 소요 시간: {self.format_timings()}")
+            return result
 
         except Exception as e:
             error_message = f"HWP 변환 중 오류가 발생했습니다:\n{str(e)}"
             return False, error_message
 
-        finally:
-            if self.hwp:
-                try:
-                    self.hwp.Quit()
-                except:
-                    pass
+    def _fill_report(self, document: DocumentBackend, hwp_file_path: str, company_name: str,
+                     payload: ConversionPayload, plan: Optional[TemplatePlan]) -> Tuple[bool, str]:
+        """문서 백엔드로 템플릿을 열어 필드를 채우고 저장"""
+        document.set_visible(True)  # 변환 중 표시
+
+        # HWP 파일 열기 (문서가 준비될 때까지 대기)
+        self._open(document, hwp_file_path)
+
+        # 계획이 없으면 연 문서의 필드 목록으로 컴파일 (캐시가 있으면 저장)
+        if plan is None:
+            with self._timed("compile"):
+                plan = self._compile_open_template(document, hwp_file_path, payload.section_ids)
+
+        # 체크리스트 내용을 HWP 필드에 매핑
+        with self._timed("fill"):
+            if self.bulk_fill:
+                self._fill_fields_bulk(document, company_name, payload, plan)
+            else:
+                self._fill_fields_per_item(document, company_name, payload, plan)
+        success_count, total_fields = len(plan.section_fields), plan.section_count
+
+        # 출력 파일명 생성 (확장자는 템플릿과 같게: .hwp / .hwpx)
+        base_name, extension = os.path.splitext(os.path.basename(hwp_file_path))
+        output_dir = os.path.dirname(hwp_file_path)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.output_path = os.path.join(output_dir, f"{base_name}_{company_name}_{timestamp}{extension}")
+
+        # 파일 저장
+        try:
+            with self._timed("save"):
+                document.save_as(self.output_path)
+            message = f"성공적으로 변환되었습니다!\n\n" \
+                     f"변환된 필드: {success_count}/{total_fields}\n" \
+                     f"저장 위치: {self.output_path}"
+            return True, message
+
+        except Exception as save_error:
+            if is_hwpx_file(hwp_file_path):
+                # HWPX의 save()는 템플릿 파일을 덮어쓰므로 원본에 저장하지 않음
+                return False, f"변환 결과를 저장하지 못했습니다 (템플릿은 변경하지 않음):\n{save_error}"
+            with self._timed("save"):
+                document.save()  # 원본에 저장
+            message = f"변환 완료 (원본 파일에 저장됨)\n\n" \
+                     f"변환된 필드: {success_count}/{total_fields}\n" \
+                     f"저장 실패 오류: {save_error}"
+            return True, message
+
+    def _compile_open_template(self, document: DocumentBackend, hwp_file_path: str,
+                               section_ids: List[str]) -> TemplatePlan:
+        inventory = FieldInventory.from_occurrences(document.list_fields())
+        if self.template_cache is None:
+            return TemplatePlan.compile(inventory, section_ids, REPORT_FIELDS)
+        content_hash = self.template_cache.content_hash(hwp_file_path)
+        self.template_cache.store(hwp_file_path, inventory, content_hash)
+        return self.template_cache.get_plan(hwp_file_path, section_ids, REPORT_FIELDS, content_hash)
+
+    def _field_text(self, name: str, company_name: str, payload: ConversionPayload) -> str:
+        """계획된 필드 하나에 들어갈 내용 (항목마다 한 문단)"""
+        if name == "company_name":
+            print(f"✓ 회사명 입력: {company_name}")
+            return company_name
+        if name == "report_date":
+            current_date = datetime.now().strftime("%Y년 %m월 %d일")
+            print(f"✓ 보고서 날짜 입력: {current_date}")
+            return current_date
+
+        section_checked_items = payload.checked_items(name)
+        if not section_checked_items:
+            # 체크된 항목이 없을 때
+            return "(체크된 항목 없음)"
+        print(f"✓ {name} 필드 업데이트 완료 ({len(section_checked_items)}개 항목)")
+        return "\n".join(f"- {item}" for item in section_checked_items)
+
+    def _fill_fields_per_item(self, document: DocumentBackend, company_name: str,
+                              payload: ConversionPayload, plan: TemplatePlan):
+        """필드마다 이동하여 항목을 하나씩 삽입 (호출 수가 많음)"""
+        for name in plan.fields:
+            if name in plan.fixed_fields or not payload.checked_items(name):
+                document.put_field_text(name, self._field_text(name, company_name, payload))
+                continue
+
+            # 필드 내용을 비우고 이동하여 각 항목을 개별적으로 삽입 (줄바꿈 보장)
+            document.put_field_text(name, "")
+            document.move_to_field(name)
+            section_checked_items = payload.checked_items(name)
+            for idx, item in enumerate(section_checked_items):
+                document.insert_text(f"- {item}")
+
+                # 마지막 항목이 아니면 줄바꿈 추가
+                if idx < len(section_checked_items) - 1:
+                    document.insert_paragraph()  # Enter 키 입력 (한 번만)
+            print(f"✓ {name} 필드 업데이트 완료 ({len(section_checked_items)}개 항목)")
+
+    def _fill_fields_bulk(self, document: DocumentBackend, company_name: str,
+                          payload: ConversionPayload, plan: TemplatePlan):
+        """계획된 모든 필드 내용을 미리 만들어 한 번의 호출로 입력.
+
+        항목마다 한 문단("- 항목")이 되는 것은 항목별 삽입과 같음
+        """
+        document.put_field_texts({name: self._field_text(name, company_name, payload)
+                                  for name in plan.fields})
 
     def get_all_section_ids(self, title1_nodes: List) -> List[str]:
         """모든 섹션 ID를 추출"""
-        section_ids = []
-        for title1 in title1_nodes:
-            for title2 in title1.get_title2_children():
-                for section in title2.get_sections():
-                    section_ids.append(section.id)
-        return section_ids
+        return ChecklistIndex.of(title1_nodes).get_section_ids()
 
 
 # HWP 변환 유틸리티 함수들
+def requires_hwp_program(hwp_file_path: str) -> bool:
+    """변환에 한글 프로그램이 필요한지 (HWPX는 직접 편집하므로 불필요)"""
+    return not is_hwpx_file(hwp_file_path)
+
+
 def check_hwp_available() -> bool:
     """한글(HWP) 프로그램이 설치되어 있는지 확인"""
+    if win32 is None:
+        return False
     try:
-        hwp = win32.gencache.EnsureDispatch("HWPFrame.HwpObject")
-        hwp.Quit()
-        return True
+        # 확인에 띄운 인스턴스는 이후 필드 감지/변환에서 그대로 재사용
+        return get_default_pool().run(lambda hwp: True)
     except:
         return False
 
@@ -216,21 +313,18 @@ def format_checklist_summary(title1_nodes: List, state_manager) -> str:
     """체크리스트 요약을 텍스트로 포맷팅"""
     summary_lines = []
     
-    for title1 in title1_nodes:
-        summary_lines.append(f"\n■ {title1.label}")
-        
-        for title2 in title1.get_title2_children():
-            summary_lines.append(f"\n  ▶ {title2.label}")
-            
-            for section in title2.get_sections():
-                checked_items = []
-                for item in section.items:
-                    if state_manager.is_item_checked(section.id, item):
-                        checked_items.append(item)
-                
-                if checked_items:
-                    summary_lines.append(f"\n    ● {section.label}")
-                    for item in checked_items:
-                        summary_lines.append(f"      - {item}")
+    # 문서 순서의 전체 노드 목록을 한 번에 순회
+    for node in ChecklistIndex.of(title1_nodes).nodes:
+        if isinstance(node, Title1):
+            summary_lines.append(f"\n■ {node.label}")
+        elif isinstance(node, Title2):
+            summary_lines.append(f"\n  ▶ {node.label}")
+        else:
+            checked_items = [item for item in node.items
+                             if state_manager.is_item_checked(node.id, item)]
+            if checked_items:
+                summary_lines.append(f"\n    ● {node.label}")
+                for item in checked_items:
+                    summary_lines.append(f"      - {item}")
     
     return "\n".join(summary_lines)
\ No newline at end of file
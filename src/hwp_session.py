@@ -0,0 +1,237 @@
+import atexit
+import queue
+import threading
+import weakref
+from concurrent.futures import Future
+from typing import Any, Callable, List, Optional
+
+
+class ComHwpBackend:
+    """Creates and manages HWP automation objects through win32com"""
+
+    PROG_ID = "HWPFrame.HwpObject"
+
+    def thread_started(self):
+        """Called on a session thread before it creates an instance"""
+        try:
+            import pythoncom
+        except ImportError:
+            # create() reports the missing win32com to the job
+            return
+        pythoncom.CoInitialize()
+
+    def thread_stopped(self):
+        try:
+            import pythoncom
+        except ImportError:
+            return
+        pythoncom.CoUninitialize()
+
+    def create(self):
+        import win32com.client as win32
+
+        hwp = win32.gencache.EnsureDispatch(self.PROG_ID)
+        hwp.XHwpWindows.Item(0).Visible = False  # 화면에 표시하지 않음
+        try:
+            hwp.RegisterModule("FilePathCheckDLL", "FilePathCheckerModule")
+        except Exception:
+            pass
+        return hwp
+
+    def is_alive(self, hwp) -> bool:
+        """Cheap round trip to the automation server"""
+        try:
+            hwp.XHwpDocuments.Count
+            return True
+        except Exception:
+            return False
+
+    def reset(self, hwp):
+        """Close the job's document without saving and hide the window again"""
+        hwp.Clear(1)
+        hwp.XHwpWindows.Item(0).Visible = False
+
+    def quit(self, hwp):
+        hwp.Quit()
+
+
+class HwpSession:
+    """One warm automation instance and the thread that owns it.
+
+    COM objects may only be used from the thread that created them, so
+    every job for this instance runs on the session thread. The instance is
+    created on the first job, health-checked before each job, reset after
+    each job and recycled after max_jobs jobs. When no job arrives for
+    idle_timeout seconds the instance is quit and the thread ends.
+    """
+
+    def __init__(self, backend, idle_timeout: float, max_jobs: int,
+                 retire: Callable[["HwpSession"], bool]):
+        self.backend = backend
+        self.idle_timeout = idle_timeout
+        self.max_jobs = max_jobs
+        self.hwp = None
+        # Jobs run on the current instance, and instances created so far
+        self.jobs_done = 0
+        self.instances_created = 0
+        # Jobs submitted and not finished yet
+        self.pending = 0
+        self._pending_lock = threading.Lock()
+
+        self._retire = retire
+        self._jobs: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="hwp-session")
+        self._thread.start()
+
+    def submit(self, job: Callable[[Any], Any]) -> Future:
+        future = Future()
+        with self._pending_lock:
+            self.pending += 1
+        self._jobs.put((job, future))
+        return future
+
+    def has_queued_jobs(self) -> bool:
+        return not self._jobs.empty()
+
+    def stop(self, wait: bool = True):
+        """Finish queued jobs, quit the instance and end the thread"""
+        self._jobs.put(None)
+        if wait and threading.current_thread() is not self._thread:
+            self._thread.join()
+
+    def _run(self):
+        self.backend.thread_started()
+        try:
+            while True:
+                try:
+                    entry = self._jobs.get(timeout=self.idle_timeout)
+                except queue.Empty:
+                    if self._retire(self):
+                        break
+                    continue
+                if entry is None:
+                    break
+                job, future = entry
+                if future.set_running_or_notify_cancel():
+                    try:
+                        result = job(self._checkout())
+                    except BaseException as e:
+                        future.set_exception(e)
+                    else:
+                        future.set_result(result)
+                    self._checkin()
+                with self._pending_lock:
+                    self.pending -= 1
+        finally:
+            self._discard()
+            self.backend.thread_stopped()
+
+    def _checkout(self):
+        """The instance for the next job, replacing a dead one"""
+        if self.hwp is not None and not self.backend.is_alive(self.hwp):
+            print("[WARN] HWP session did not respond, starting a new instance")
+            self._discard()
+        if self.hwp is None:
+            self.hwp = self.backend.create()
+            self.instances_created += 1
+            self.jobs_done = 0
+        return self.hwp
+
+    def _checkin(self):
+        if self.hwp is None:
+            return
+        self.jobs_done += 1
+        try:
+            self.backend.reset(self.hwp)
+        except Exception as e:
+            print(f"[WARN] HWP session reset failed, recycling it: {e}")
+            self._discard()
+            return
+        if self.jobs_done >= self.max_jobs:
+            self._discard()
+
+    def _discard(self):
+        if self.hwp is None:
+            return
+        try:
+            self.backend.quit(self.hwp)
+        except Exception:
+            pass
+        self.hwp = None
+
+
+class HwpSessionPool:
+    """Keeps HWP automation instances warm between jobs.
+
+    Starting the word processor costs seconds, so instead of creating and
+    quitting one per call, jobs are handed to up to `size` sessions (see
+    HwpSession). A job is a callable that gets the automation object; run()
+    waits for its result, submit() returns a Future.
+    """
+
+    def __init__(self, backend=None, size: int = 1, idle_timeout: float = 120.0,
+                 max_jobs: int = 20):
+        self.backend = backend or ComHwpBackend()
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self.max_jobs = max_jobs
+        self.sessions: List[HwpSession] = []
+        self._lock = threading.Lock()
+        self._closed = False
+        _pools.add(self)
+
+    def submit(self, job: Callable[[Any], Any]) -> Future:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("HWP session pool is closed")
+            idle = [session for session in self.sessions if session.pending == 0]
+            if idle:
+                session = idle[0]
+            elif len(self.sessions) < self.size:
+                session = HwpSession(self.backend, self.idle_timeout, self.max_jobs, self._retire)
+                self.sessions.append(session)
+            else:
+                session = min(self.sessions, key=lambda candidate: candidate.pending)
+            return session.submit(job)
+
+    def run(self, job: Callable[[Any], Any], timeout: Optional[float] = None):
+        """Run a job on a pooled instance and return its result"""
+        return self.submit(job).result(timeout)
+
+    def close(self):
+        """Finish queued jobs and quit all instances"""
+        with self._lock:
+            self._closed = True
+            sessions, self.sessions = self.sessions, []
+        for session in sessions:
+            session.stop()
+
+    def _retire(self, session: HwpSession) -> bool:
+        """Let an idle session end unless a job was queued in the meantime"""
+        with self._lock:
+            if session.has_queued_jobs():
+                return False
+            if session in self.sessions:
+                self.sessions.remove(session)
+            return True
+
+
+_pools = weakref.WeakSet()
+_default_pool: Optional[HwpSessionPool] = None
+_default_pool_lock = threading.Lock()
+
+
+def get_default_pool() -> HwpSessionPool:
+    """The application's shared pool of HWP automation instances"""
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = HwpSessionPool()
+        return _default_pool
+
+
+@atexit.register
+def _close_all():
+    """Don't leave hidden word processor instances running after exit"""
+    for pool in list(_pools):
+        pool.close()
@@ -0,0 +1,314 @@
+import os
+import re
+import tempfile
+import zipfile
+import xml.etree.ElementTree as ET
+from io import BytesIO
+from typing import Dict, List, Optional, Tuple
+
+# OWPML paragraph namespace (hp:p, hp:run, hp:t, hp:fieldBegin, ...)
+HP_NS = "http://www.hancom.co.kr/hwpml/2011/paragraph"
+PARAGRAPH = f"{{{HP_NS}}}p"
+RUN = f"{{{HP_NS}}}run"
+TEXT = f"{{{HP_NS}}}t"
+CTRL = f"{{{HP_NS}}}ctrl"
+FIELD_BEGIN = f"{{{HP_NS}}}fieldBegin"
+FIELD_END = f"{{{HP_NS}}}fieldEnd"
+# Cached line layout of a paragraph; dropped from edited paragraphs so it is recomputed
+LINE_SEGMENTS = f"{{{HP_NS}}}linesegarray"
+
+MIMETYPE_NAME = "mimetype"
+SECTION_NAME = re.compile(r"^Contents/section(\d+)\.xml$")
+
+
+def is_hwpx_file(file_path: str) -> bool:
+    return file_path.lower().endswith(".hwpx")
+
+
+class _HwpxField:
+    """One fieldBegin/fieldEnd pair in a section"""
+    __slots__ = ("name", "section", "begin_run", "begin_ctrl", "end_run", "end_ctrl")
+
+    def __init__(self, name, section, begin_run, begin_ctrl, end_run, end_ctrl):
+        self.name = name
+        self.section = section
+        self.begin_run = begin_run
+        self.begin_ctrl = begin_ctrl
+        self.end_run = end_run
+        self.end_ctrl = end_ctrl
+
+
+class HwpxDocumentBackend:
+    """DocumentBackend that edits HWPX packages directly, without the word processor.
+
+    An HWPX file is a zip of XML parts; body text lives in
+    Contents/section<N>.xml. Fields (click-here blocks) are the content
+    between an hp:fieldBegin with a name and the hp:fieldEnd referring to
+    it. Field writes are collected and applied to the XML when the document
+    is saved; each line of a field's text becomes its own paragraph. Writes
+    go to every field with the name. Saving streams the package to the
+    output path entry by entry, with the mimetype entry first and stored
+    uncompressed as the format requires.
+    """
+
+    def __init__(self):
+        self.file_path: Optional[str] = None
+        # (zip entry, raw bytes) in package order
+        self._entries: List[Tuple[zipfile.ZipInfo, bytes]] = []
+        # Parsed section parts by entry name, in document order
+        self._sections: Dict[str, ET.Element] = {}
+        self._parents: Dict[str, Dict[ET.Element, ET.Element]] = {}
+        self._fields: Dict[str, List[_HwpxField]] = {}
+        # Field names in document order, once per field
+        self._occurrences: List[str] = []
+        # Field texts written since the last save
+        self._values: Dict[str, str] = {}
+        self._modified_sections = set()
+        self.current_field: Optional[str] = None
+        # The package is parsed in open(), so there is nothing to wait for
+        self.ready_wait = 0.0
+
+    # DocumentBackend
+
+    def open(self, file_path: str) -> None:
+        with zipfile.ZipFile(file_path) as package:
+            self._entries = [(info, package.read(info)) for info in package.infolist()]
+
+        sections = sorted((int(match.group(1)), info.filename, data)
+                          for info, data in self._entries
+                          for match in [SECTION_NAME.match(info.filename)] if match)
+        self._sections = {name: self._parse(data) for _, name, data in sections}
+        self.file_path = file_path
+        self._values = {}
+        self._modified_sections = set()
+        self.current_field = None
+        self._index_fields()
+
+    def list_fields(self) -> List[str]:
+        return list(self._occurrences)
+
+    def move_to_field(self, name: str) -> bool:
+        if name not in self._fields:
+            return False
+        self.current_field = name
+        return True
+
+    def put_field_text(self, name: str, text: str) -> None:
+        if name in self._fields:
+            self._values[name] = text
+
+    def put_field_texts(self, texts: Dict[str, str]) -> None:
+        for name, text in texts.items():
+            self.put_field_text(name, text)
+
+    def insert_text(self, text: str) -> None:
+        if self.current_field is not None:
+            self._values[self.current_field] = self.get_field_text(self.current_field) + text
+
+    def insert_paragraph(self) -> None:
+        self.insert_text("\n")
+
+    def set_visible(self, visible: bool) -> None:
+        pass
+
+    def save_as(self, file_path: str) -> None:
+        self._apply_values()
+        self._write_package(file_path)
+
+    def save(self) -> None:
+        self.save_as(self.file_path)
+
+    # Field text
+
+    def get_field_text(self, name: str) -> str:
+        """Current text of the first field with the name; paragraphs are joined with newlines"""
+        if name in self._values:
+            return self._values[name]
+        field = self._fields[name][0]
+        lines = [""]
+        inside = False
+        paragraphs = self._field_paragraphs(field)
+        for paragraph in paragraphs:
+            if paragraph is not paragraphs[0]:
+                lines.append("")
+            for run in paragraph.findall(RUN):
+                for child in run:
+                    if child is field.begin_ctrl:
+                        inside = True
+                    elif child is field.end_ctrl:
+                        return "\n".join(lines)
+                    elif inside and child.tag == TEXT:
+                        lines[-1] += "".join(child.itertext())
+        return "\n".join(lines)
+
+    def _apply_values(self):
+        for name, text in self._values.items():
+            for field in self._fields[name]:
+                self._write_field(field, text.split("\n"))
+                self._modified_sections.add(field.section)
+        if self._values:
+            self._values = {}
+            self._index_fields()
+
+    def _write_field(self, field: _HwpxField, lines: List[str]):
+        """Replace a field's content with one paragraph per line.
+
+        Runs and paragraphs moved here are re-parented in the section's
+        parent map, so later writes to fields in the same paragraphs see
+        the current tree.
+        """
+        parents = self._parents[field.section]
+        begin_paragraph = parents[field.begin_run]
+        end_paragraph = parents[field.end_run]
+        container = parents[begin_paragraph]
+
+        # Character style of the old text, so new text looks the same
+        begin_children = list(field.begin_run)
+        old_text_runs = [run for run in self._content_runs(field) if run.find(TEXT) is not None]
+        if any(child.tag == TEXT for child in begin_children[begin_children.index(field.begin_ctrl):]):
+            old_text_runs.insert(0, field.begin_run)
+        char_style = (old_text_runs[0] if old_text_runs else field.begin_run).get("charPrIDRef")
+
+        # Remove the old content, keeping the end marker and what follows it
+        self._strip_texts(field.begin_run, after=field.begin_ctrl)
+        self._strip_texts(field.end_run, before=field.end_ctrl)
+        for run in self._content_runs(field):
+            parents[run].remove(run)
+        if end_paragraph is begin_paragraph:
+            children = list(begin_paragraph)
+            tail_runs = [child for child in children[children.index(field.end_run):] if child.tag == RUN]
+        else:
+            paragraphs = list(container)
+            for paragraph in paragraphs[paragraphs.index(begin_paragraph) + 1:paragraphs.index(end_paragraph) + 1]:
+                container.remove(paragraph)
+            tail_runs = [child for child in end_paragraph if child.tag == RUN]
+            begin_paragraph.extend(tail_runs)
+            self._set_parent(parents, begin_paragraph, tail_runs)
+
+        # First line goes right after the begin marker, the others into new paragraphs
+        position = list(begin_paragraph).index(field.begin_run) + 1
+        first_run = self._make_run(lines[0], char_style)
+        begin_paragraph.insert(position, first_run)
+        self._set_parent(parents, begin_paragraph, [first_run])
+        last_paragraph = begin_paragraph
+        if len(lines) > 1:
+            for run in tail_runs:
+                begin_paragraph.remove(run)
+            position = list(container).index(begin_paragraph) + 1
+            for line in lines[1:]:
+                last_paragraph = ET.Element(PARAGRAPH, dict(begin_paragraph.attrib))
+                last_paragraph.append(self._make_run(line, char_style))
+                container.insert(position, last_paragraph)
+                self._set_parent(parents, container, [last_paragraph])
+                self._set_parent(parents, last_paragraph, list(last_paragraph))
+                position += 1
+            last_paragraph.extend(tail_runs)
+            self._set_parent(parents, last_paragraph, tail_runs)
+
+        for paragraph in {begin_paragraph, last_paragraph}:
+            for segments in paragraph.findall(LINE_SEGMENTS):
+                paragraph.remove(segments)
+
+    @staticmethod
+    def _set_parent(parents: Dict[ET.Element, ET.Element], parent: ET.Element,
+                    children: List[ET.Element]):
+        for child in children:
+            parents[child] = parent
+
+    def _content_runs(self, field: _HwpxField) -> List[ET.Element]:
+        """Runs strictly between the begin and end markers"""
+        runs = []
+        inside = False
+        for paragraph in self._field_paragraphs(field):
+            for run in paragraph.findall(RUN):
+                if run is field.end_run:
+                    return runs
+                if inside:
+                    runs.append(run)
+                elif run is field.begin_run:
+                    inside = True
+        return runs
+
+    def _field_paragraphs(self, field: _HwpxField) -> List[ET.Element]:
+        """Paragraphs from the one holding the begin marker to the one holding the end marker"""
+        parents = self._parents[field.section]
+        begin_paragraph = parents[field.begin_run]
+        end_paragraph = parents[field.end_run]
+        if begin_paragraph is end_paragraph:
+            return [begin_paragraph]
+        paragraphs = list(parents[begin_paragraph])
+        return paragraphs[paragraphs.index(begin_paragraph):paragraphs.index(end_paragraph) + 1]
+
+    @staticmethod
+    def _strip_texts(run: ET.Element, after: ET.Element = None, before: ET.Element = None):
+        """Remove text elements of a marker run on the content side of the marker"""
+        children = list(run)
+        if after is not None:
+            children = children[children.index(after) + 1:]
+        if before is not None:
+            children = children[:children.index(before)]
+        for child in children:
+            if child.tag == TEXT:
+                run.remove(child)
+
+    @staticmethod
+    def _make_run(text: str, char_style: Optional[str]) -> ET.Element:
+        run = ET.Element(RUN, {"charPrIDRef": char_style} if char_style is not None else {})
+        ET.SubElement(run, TEXT).text = text
+        return run
+
+    # Package
+
+    @staticmethod
+    def _parse(data: bytes) -> ET.Element:
+        # Keep the document's namespace prefixes (hp:, hs:, ...) when writing it back
+        events = ET.iterparse(BytesIO(data), events=("start-ns",))
+        for _, (prefix, uri) in events:
+            if prefix:
+                ET.register_namespace(prefix, uri)
+        return events.root
+
+    def _index_fields(self):
+        """Find every named field and its end marker in the sections"""
+        self._fields = {}
+        self._occurrences = []
+        self._parents = {}
+        for section_name, root in self._sections.items():
+            parents = {child: parent for parent in root.iter() for child in parent}
+            self._parents[section_name] = parents
+            ends = {end.get("beginIDRef"): end for end in root.iter(FIELD_END)}
+            for begin in root.iter(FIELD_BEGIN):
+                name = begin.get("name")
+                end = ends.get(begin.get("id"))
+                if not name or end is None:
+                    continue
+                begin_ctrl, end_ctrl = parents[begin], parents[end]
+                self._occurrences.append(name)
+                self._fields.setdefault(name, []).append(_HwpxField(
+                    name, section_name, parents[begin_ctrl], begin_ctrl, parents[end_ctrl], end_ctrl))
+
+    def _write_package(self, file_path: str):
+        directory = os.path.dirname(os.path.abspath(file_path))
+        fd, temp_path = tempfile.mkstemp(prefix=os.path.basename(file_path) + ".",
+                                         suffix=".tmp", dir=directory)
+        os.close(fd)
+        try:
+            # mimetype must be the first entry and stored uncompressed
+            entries = sorted(self._entries, key=lambda entry: entry[0].filename != MIMETYPE_NAME)
+            with zipfile.ZipFile(temp_path, "w") as package:
+                for info, data in entries:
+                    if info.filename in self._modified_sections:
+                        data = ET.tostring(self._sections[info.filename], encoding="UTF-8",
+                                           xml_declaration=True)
+                    entry = zipfile.ZipInfo(info.filename, date_time=info.date_time)
+                    entry.external_attr = info.external_attr
+                    entry.compress_type = (zipfile.ZIP_STORED if info.filename == MIMETYPE_NAME
+                                           else info.compress_type)
+                    package.writestr(entry, data)
+            os.replace(temp_path, file_path)
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
@@ -14,20 +14,40 @@ def get_resource_path(relative_path):
         # PyInstaller creates a temp folder and stores path in _MEIPASS
         base_path = sys._MEIPASS
     except Exception:
-        base_path = os.path.abspath(".")
+        # Next to app.py, whatever the working directory is
+        base_path = os.path.dirname(current_dir)
 
     return os.path.join(base_path, relative_path)
 
 from ui_first_screen import FirstScreen
 from models import ChecklistParser
+from checklist_cache import load_checklist
 from state_manager import StateManager
+from virtual_checklist import VirtualChecklistView, ChecklistPageCache
+from view_state import ChecklistViewModel, ViewChanges
+from summary_view import HierarchicalSummary
+from startup import Prefetcher, StartupProfile
+
+# Checklists larger than this are parsed lazily, one title1 at a time
+LAZY_LOAD_THRESHOLD = 2 * 1024 * 1024
+
+# Built title2 pages kept for instant step switching, and the row widgets they may hold
+PAGE_CACHE_SIZE = 8
+PAGE_CACHE_MAX_ROWS = 600
+
+# Modules only needed after the first screen, imported in the background
+PREFETCH_MODULES = ["hwp_converter"]
+
+# Report templates whose cached field lists are looked up in the background at startup
+TEMPLATE_DIR = get_resource_path("templates")
 
 
 class MainWindow(ctk.CTk):
     """Main application window"""
 
-    def __init__(self):
+    def __init__(self, startup_profile: Optional[StartupProfile] = None):
         super().__init__()
+        self.startup_profile = startup_profile
 
         # Configure window
         self.title("안전보건 컨설팅 보고서 작성")
@@ -50,23 +70,99 @@ class MainWindow(ctk.CTk):
         self.stepper_frame = None
         self.step_buttons = []
 
+        # Virtualized checklist view of the current page, and the LRU cache of built pages
+        self.checklist_view = None
+        self.page_cache = None
+
+        # What the checklist screen shows, for targeted refreshes
+        self.view_model = None
+        self.sidebar_buttons = []
+        self.header_label = None
+        self.prev_button = None
+        self.step_info_label = None
+        self.next_button = None
+
+        # Final review summary, built incrementally
+        self.summary_view = None
+
         # UI components
         self.first_screen = None
         self.sidebar_frame = None
         self.main_content_frame = None
         self.navigation_frame = None
 
-        # Load checklist data
-        self.load_checklist_data()
+        # Checklist parsing and heavy imports run after the first paint
+        self.prefetcher = self.create_prefetcher()
+
+        # Flush pending state before the window goes away
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
 
         # Show first screen initially
         self.show_first_screen()
+        self.after_idle(self.on_first_paint)
+
+    def create_prefetcher(self) -> Prefetcher:
+        """Background startup work; the checklist comes first as it is needed first"""
+        on_complete = self.startup_profile.report_prefetch if self.startup_profile else None
+        prefetcher = Prefetcher(on_complete=on_complete)
+        prefetcher.add("checklist", self.load_checklist_data)
+        for module_name in PREFETCH_MODULES:
+            prefetcher.add_import(module_name)
+        prefetcher.add("template index", self.index_templates)
+        return prefetcher
+
+    def index_templates(self) -> int:
+        """Hash the templates in TEMPLATE_DIR so cached field lists are found (prefetch thread).
+
+        Nothing is opened here: unknown templates are read when selected
+        (see index_selected_template), so startup never launches HWP.
+        """
+        if not os.path.isdir(TEMPLATE_DIR):
+            return 0
+        from template_cache import TemplateIndexer, get_template_cache
+
+        known = TemplateIndexer(get_template_cache(), TEMPLATE_DIR).warm()
+        if known:
+            print(f"[OK] {known} report templates found in the template cache")
+        return known
+
+    def index_selected_template(self, hwp_file_path: str):
+        """Read the field list of the chosen template into the cache before the first conversion"""
+        if not hwp_file_path:
+            return
+        import threading
+
+        def read_inventory():
+            try:
+                from hwp_converter import HWPConverter, check_hwp_available, requires_hwp_program
+                from template_cache import get_template_cache
+
+                if requires_hwp_program(hwp_file_path) and not check_hwp_available():
+                    return
+                HWPConverter(template_cache=get_template_cache()).read_field_inventory(hwp_file_path)
+            except Exception as e:
+                print(f"[WARN] Could not read template fields of {hwp_file_path}: {e}")
+
+        threading.Thread(target=read_inventory, daemon=True).start()
+
+    def on_first_paint(self):
+        """Start deferred startup work once the first screen is on screen"""
+        self.update_idletasks()
+        if self.startup_profile:
+            self.startup_profile.mark("first screen drawn")
+            self.startup_profile.report()
+        self.prefetcher.start()
 
     def load_checklist_data(self):
-        """Load checklist data from JSON file"""
+        """Load checklist data from JSON file (through the compiled cache).
+
+        Runs on the prefetch thread; it touches no widgets.
+        """
         try:
             checklist_path = get_resource_path("data/checklist.json")
-            self.title1_nodes = ChecklistParser.load_from_file(checklist_path)
+            # 큰 체크리스트는 title1 단위로 필요할 때 파싱
+            lazy = os.path.getsize(checklist_path) > LAZY_LOAD_THRESHOLD
+            self.title1_nodes = load_checklist(checklist_path, lazy=lazy)
 
             # Validate structure
             if not ChecklistParser.validate_structure(self.title1_nodes):
@@ -96,9 +192,18 @@ class MainWindow(ctk.CTk):
         """Handle confirmation from first screen"""
         self.company_name = company_name
         self.hwp_file_path = hwp_file_path
+        # 선택한 템플릿의 필드 목록은 이때 한 번만 읽음 (캐시에 있으면 열지 않음)
+        self.index_selected_template(hwp_file_path)
+
+        # 백그라운드 로딩이 아직 끝나지 않았다면 여기서 기다림
+        self.prefetcher.result("checklist")
 
         # Initialize state manager
-        self.state_manager = StateManager(company_name=self.company_name)
+        self.state_manager = StateManager(
+            company_name=self.company_name,
+            title1_nodes=self.title1_nodes,
+            storage_mode="journal"
+        )
 
         # Switch to main checklist screen
         self.show_main_screen()
@@ -123,6 +228,7 @@ class MainWindow(ctk.CTk):
         self.create_navigation()
 
         # Load initial content
+        self.view_model = ChecklistViewModel(self.title1_nodes, self.state_manager)
         self.update_sidebar()
         self.update_main_content()
         self.update_navigation_buttons()
@@ -155,6 +261,12 @@ class MainWindow(ctk.CTk):
         """Create right main content area"""
         self.main_content_frame = ctk.CTkFrame(self)
         self.main_content_frame.grid(row=0, column=1, padx=(5, 10), pady=10, sticky="nsew")
+        self.checklist_view = None
+        self.page_cache = ChecklistPageCache(
+            self.create_checklist_view,
+            max_pages=PAGE_CACHE_SIZE,
+            max_rows=PAGE_CACHE_MAX_ROWS
+        )
 
         # Configure main content layout
         self.main_content_frame.grid_columnconfigure(0, weight=1)
@@ -171,6 +283,9 @@ class MainWindow(ctk.CTk):
         # Configure navigation layout
         self.navigation_frame.grid_columnconfigure((0, 1, 2), weight=1)
         self.navigation_frame.grid_rowconfigure(0, weight=1)
+        self.prev_button = None
+        self.step_info_label = None
+        self.next_button = None
 
         # Create navigation buttons
         self.update_navigation_buttons()
@@ -180,6 +295,7 @@ class MainWindow(ctk.CTk):
         # Clear existing buttons
         for widget in self.sidebar_scrollable.winfo_children():
             widget.destroy()
+        self.sidebar_buttons = []
 
         # Create buttons for each title1
         for i, title1 in enumerate(self.title1_nodes):
@@ -192,33 +308,42 @@ class MainWindow(ctk.CTk):
                 anchor="w"
             )
             button.grid(row=i, column=0, padx=10, pady=5, sticky="ew")
+            self.sidebar_buttons.append(button)
 
             # Apply styling based on selection state
-            if i == self.current_title1_index:
-                button.configure(
-                    fg_color="#FF6B35",  # High-contrast orange for selected
-                    text_color="white",
-                    border_width=2,
-                    border_color="#CC5525"
-                )
-            else:
-                button.configure(
-                    fg_color="#F0F0F0",  # Light gray for unselected
-                    text_color="#333333",
-                    border_width=1,
-                    border_color="#CCCCCC"
-                )
+            self.style_sidebar_button(i)
+
+    def style_sidebar_button(self, index: int):
+        """Apply selection styling to one sidebar button"""
+        button = self.sidebar_buttons[index]
+        if index == self.current_title1_index:
+            button.configure(
+                fg_color="#FF6B35",  # High-contrast orange for selected
+                text_color="white",
+                border_width=2,
+                border_color="#CC5525"
+            )
+        else:
+            button.configure(
+                fg_color="#F0F0F0",  # Light gray for unselected
+                text_color="#333333",
+                border_width=1,
+                border_color="#CCCCCC"
+            )
 
     def update_main_content(self):
         """Update main content area"""
-        # Clear existing content
+        # Clear existing content (캐시된 체크리스트 페이지는 재사용)
         for widget in self.main_content_frame.winfo_children():
-            widget.destroy()
+            if not self.page_cache.is_cached_view(widget):
+                widget.destroy()
 
         if not self.title1_nodes:
             return
 
         current_title1 = self.title1_nodes[self.current_title1_index]
+        if self.view_model:
+            self.view_model.reset(self.current_title1_index, self.current_title2_index)
 
         # Header with progress
         self.create_header_with_progress(current_title1)
@@ -244,10 +369,15 @@ class MainWindow(ctk.CTk):
             anchor="w"
         )
         header_label.grid(row=0, column=0, sticky="w")
+        self.header_label = header_label
 
 
     def create_stepper(self, current_title1):
         """Create stepper UI with title2 buttons"""
+        # 다른 title1로 전환할 때는 기존 스테퍼를 교체
+        if self.stepper_frame is not None and self.stepper_frame.winfo_exists():
+            self.stepper_frame.destroy()
+
         # Stepper frame
         self.stepper_frame = ctk.CTkFrame(self.main_content_frame, fg_color="transparent", height=70)
         self.stepper_frame.grid(row=1, column=0, padx=20, pady=(5, 10), sticky="ew")
@@ -271,6 +401,7 @@ class MainWindow(ctk.CTk):
         # Create step buttons horizontally
         for i, title2 in enumerate(title2_nodes):
             self.create_step_button(i, title2, total_steps)
+        self.update_stepper_buttons(current_title1)
 
     def create_step_button(self, index: int, title2, total_steps: int):
         """Create individual step button"""
@@ -309,11 +440,14 @@ class MainWindow(ctk.CTk):
         self.step_buttons.append(button)
 
 
-    def update_stepper_buttons(self, current_title1):
-        """Update stepper button states after selection change"""
+    def update_stepper_buttons(self, current_title1, indices=None):
+        """Update stepper button states after selection change (only the given steps if indices is set)"""
         title2_nodes = current_title1.get_title2_children()
+        if indices is None:
+            indices = range(min(len(self.step_buttons), len(title2_nodes)))
 
-        for i, (button, title2) in enumerate(zip(self.step_buttons, title2_nodes)):
+        for i in indices:
+            button, title2 = self.step_buttons[i], title2_nodes[i]
             # Determine step status
             is_completed = title2.is_completed(self.state_manager) if self.state_manager else False
             is_current = i == self.current_title2_index
@@ -354,13 +488,8 @@ class MainWindow(ctk.CTk):
 
     def select_title1(self, index: int):
         """Handle title1 selection"""
-        self.current_title1_index = index
-        self.current_title2_index = 0  # Reset to first title2
-
-        # Update UI
-        self.update_sidebar()
-        self.update_main_content()
-        self.update_navigation_buttons()
+        # Reset to first title2
+        self.navigate_to(index, 0)
 
     def select_title2(self, index: int):
         """Handle title2 selection"""
@@ -368,162 +497,79 @@ class MainWindow(ctk.CTk):
         if self.state_manager:
             self.state_manager.save_state()
             
-        self.current_title2_index = index
-        
-        # Update UI
-        self.update_main_content()
-        self.update_navigation_buttons()
+        self.navigate_to(self.current_title1_index, index)
+
+    def navigate_to(self, title1_index: int, title2_index: int):
+        """Switch to a title2 page, reconfiguring only what the switch touched"""
+        self.current_title1_index = title1_index
+        self.current_title2_index = title2_index
+        if self.view_model:
+            self.apply_view_changes(self.view_model.select(title1_index, title2_index))
+
+    def apply_view_changes(self, changes: ViewChanges):
+        """Reconfigure the sidebar, stepper and checklist widgets in a change set"""
+        current_title1 = self.title1_nodes[self.current_title1_index]
+
+        for index in changes.sidebar:
+            if index < len(self.sidebar_buttons):
+                self.style_sidebar_button(index)
+
+        if changes.title1_changed:
+            # 헤더는 텍스트만 변경, 스테퍼는 단계 구성이 달라지므로 다시 생성
+            if self.header_label is not None:
+                self.header_label.configure(text=current_title1.label)
+            self.create_stepper(current_title1)
+        elif changes.steps:
+            self.update_stepper_buttons(current_title1, sorted(changes.steps))
+
+        if changes.page_changed:
+            self.create_checklist_area(current_title1)
+            self.update_navigation_buttons()
+        elif changes.sections and self.checklist_view is not None:
+            self.checklist_view.refresh(changes.sections)
 
     def create_checklist_area(self, current_title1):
-        """Create checklist area showing sections and items for current title2"""
+        """Show sections and items for current title2 in a cached checklist page"""
         # Get current title2
         title2_nodes = current_title1.get_title2_children()
         if not title2_nodes or self.current_title2_index >= len(title2_nodes):
+            self.checklist_view = self.page_cache.show(None, [])
             return
             
         current_title2 = title2_nodes[self.current_title2_index]
         
-        # Create scrollable checklist frame
-        self.checklist_frame = ctk.CTkScrollableFrame(
-            self.main_content_frame,
-            fg_color="transparent"
-        )
-        self.checklist_frame.grid(row=2, column=0, padx=10, pady=(5, 10), sticky="nsew")
-        self.checklist_frame.grid_columnconfigure(0, weight=1)
-        
-        # Get all sections under current title2
-        sections = current_title2.get_sections()
-        
-        if not sections:
-            # No sections, show message
-            no_content_label = ctk.CTkLabel(
-                self.checklist_frame,
-                text="이 단계에는 체크리스트 항목이 없습니다.",
-                font=ctk.CTkFont(size=16)
-            )
-            no_content_label.grid(row=0, column=0, padx=20, pady=40, sticky="ew")
-            return
-        
-        # Create section frames
-        for section_idx, section in enumerate(sections):
-            self.create_section_frame(section, section_idx)
-
-    def create_section_frame(self, section, section_idx: int):
-        """Create a frame for a single section with its items"""
-        # Section container frame (현대적 디자인)
-        section_frame = ctk.CTkFrame(
-            self.checklist_frame,
-            corner_radius=8,
-            fg_color="#FAFAFA",
-            border_width=1,
-            border_color="#E0E0E0"
-        )
-        section_frame.grid(row=section_idx, column=0, padx=12, pady=8, sticky="ew")
-        section_frame.grid_columnconfigure(0, weight=1)
-        
-        # Section header with title and bulk select button
-        header_frame = ctk.CTkFrame(section_frame, fg_color="transparent")
-        header_frame.grid(row=0, column=0, padx=16, pady=(16, 12), sticky="ew")
-        header_frame.grid_columnconfigure(0, weight=1)
-        
-        # Section title (더 세련된 스타일)
-        section_title = ctk.CTkLabel(
-            header_frame,
-            text=section.label,
-            font=ctk.CTkFont(size=17, weight="bold"),
-            anchor="w",
-            text_color="#1A1A1A"
-        )
-        section_title.grid(row=0, column=0, sticky="w")
-        
-        # Bulk select button (깔끔한 디자인)
-        bulk_button = ctk.CTkButton(
-            header_frame,
-            text="전체 선택/해제",
-            command=lambda s=section: self.toggle_section_items(s),
-            font=ctk.CTkFont(size=13),
-            height=32,
-            width=110,
-            corner_radius=6,
-            fg_color="#f0f0f0",
-            text_color="#333333",
-            hover_color="#e0e0e0"
-        )
-        bulk_button.grid(row=0, column=1, sticky="e", padx=(10, 0))
-        
-        # Items container (여백 조정)
-        items_frame = ctk.CTkFrame(section_frame, fg_color="transparent")
-        items_frame.grid(row=1, column=0, padx=16, pady=(0, 16), sticky="ew")
-        items_frame.grid_columnconfigure(0, weight=1)
-        
-        # Create checkboxes for each item
-        for item_idx, item in enumerate(section.items):
-            self.create_item_checkbox(items_frame, section, item, item_idx)
-
-    def create_item_checkbox(self, parent_frame, section, item: str, item_idx: int):
-        """Create a checkbox for a single checklist item"""
-        # Check if item is currently checked
-        is_checked = False
-        if self.state_manager:
-            is_checked = self.state_manager.is_item_checked(section.id, item)
+        # 이미 만든 페이지는 숨겼다가 다시 표시 (체크 상태는 표시할 때 동기화)
+        # id는 중복될 수 있으므로 위치(title1, title2 순번)로 페이지를 구분
+        page_key = (self.current_title1_index, self.current_title2_index)
+        self.checklist_view = self.page_cache.show(page_key, current_title2.get_sections())
 
-        # Create checkbox frame (깔끔한 디자인)
-        checkbox_frame = ctk.CTkFrame(parent_frame, fg_color="transparent")
-        checkbox_frame.grid(row=item_idx, column=0, padx=8, pady=4, sticky="ew")
-        checkbox_frame.grid_columnconfigure(1, weight=1)
-
-        # Checkbox (현대적 스타일)
-        checkbox = ctk.CTkCheckBox(
-            checkbox_frame,
-            text="",
-            command=lambda: self.toggle_item(section.id, item),
-            font=ctk.CTkFont(size=15),
-            checkbox_width=20,
-            checkbox_height=20,
-            corner_radius=4,
-            border_width=2,
-            fg_color="#007ACC",
-            hover_color="#005A9F",
-            checkmark_color="white"
-        )
-        checkbox.grid(row=0, column=0, padx=(8, 12), pady=6, sticky="nw")
-
-        # Set initial state
-        if is_checked:
-            checkbox.select()
-        else:
-            checkbox.deselect()
-
-        # Item text label (텍스트 줄바꿈 지원)
-        item_label = ctk.CTkLabel(
-            checkbox_frame,
-            text=item,
-            font=ctk.CTkFont(size=15),
-            anchor="w",
-            justify="left",
-            text_color="#2D2D2D"
+    def create_checklist_view(self) -> VirtualChecklistView:
+        """Create a checklist page view for the page cache"""
+        view = VirtualChecklistView(
+            self.main_content_frame,
+            is_item_checked=self.is_item_checked,
+            on_toggle_item=self.toggle_item,
+            on_toggle_section=self.toggle_section_items,
+            empty_text="이 단계에는 체크리스트 항목이 없습니다."
         )
-        item_label.grid(row=0, column=1, padx=(0, 12), pady=6, sticky="ew")
-
-        # 위젯이 화면에 배치된 후 실제 너비를 계산하여 wraplength 설정
-        def update_wraplength(event):
-            # 실제 Label이 차지할 수 있는 너비 계산 (여백 제외)
-            available_width = event.width - 30  # 좌우 여백 고려
-            if available_width > 50:  # 최소 너비 확보
-                item_label.configure(wraplength=available_width)
+        view.grid(row=2, column=0, padx=10, pady=(5, 10), sticky="nsew")
+        return view
 
-        item_label.bind("<Configure>", update_wraplength)
+    def is_item_checked(self, section_id: str, item: str) -> bool:
+        """Check item state for the checklist view"""
+        return bool(self.state_manager) and self.state_manager.is_item_checked(section_id, item)
 
     def toggle_item(self, section_id: str, item: str):
         """Toggle individual item checkbox state"""
         if not self.state_manager:
             return
             
-        # Toggle state (메모리에서만 변경, 저장하지 않음)
-        current_state = self.state_manager.is_item_checked(section_id, item)
-        self.state_manager.set_item_checked_no_save(section_id, item, not current_state)
+        # Toggle state (저널에 변경 한 건만 기록)
+        self.state_manager.toggle_item(section_id, item)
         
-        # UI 업데이트는 하지 않음 (성능 최적화)
+        # 체크박스는 이미 반영됨, 단계 완료 표시만 필요 시 갱신
+        if self.view_model:
+            self.apply_view_changes(self.view_model.item_toggled(section_id, item))
 
     def toggle_section_items(self, section):
         """Toggle all items in a section"""
@@ -537,53 +583,46 @@ class MainWindow(ctk.CTk):
         # If all are checked, uncheck all. Otherwise, check all.
         new_state = not (checked_count == total_count)
         
-        # Update all items in the section (메모리에서만, 저장하지 않음)
-        for item in section.items:
-            self.state_manager.set_item_checked_no_save(section.id, item, new_state)
+        # Update all items in the section (한 번의 배치로 저장)
+        changed_sections = self.state_manager.apply_changes(
+            (section.id, item, new_state) for item in section.items
+        )
         
-        # UI 업데이트 (전체 선택 시 체크박스 상태 반영)
-        self.update_main_content()
+        # UI 업데이트 (바뀐 섹션의 보이는 체크박스와 단계 표시만 반영)
+        if changed_sections and self.view_model:
+            self.apply_view_changes(self.view_model.items_changed(changed_sections))
 
     def update_navigation_buttons(self):
         """Update navigation buttons based on current state"""
-        # Clear existing buttons
-        for widget in self.navigation_frame.winfo_children():
-            widget.destroy()
-        
         if not self.title1_nodes:
             return
             
         current_title1 = self.title1_nodes[self.current_title1_index]
         title2_nodes = current_title1.get_title2_children()
         
+        if self.prev_button is None:
+            self.create_navigation_buttons()
+        
+        nav_widgets = (self.prev_button, self.step_info_label, self.next_button)
         if not title2_nodes:
+            for widget in nav_widgets:
+                widget.grid_remove()
             return
+        for widget in nav_widgets:
+            widget.grid()
         
         total_steps = len(title2_nodes)
         is_first_step = self.current_title2_index == 0
         is_last_step = self.current_title2_index == total_steps - 1
         
         # Previous button
-        prev_button = ctk.CTkButton(
-            self.navigation_frame,
-            text="◀ 이전",
-            command=self.go_to_previous_step,
-            font=ctk.CTkFont(size=16, weight="bold"),
-            height=40,
-            width=120,
+        self.prev_button.configure(
             fg_color="#6C757D" if is_first_step else "#007BFF",
-            text_color="white",
             state="disabled" if is_first_step else "normal"
         )
-        prev_button.grid(row=0, column=0, padx=10, pady=10, sticky="w")
         
         # Step info in the center
-        step_info = ctk.CTkLabel(
-            self.navigation_frame,
-            text=f"{self.current_title2_index + 1} / {total_steps}",
-            font=ctk.CTkFont(size=14, weight="bold")
-        )
-        step_info.grid(row=0, column=1, pady=10)
+        self.step_info_label.configure(text=f"{self.current_title2_index + 1} / {total_steps}")
         
         # Determine if this is the very last step across all title1s
         is_final_step = (self.current_title1_index == len(self.title1_nodes) - 1) and is_last_step
@@ -604,17 +643,41 @@ class MainWindow(ctk.CTk):
             next_command = self.go_to_next_step
             next_color = "#007BFF"  # Blue for next
         
-        next_button = ctk.CTkButton(
-            self.navigation_frame,
+        self.next_button.configure(
             text=next_button_text,
             command=next_command,
+            fg_color=next_color
+        )
+
+    def create_navigation_buttons(self):
+        """Create navigation widgets once; update_navigation_buttons reconfigures them"""
+        self.prev_button = ctk.CTkButton(
+            self.navigation_frame,
+            text="◀ 이전",
+            command=self.go_to_previous_step,
             font=ctk.CTkFont(size=16, weight="bold"),
             height=40,
             width=120,
-            fg_color=next_color,
             text_color="white"
         )
-        next_button.grid(row=0, column=2, padx=10, pady=10, sticky="e")
+        self.prev_button.grid(row=0, column=0, padx=10, pady=10, sticky="w")
+        
+        self.step_info_label = ctk.CTkLabel(
+            self.navigation_frame,
+            text="",
+            font=ctk.CTkFont(size=14, weight="bold")
+        )
+        self.step_info_label.grid(row=0, column=1, pady=10)
+        
+        self.next_button = ctk.CTkButton(
+            self.navigation_frame,
+            text="",
+            font=ctk.CTkFont(size=16, weight="bold"),
+            height=40,
+            width=120,
+            text_color="white"
+        )
+        self.next_button.grid(row=0, column=2, padx=10, pady=10, sticky="e")
 
     def go_to_previous_step(self):
         """Navigate to previous title2 step"""
@@ -623,9 +686,7 @@ class MainWindow(ctk.CTk):
             if self.state_manager:
                 self.state_manager.save_state()
             
-            self.current_title2_index -= 1
-            self.update_main_content()
-            self.update_navigation_buttons()
+            self.navigate_to(self.current_title1_index, self.current_title2_index - 1)
 
     def go_to_next_step(self):
         """Navigate to next title2 step or next title1"""
@@ -638,20 +699,13 @@ class MainWindow(ctk.CTk):
         
         if self.current_title2_index < len(title2_nodes) - 1:
             # Move to next title2 within current title1
-            self.current_title2_index += 1
+            self.navigate_to(self.current_title1_index, self.current_title2_index + 1)
+        elif self.current_title1_index < len(self.title1_nodes) - 1:
+            # Current title1 is complete, move to next title1 (first title2)
+            self.navigate_to(self.current_title1_index + 1, 0)
         else:
-            # Current title1 is complete, move to next title1
-            if self.current_title1_index < len(self.title1_nodes) - 1:
-                self.current_title1_index += 1
-                self.current_title2_index = 0  # Reset to first title2
-            else:
-                # All title1s complete, go to final review
-                self.show_final_review()
-                return
-        
-        self.update_sidebar()
-        self.update_main_content()
-        self.update_navigation_buttons()
+            # All title1s complete, go to final review
+            self.show_final_review()
 
     def go_to_final_review(self):
         """Navigate to final review page (Phase 7)"""
@@ -754,151 +808,18 @@ class MainWindow(ctk.CTk):
             return
 
         # Content sections with modern card design (완료 현황 통계 제거)
-        row_idx = 0
-        for title1_idx, title1 in enumerate(self.title1_nodes):
-            # Main section card
-            section_card = ctk.CTkFrame(
-                summary_frame,
-                fg_color="white",
-                corner_radius=12,
-                border_width=1,
-                border_color="#E8E8E8"
-            )
-            section_card.grid(row=row_idx, column=0, padx=10, pady=(0, 15), sticky="ew")
-            section_card.grid_columnconfigure(0, weight=1)
-            
-            # Section header with numbering
-            section_header = ctk.CTkFrame(
-                section_card,
-                fg_color="#F8F9FA",
-                corner_radius=10
-            )
-            section_header.grid(row=0, column=0, padx=12, pady=(12, 8), sticky="ew")
-            section_header.grid_columnconfigure(0, weight=1)
-            
-            title1_label = ctk.CTkLabel(
-                section_header,
-                text=f"{title1_idx + 1}. {title1.label}",
-                font=ctk.CTkFont(size=18, weight="bold"),
-                anchor="w",
-                text_color="#1A1A1A"
-            )
-            title1_label.grid(row=0, column=0, padx=15, pady=12, sticky="w")
-            
-            content_row = 1
-            
-            # Title2 subsections with improved layout
-            for title2_idx, title2 in enumerate(title1.get_title2_children()):
-                # Title2 header with modern styling
-                title2_header = ctk.CTkLabel(
-                    section_card,
-                    text=f"📂 {title2_idx + 1}.{title1_idx + 1} {title2.label}",
-                    font=ctk.CTkFont(size=16, weight="bold"),
-                    anchor="w",
-                    text_color="#333333"
-                )
-                title2_header.grid(row=content_row, column=0, padx=25, pady=(8, 4), sticky="w")
-                content_row += 1
-
-                # Process sections with enhanced display
-                has_content = False
-                for section in title2.get_sections():
-                    checked_items = []
-                    for item in section.items:
-                        if self.state_manager.is_item_checked(section.id, item):
-                            checked_items.append(item)
-                    
-                    if checked_items:
-                        has_content = True
-                        # Section container with subtle background
-                        section_container = ctk.CTkFrame(
-                            section_card,
-                            fg_color="#F8F9FA",
-                            corner_radius=8,
-                            border_width=1,
-                            border_color="#E8E8E8"
-                        )
-                        section_container.grid(row=content_row, column=0, padx=25, pady=(2, 8), sticky="ew")
-                        section_container.grid_columnconfigure(0, weight=1)
-
-                        # Section title
-                        section_title = ctk.CTkLabel(
-                            section_container,
-                            text=f"📝 {section.label}",
-                            font=ctk.CTkFont(size=14, weight="bold"),
-                            anchor="w",
-                            justify="left",
-                            text_color="#444444",
-                            wraplength=1000
-                        )
-                        section_title.grid(row=0, column=0, padx=15, pady=(10, 6), sticky="ew")
-
-                        # Items with bullet points and left alignment
-                        for idx, item in enumerate(checked_items, 1):
-                            item_container = ctk.CTkFrame(
-                                section_container,
-                                fg_color="transparent"
-                            )
-                            item_container.grid(row=idx, column=0, padx=10, pady=1, sticky="ew")
-                            item_container.grid_columnconfigure(1, weight=1)
-
-                            # Bullet point
-                            bullet_label = ctk.CTkLabel(
-                                item_container,
-                                text="•",
-                                font=ctk.CTkFont(size=13, weight="bold"),
-                                text_color="#007ACC",
-                                width=15
-                            )
-                            bullet_label.grid(row=0, column=0, sticky="nw", pady=(2, 0), padx=(5, 0))
-
-                            # Item text with word wrapping and left alignment
-                            item_label = ctk.CTkLabel(
-                                item_container,
-                                text=item,
-                                font=ctk.CTkFont(size=13),
-                                anchor="w",
-                                justify="left",
-                                text_color="#28A745"
-                            )
-                            item_label.grid(row=0, column=1, sticky="ew", padx=(5, 10), pady=2)
-
-                            # 위젯이 화면에 배치된 후 실제 너비를 계산하여 wraplength 설정
-                            def update_summary_wraplength(event, label=item_label):
-                                available_width = event.width - 30
-                                if available_width > 50:
-                                    label.configure(wraplength=available_width)
-
-                            item_label.bind("<Configure>", update_summary_wraplength)
-                        
-                        # Bottom padding for section
-                        ctk.CTkLabel(section_container, text="", height=8).grid(row=len(checked_items)+1, column=0)
-                        content_row += 1
-
-                if not has_content:
-                    # Styled "no content" message
-                    no_content_frame = ctk.CTkFrame(
-                        section_card,
-                        fg_color="#F5F5F5",
-                        corner_radius=6
-                    )
-                    no_content_frame.grid(row=content_row, column=0, padx=35, pady=(2, 8), sticky="ew")
-                    
-                    no_content_label = ctk.CTkLabel(
-                        no_content_frame,
-                        text="체크된 항목이 없습니다",
-                        font=ctk.CTkFont(size=13),
-                        text_color="#999999"
-                    )
-                    no_content_label.grid(row=0, column=0, pady=8)
-                    content_row += 1
-            
-            # Card bottom padding
-            ctk.CTkLabel(section_card, text="", height=8).grid(row=content_row, column=0)
-            row_idx += 1
+        # title1 카드를 먼저 그리고 항목은 유휴 시간에 나누어 생성
+        if self.summary_view:
+            self.summary_view.cancel()
+        self.summary_view = HierarchicalSummary(summary_frame, self.title1_nodes, self.state_manager)
 
     def return_to_checklist(self):
         """Return to main checklist screen"""
+        # 요약 생성이 남아 있으면 중단
+        if self.summary_view:
+            self.summary_view.cancel()
+            self.summary_view = None
+
         # Go back to the last step we were on
         self.show_main_screen()
 
@@ -910,31 +831,35 @@ class MainWindow(ctk.CTk):
 
         # 변환 중 표시할 다이얼로그
         progress_window = self.create_progress_dialog()
+
+        # 체크 상태를 섹션별로 한 번에 스냅샷 (변경 불가이므로 작업 스레드에 그대로 전달)
+        from conversion_payload import ConversionPayload
+        if self.state_manager:
+            payload = ConversionPayload.from_state_manager(self.state_manager, self.title1_nodes,
+                                                           self.company_name)
+        else:
+            payload = ConversionPayload.from_checked_keys((), self.title1_nodes, self.company_name)
         
         # 별도 스레드에서 변환 실행
         import threading
         
         def perform_conversion():
             try:
-                from hwp_converter import HWPConverter, check_hwp_available
+                from hwp_converter import HWPConverter, check_hwp_available, requires_hwp_program
                 
-                if not check_hwp_available():
+                if requires_hwp_program(self.hwp_file_path) and not check_hwp_available():
                     self.after(0, lambda: self.handle_conversion_error(progress_window, 
                         "한글(HWP) 프로그램이 설치되어 있지 않습니다."))
                     return
                 
-                converter = HWPConverter()
-                
-                # 체크된 항목 수집
-                checked_items_data = {
-                    'checked_items': list(self.state_manager.checked_items) if self.state_manager else []
-                }
+                from template_cache import get_template_cache
+                converter = HWPConverter(template_cache=get_template_cache())
                 
                 # HWP 변환 실행
                 success, message = converter.convert_checklist_to_hwp(
                     self.hwp_file_path,
                     self.company_name,
-                    checked_items_data,
+                    payload,
                     self.title1_nodes
                 )
                 
@@ -1047,6 +972,12 @@ class MainWindow(ctk.CTk):
         )
         close_button.pack(pady=(0, 20))
 
+    def on_close(self):
+        """Write pending state and close the window"""
+        if self.state_manager:
+            self.state_manager.close()
+        self.destroy()
+
     def run(self):
         """Start the application"""
         self.mainloop()
@@ -1,8 +1,27 @@
+import hashlib
 import json
-from typing import List, Dict, Any, Optional
+import mmap
+import os
+import re
+from array import array
+from bisect import bisect_left
+from typing import List, Dict, Any, Optional, Callable, Tuple, Set, Iterable
 from dataclasses import dataclass, field
 
 
+def _section_keys_bytes(section_id: str, items: List[str]) -> bytes:
+    """The "section_id::item_text" keys of a section, one per line, as hashed by get_items_digest"""
+    if not items:
+        return b""
+    prefix = f"{section_id}::"
+    return (prefix + f"\n{prefix}".join(items) + "\n").encode('utf-8')
+
+
+def item_key_hash(key: str) -> int:
+    """64-bit hash of a "section_id::item_text" key, as kept by lazy title1 skeletons"""
+    return int.from_bytes(hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
 @dataclass
 class ChecklistNode:
     """Base class for all checklist nodes"""
@@ -11,6 +30,11 @@ class ChecklistNode:
     type: str
     children: List['ChecklistNode'] = field(default_factory=list)
     parent: Optional['ChecklistNode'] = None
+    # Dense item range below this node, assigned by ChecklistParser (-1 = not indexed)
+    item_start: int = -1
+    item_count: int = 0
+    # Position among all nodes of the same type, assigned by ChecklistParser
+    ordinal: int = -1
 
     def __post_init__(self):
         # Set parent reference for all children
@@ -38,6 +62,119 @@ class Title1(ChecklistNode):
         """Get all title2 children"""
         return [child for child in self.children if isinstance(child, Title2)]
 
+    def get_total_items_count(self) -> int:
+        """Get total number of checklist items under this title1"""
+        if self.item_start >= 0:
+            return self.item_count
+        return sum(title2.get_total_items_count() for title2 in self.get_title2_children())
+
+    def get_checked_items_count(self, state_manager) -> int:
+        """Get number of checked items under this title1"""
+        return state_manager.count_checked(self)
+
+    def is_completed(self, state_manager) -> bool:
+        """Check if all items under this title1 are completed"""
+        return self.get_checked_items_count(state_manager) == self.get_total_items_count()
+
+    def get_node_counts(self) -> Tuple[int, int]:
+        """Get the number of title2 nodes and sections under this title1"""
+        title2_nodes = self.get_title2_children()
+        return len(title2_nodes), sum(len(title2.get_sections()) for title2 in title2_nodes)
+
+    def get_items_digest(self) -> str:
+        """Fingerprint of the "section_id::item_text" keys under this title1, in order"""
+        digest = hashlib.sha1()
+        for title2 in self.get_title2_children():
+            for section in title2.get_sections():
+                digest.update(_section_keys_bytes(section.id, section.items))
+        return digest.hexdigest()
+
+
+class LazyTitle1(Title1):
+    """Title1 whose title2/section subtree is parsed on first access.
+
+    Created by ChecklistParser.load_from_file(lazy=True) from a skeleton that
+    only holds the counts, item-key digest and sorted item-key hashes of the
+    subtree. Reading `children` (e.g. through get_title2_children()) calls
+    the loader once; callbacks in on_materialize then run with the node.
+    Comparing or printing a node never parses it.
+    """
+
+    def __init__(self, id: str, label: str, loader: Callable[['LazyTitle1'], List[ChecklistNode]],
+                 title2_count: int = 0, section_count: int = 0, item_count: int = 0,
+                 items_digest: str = "", item_hashes: Optional[array] = None):
+        super().__init__(id=id, label=label, item_count=item_count)
+        self._children: Optional[List[ChecklistNode]] = None
+        self._loader = loader
+        self.title2_count = title2_count
+        self.section_count = section_count
+        self.items_digest = items_digest
+        # item_key_hash() of every item key, sorted
+        self.item_hashes = item_hashes if item_hashes is not None else array('Q')
+        # (start, end) of the title1 element in the source file, set by ChecklistParser
+        self.byte_range: Optional[Tuple[int, int]] = None
+        # First title2/section ordinal of the subtree, assigned by ChecklistParser
+        self.title2_start = -1
+        self.section_start = -1
+        self.on_materialize: List[Callable[['LazyTitle1'], None]] = []
+
+    @property
+    def children(self) -> List[ChecklistNode]:
+        if self._children is None:
+            self._children = self._loader(self)
+            for callback in self.on_materialize:
+                callback(self)
+        return self._children
+
+    @children.setter
+    def children(self, value: List[ChecklistNode]):
+        self._children = value
+
+    @property
+    def is_materialized(self) -> bool:
+        """Whether the subtree has been parsed"""
+        return self._children is not None
+
+    def get_node_counts(self) -> Tuple[int, int]:
+        if not self.is_materialized:
+            return self.title2_count, self.section_count
+        return super().get_node_counts()
+
+    def get_items_digest(self) -> str:
+        if not self.is_materialized:
+            return self.items_digest
+        return super().get_items_digest()
+
+    def count_item_keys(self, keys: Iterable[str]) -> int:
+        """Count the items of this subtree among "section_id::item_text" keys, without parsing it.
+
+        An item text repeated in a section counts once per occurrence, as
+        with parsed nodes.
+        """
+        hashes = self.item_hashes
+        count = 0
+        for key in keys:
+            key_hash = item_key_hash(key)
+            position = bisect_left(hashes, key_hash)
+            while position < len(hashes) and hashes[position] == key_hash:
+                count += 1
+                position += 1
+        return count
+
+    def __eq__(self, other):
+        # By skeleton: the inherited dataclass __eq__ would compare (and parse) children
+        if not isinstance(other, LazyTitle1):
+            return NotImplemented
+        return (self.id, self.label, self.item_start, self.item_count, self.get_items_digest()) == \
+            (other.id, other.label, other.item_start, other.item_count, other.get_items_digest())
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        state = "materialized" if self.is_materialized else "unparsed"
+        return (f"LazyTitle1(id={self.id!r}, label={self.label!r}, item_start={self.item_start}, "
+                f"item_count={self.item_count}, {state})")
+
 
 @dataclass
 class Title2(ChecklistNode):
@@ -50,15 +187,13 @@ class Title2(ChecklistNode):
 
     def get_total_items_count(self) -> int:
         """Get total number of checklist items under this title2"""
+        if self.item_start >= 0:
+            return self.item_count
         return sum(len(section.items) for section in self.get_sections())
 
     def get_checked_items_count(self, state_manager) -> int:
         """Get number of checked items under this title2"""
-        count = 0
-        for section in self.get_sections():
-            count += sum(1 for item in section.items
-                        if state_manager.is_item_checked(section.id, item))
-        return count
+        return state_manager.count_checked(self)
 
     def is_completed(self, state_manager) -> bool:
         """Check if all items under this title2 are completed"""
@@ -71,10 +206,13 @@ class Section(ChecklistNode):
     type: str = "section"
     items: List[str] = field(default_factory=list)
 
+    def get_item_index(self, position: int) -> int:
+        """Get the dense checklist-wide index of the item at the given position"""
+        return self.item_start + position
+
     def get_checked_count(self, state_manager) -> int:
         """Get number of checked items in this section"""
-        return sum(1 for item in self.items
-                  if state_manager.is_item_checked(self.id, item))
+        return state_manager.count_checked(self)
 
     def get_total_count(self) -> int:
         """Get total number of items in this section"""
@@ -85,12 +223,128 @@ class Section(ChecklistNode):
         return self.get_checked_count(state_manager) == self.get_total_count()
 
 
+class ChecklistIndex:
+    """Flat lookup tables over an indexed checklist tree.
+
+    Built in a single document-order pass: id -> node, id -> path from the
+    title1 down to the node, section id -> item range, and flat lists of all
+    nodes, sections and items. Ids seen more than once are collected in
+    duplicate_ids (lookups return the first node with the id). Building the
+    index parses every lazy title1 subtree.
+    """
+
+    def __init__(self, title1_nodes: Iterable[Title1]):
+        self.nodes: List[ChecklistNode] = []
+        self.sections: List[Section] = []
+        self.items: List[str] = []
+        # Section ordinal of every item
+        self.item_sections = array('i')
+        self.duplicate_ids: Set[str] = set()
+        self._by_id: Dict[str, ChecklistNode] = {}
+        self._paths: Dict[str, Tuple[ChecklistNode, ...]] = {}
+
+        for title1 in title1_nodes:
+            self._add(title1, (title1,))
+            for title2 in title1.get_title2_children():
+                title2_path = (title1, title2)
+                self._add(title2, title2_path)
+                for section in title2.get_sections():
+                    self._add(section, title2_path + (section,))
+                    self.sections.append(section)
+                    self.items.extend(section.items)
+                    self.item_sections.extend([len(self.sections) - 1] * len(section.items))
+
+    def _add(self, node: ChecklistNode, path: Tuple[ChecklistNode, ...]):
+        self.nodes.append(node)
+        if node.id in self._by_id:
+            self.duplicate_ids.add(node.id)
+            return
+        self._by_id[node.id] = node
+        self._paths[node.id] = path
+
+    @staticmethod
+    def of(title1_nodes: List[Title1]) -> 'ChecklistIndex':
+        """Get the index of a parsed checklist, building one for plain node lists"""
+        if isinstance(title1_nodes, ChecklistTree):
+            return title1_nodes.checklist_index
+        return ChecklistIndex(title1_nodes)
+
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self._by_id
+
+    def get_node(self, node_id: str) -> Optional[ChecklistNode]:
+        """Get the node with the given id"""
+        return self._by_id.get(node_id)
+
+    def get_section(self, section_id: str) -> Optional['Section']:
+        """Get the section with the given id"""
+        node = self._by_id.get(section_id)
+        return node if isinstance(node, Section) else None
+
+    def get_path(self, node_id: str) -> Tuple[ChecklistNode, ...]:
+        """Get the nodes from the title1 down to the node with the given id"""
+        return self._paths.get(node_id, ())
+
+    def get_section_range(self, section_id: str) -> Optional[Tuple[int, int]]:
+        """Get (first item index, item count) of a section"""
+        section = self.get_section(section_id)
+        if section is None:
+            return None
+        return section.item_start, section.item_count
+
+    def get_item(self, index: int) -> Tuple['Section', str]:
+        """Get the section and text of the item with the given index"""
+        return self.sections[self.item_sections[index]], self.items[index]
+
+    def get_section_ids(self) -> List[str]:
+        """All section ids in document order"""
+        return [section.id for section in self.sections]
+
+
+class ChecklistTree(list):
+    """Title1 nodes returned by ChecklistParser, with their ChecklistIndex.
+
+    The index is built on first access of checklist_index. Duplicate ids
+    found while scanning a lazily loaded file are known without building it.
+    """
+
+    def __init__(self, nodes: Iterable[Title1] = (), duplicate_ids: Optional[Set[str]] = None):
+        super().__init__(nodes)
+        self._checklist_index: Optional[ChecklistIndex] = None
+        self._duplicate_ids = duplicate_ids
+
+    @property
+    def checklist_index(self) -> ChecklistIndex:
+        if self._checklist_index is None:
+            self._checklist_index = ChecklistIndex(self)
+        return self._checklist_index
+
+    @property
+    def duplicate_ids(self) -> Set[str]:
+        """Ids used by more than one node"""
+        if self._duplicate_ids is None:
+            self._duplicate_ids = self.checklist_index.duplicate_ids
+        return self._duplicate_ids
+
+
 class ChecklistParser:
     """Parser for checklist.json files"""
 
+    # Whitespace allowed between JSON values
+    _WHITESPACE = re.compile(rb'[ \t\n\r]*')
+    # Strings (skipped) and brackets, the tokens that delimit JSON values
+    _TOKENS = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|([\[{])|([\]}])', re.S)
+
     @staticmethod
-    def load_from_file(file_path: str) -> List[Title1]:
-        """Load checklist from JSON file"""
+    def load_from_file(file_path: str, lazy: bool = False) -> List[Title1]:
+        """Load checklist from JSON file.
+
+        With lazy=True only a skeleton of each title1 is built and its
+        subtree is parsed on first access (see load_lazy).
+        """
+        if lazy:
+            return ChecklistParser.load_lazy(file_path)
+
         with open(file_path, 'r', encoding='utf-8') as f:
             data = json.load(f)
 
@@ -99,13 +353,185 @@ class ChecklistParser:
     @staticmethod
     def parse_nodes(data: List[Dict[str, Any]]) -> List[Title1]:
         """Parse JSON data into node objects"""
-        nodes = []
+        nodes = ChecklistTree()
         for item in data:
             node = ChecklistParser._create_node(item)
             if node:
                 nodes.append(node)
+        ChecklistParser.assign_item_indices(nodes)
         return nodes
 
+    @staticmethod
+    def load_lazy(file_path: str) -> List[Title1]:
+        """Scan a checklist file into LazyTitle1 skeletons.
+
+        The file is memory-mapped and the top-level array is split at
+        bracket depth 0, so only one title1 element at a time is decoded;
+        it is reduced to its counts, item-key digest and hashes and its
+        byte range in the file, and then dropped. Item indices and ordinals
+        are assigned up front, so state can be bound before any subtree is
+        parsed. checklist_cache keeps the skeletons, so this scan only runs
+        when the file changed.
+        """
+        stat = os.stat(file_path)
+        nodes: List[Title1] = []
+        seen_ids: Set[str] = set()
+        duplicate_ids: Set[str] = set()
+        with open(file_path, 'rb') as f:
+            if stat.st_size == 0:
+                raise ValueError(f"{file_path}: checklist must be a JSON array")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                position = ChecklistParser._WHITESPACE.match(data).end()
+                if data[position:position + 1] != b'[':
+                    raise ValueError(f"{file_path}: checklist must be a JSON array")
+
+                depth = 0
+                element_start = position
+                for token in ChecklistParser._TOKENS.finditer(data, position + 1):
+                    if token.lastindex == 1:
+                        if depth == 0:
+                            element_start = token.start()
+                        depth += 1
+                    elif token.lastindex == 2:
+                        if depth == 0:
+                            # End of the top-level array
+                            break
+                        depth -= 1
+                        if depth == 0:
+                            byte_range = (element_start, token.end())
+                            element = json.loads(data[element_start:token.end()])
+                            if isinstance(element, dict) and element.get('type') == 'title1':
+                                nodes.append(ChecklistParser._create_skeleton(
+                                    element, file_path, stat, byte_range, seen_ids, duplicate_ids))
+                else:
+                    raise ValueError(f"{file_path}: unterminated checklist array")
+
+        ChecklistParser.assign_item_indices(nodes)
+        return ChecklistTree(nodes, duplicate_ids=duplicate_ids)
+
+    @staticmethod
+    def _create_skeleton(data: Dict[str, Any], file_path: str, stat: os.stat_result,
+                         byte_range: Tuple[int, int], seen_ids: Set[str],
+                         duplicate_ids: Set[str]) -> 'LazyTitle1':
+        """Reduce a decoded title1 element to a LazyTitle1 skeleton"""
+        def check_id(node_id: str):
+            if node_id in seen_ids:
+                duplicate_ids.add(node_id)
+            seen_ids.add(node_id)
+
+        title2_count = section_count = 0
+        digest = hashlib.sha1()
+        item_hashes = []
+        check_id(data['id'])
+        for title2 in data.get('children', []):
+            if title2.get('type') != 'title2':
+                continue
+            title2_count += 1
+            check_id(title2['id'])
+            for section in title2.get('children', []):
+                if section.get('type') != 'section':
+                    continue
+                section_count += 1
+                check_id(section['id'])
+                items = section.get('items', [])
+                digest.update(_section_keys_bytes(section['id'], items))
+                item_hashes.extend(item_key_hash(f"{section['id']}::{item}") for item in items)
+
+        return ChecklistParser.create_lazy_title1(
+            file_path, stat, byte_range, id=data['id'], label=data['label'],
+            title2_count=title2_count, section_count=section_count, item_count=len(item_hashes),
+            items_digest=digest.hexdigest(), item_hashes=array('Q', sorted(item_hashes)))
+
+    @staticmethod
+    def create_lazy_title1(file_path: str, stat: os.stat_result, byte_range: Tuple[int, int],
+                           **skeleton) -> 'LazyTitle1':
+        """Create a LazyTitle1 whose subtree is parsed from byte_range of the file.
+
+        stat is the file state the skeleton was read from; parsing fails if
+        the file changed since. skeleton holds the LazyTitle1 counts, digest
+        and hashes.
+        """
+        def load_children(title1: LazyTitle1) -> List[ChecklistNode]:
+            return ChecklistParser._load_subtree(title1, file_path, stat, byte_range)
+
+        title1 = LazyTitle1(loader=load_children, **skeleton)
+        title1.byte_range = byte_range
+        return title1
+
+    @staticmethod
+    def _load_subtree(title1: 'LazyTitle1', file_path: str, stat: os.stat_result,
+                      byte_range: Tuple[int, int]) -> List[ChecklistNode]:
+        """Parse the children of a lazy title1 from its byte range"""
+        current = os.stat(file_path)
+        if (current.st_size, current.st_mtime_ns) != (stat.st_size, stat.st_mtime_ns):
+            raise RuntimeError(f"{file_path} changed since it was loaded; reload the checklist")
+
+        start, end = byte_range
+        with open(file_path, 'rb') as f:
+            f.seek(start)
+            data = json.loads(f.read(end - start).decode('utf-8'))
+
+        children = [child for child in (ChecklistParser._create_node(child_data)
+                                        for child_data in data.get('children', []))
+                    if child is not None]
+        for child in children:
+            child.parent = title1
+        title1._children = children
+        ChecklistParser._assign_title1_indices(title1, title1.item_start,
+                                               title1.title2_start, title1.section_start)
+        return children
+
+    @staticmethod
+    def assign_item_indices(nodes: List[Title1]) -> int:
+        """Give every item a dense integer index in document order.
+
+        Each node gets the contiguous range of item indices below it
+        (item_start, item_count) and its ordinal among nodes of the same
+        type. Unparsed lazy subtrees are skipped using their skeleton
+        counts. Returns the total number of items.
+        """
+        next_index = 0
+        title2_ordinal = 0
+        section_ordinal = 0
+        for title1_ordinal, title1 in enumerate(nodes):
+            title1.ordinal = title1_ordinal
+            if isinstance(title1, LazyTitle1):
+                title1.title2_start = title2_ordinal
+                title1.section_start = section_ordinal
+                if not title1.is_materialized:
+                    title1.item_start = next_index
+                    next_index += title1.item_count
+                    title2_ordinal += title1.title2_count
+                    section_ordinal += title1.section_count
+                    continue
+            next_index, title2_ordinal, section_ordinal = ChecklistParser._assign_title1_indices(
+                title1, next_index, title2_ordinal, section_ordinal)
+        return next_index
+
+    @staticmethod
+    def _assign_title1_indices(title1: Title1, next_index: int, title2_ordinal: int,
+                               section_ordinal: int) -> Tuple[int, int, int]:
+        """Assign indices below one title1; returns the next free index and ordinals"""
+        title1.item_start = next_index
+        for title2 in title1.get_title2_children():
+            title2.ordinal = title2_ordinal
+            title2_ordinal += 1
+            title2.item_start = next_index
+            for section in title2.get_sections():
+                section.ordinal = section_ordinal
+                section_ordinal += 1
+                section.item_start = next_index
+                section.item_count = len(section.items)
+                next_index += section.item_count
+            title2.item_count = next_index - title2.item_start
+        title1.item_count = next_index - title1.item_start
+        return next_index, title2_ordinal, section_ordinal
+
+    @staticmethod
+    def is_indexed(nodes: List[Title1]) -> bool:
+        """Check whether item indices have been assigned to the nodes"""
+        return all(title1.item_start >= 0 for title1 in nodes)
+
     @staticmethod
     def _create_node(data: Dict[str, Any]) -> Optional[ChecklistNode]:
         """Create appropriate node type from dictionary data"""
@@ -134,14 +560,23 @@ class ChecklistParser:
 
     @staticmethod
     def validate_structure(nodes: List[Title1]) -> bool:
-        """Validate the checklist structure"""
+        """Validate the checklist structure (node types and unique ids)"""
         for title1 in nodes:
             if not isinstance(title1, Title1):
                 return False
+            if isinstance(title1, LazyTitle1) and not title1.is_materialized:
+                # The skeleton scan only counts title2/section nodes
+                continue
             for title2 in title1.get_title2_children():
                 if not isinstance(title2, Title2):
                     return False
                 for section in title2.get_sections():
                     if not isinstance(section, Section):
                         return False
+
+        duplicate_ids = nodes.duplicate_ids if isinstance(nodes, ChecklistTree) \
+            else ChecklistIndex(nodes).duplicate_ids
+        if duplicate_ids:
+            print(f"[ERROR] Duplicate checklist ids: {', '.join(sorted(duplicate_ids))}")
+            return False
         return True
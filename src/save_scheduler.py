@@ -0,0 +1,124 @@
+import atexit
+import threading
+import time
+import weakref
+from typing import Callable
+
+
+class SaveScheduler:
+    """Coalesces bursts of save requests into one background write.
+
+    mark_dirty() only flags the state; a worker thread runs the write once no
+    new request has arrived for `delay` seconds. flush() writes any pending
+    state right away and waits for an in-flight write, e.g. on window close.
+    A write that raises is retried after RETRY_DELAY seconds.
+    """
+
+    # Seconds an idle worker waits for new requests before exiting
+    IDLE_TIMEOUT = 5.0
+    # Seconds before a failed write is tried again
+    RETRY_DELAY = 2.0
+
+    def __init__(self, write: Callable[[], None], delay: float = 0.5):
+        self.write = write
+        self.delay = delay
+
+        self._condition = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._dirty = False
+        # A write taken over by the worker is running or about to start
+        self._writing = False
+        self._last_mark = 0.0
+        self._closed = False
+        self._worker = None
+
+        _schedulers.add(self)
+
+    def mark_dirty(self):
+        """Request a save; returns immediately"""
+        self._schedule(time.monotonic())
+
+    def _schedule(self, last_mark: float):
+        with self._condition:
+            if self._closed:
+                return
+            self._dirty = True
+            self._last_mark = max(self._last_mark, last_mark)
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, daemon=True)
+                self._worker.start()
+            self._condition.notify_all()
+
+    @property
+    def is_dirty(self) -> bool:
+        """Whether a requested save has not been started yet"""
+        return self._dirty
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._dirty and not self._closed:
+                    if not self._condition.wait(self.IDLE_TIMEOUT) and not self._dirty:
+                        # Idle: let the thread go, mark_dirty starts a new one
+                        self._worker = None
+                        return
+                if self._closed:
+                    self._worker = None
+                    return
+
+                # Wait for a quiet period so a burst of changes becomes one write
+                while self._dirty and not self._closed:
+                    remaining = self._last_mark + self.delay - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                if not self._dirty:
+                    continue
+                self._dirty = False
+                self._writing = True
+
+            try:
+                self._write()
+            finally:
+                with self._condition:
+                    self._writing = False
+                    self._condition.notify_all()
+
+    def _write(self):
+        with self._write_lock:
+            try:
+                self.write()
+            except Exception as e:
+                print(f"Error in scheduled save, retrying in {self.RETRY_DELAY:.0f}s: {e}")
+                # The state is still unsaved; write it again later
+                self._schedule(time.monotonic() + self.RETRY_DELAY - self.delay)
+
+    def flush(self):
+        """Write pending state now and wait for any write in progress"""
+        with self._condition:
+            # Wait for a write the worker has already taken; if it failed it is pending again
+            while self._writing:
+                self._condition.wait()
+            pending = self._dirty
+            self._dirty = False
+            self._condition.notify_all()
+
+        if pending:
+            self._write()
+
+    def close(self):
+        """Flush pending state and stop the worker"""
+        self.flush()
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+
+_schedulers = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_all():
+    """Don't lose a pending save when the interpreter exits"""
+    for scheduler in list(_schedulers):
+        scheduler.flush()
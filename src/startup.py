@@ -0,0 +1,154 @@
+import builtins
+import importlib
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class ImportTimer:
+    """Records how long each module takes to import.
+
+    Wraps builtins.__import__ while installed. Only first imports of absolute
+    module names are timed; for each one both the inclusive time and the
+    self time (excluding the modules it imported in turn) are kept.
+    """
+
+    def __init__(self):
+        # module name -> (inclusive seconds, self seconds)
+        self.timings: Dict[str, Tuple[float, float]] = {}
+        self._local = threading.local()
+        self._original_import = None
+
+    def install(self):
+        if self._original_import is None:
+            self._original_import = builtins.__import__
+            builtins.__import__ = self._import
+
+    def uninstall(self):
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def slowest(self, count: int = 15) -> List[Tuple[str, float, float]]:
+        """Modules with the largest self time, as (name, inclusive, self)"""
+        ranked = sorted(self.timings.items(), key=lambda entry: entry[1][1], reverse=True)
+        return [(name, inclusive, own) for name, (inclusive, own) in ranked[:count]]
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        original_import = self._original_import
+        if level or name in sys.modules or original_import is None:
+            return (original_import or builtins.__import__)(name, globals, locals, fromlist, level)
+
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        # Time spent in nested imports, subtracted to get the self time
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return original_import(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            self.timings.setdefault(name, (elapsed, elapsed - nested))
+
+
+class StartupProfile:
+    """Import timings and milestones of one application start (--startup-profile)"""
+
+    def __init__(self, start_time: Optional[float] = None):
+        self.start_time = time.perf_counter() if start_time is None else start_time
+        self.imports = ImportTimer()
+        # (milestone, seconds since start)
+        self.marks: List[Tuple[str, float]] = []
+
+    def mark(self, label: str) -> float:
+        elapsed = time.perf_counter() - self.start_time
+        self.marks.append((label, elapsed))
+        return elapsed
+
+    def report(self, count: int = 15):
+        """Print milestones and the slowest imports so far"""
+        print("[PROFILE] Startup milestones")
+        for label, elapsed in self.marks:
+            print(f"[PROFILE]   {elapsed * 1000:8.1f} ms  {label}")
+        print(f"[PROFILE] Slowest imports ({len(self.imports.timings)} modules, self / inclusive)")
+        for name, inclusive, own in self.imports.slowest(count):
+            print(f"[PROFILE]   {own * 1000:8.1f} ms / {inclusive * 1000:8.1f} ms  {name}")
+
+    def report_prefetch(self, prefetcher: "Prefetcher"):
+        """Print prefetch task times; startup is over, so import timing stops"""
+        self.imports.uninstall()
+        print("[PROFILE] Background prefetch")
+        for name, elapsed in prefetcher.timings.items():
+            status = "failed" if name in prefetcher.errors else "ok"
+            print(f"[PROFILE]   {elapsed * 1000:8.1f} ms  {name} ({status})")
+
+
+class Prefetcher:
+    """Runs deferred startup work on one background thread.
+
+    Tasks run in the order they were added, once start() is called (after
+    the first screen is drawn). result() waits for a single task, so work
+    that is needed early (the checklist) can be added first and picked up
+    as soon as it is done. Failures are kept and raised from result().
+    """
+
+    def __init__(self, on_complete: Optional[Callable[["Prefetcher"], None]] = None):
+        self.on_complete = on_complete
+        self.timings: Dict[str, float] = {}
+        self.errors: Dict[str, BaseException] = {}
+        self._tasks: List[Tuple[str, Callable[[], Any]]] = []
+        self._results: Dict[str, Any] = {}
+        self._done: Dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def add(self, name: str, task: Callable[[], Any]):
+        self._tasks.append((name, task))
+        self._done[name] = threading.Event()
+
+    def add_import(self, module_name: str):
+        """Import a module ahead of use; a missing optional module is not an error"""
+        def import_module():
+            try:
+                return importlib.import_module(module_name)
+            except ImportError as e:
+                print(f"[WARN] Prefetch skipped {module_name}: {e}")
+                return None
+
+        self.add(f"import {module_name}", import_module)
+
+    def start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+    def result(self, name: str, timeout: Optional[float] = None):
+        """Wait for a task (starting the prefetch if needed) and return its result"""
+        self.start()
+        if not self._done[name].wait(timeout):
+            raise TimeoutError(f"Prefetch task did not finish: {name}")
+        if name in self.errors:
+            raise self.errors[name]
+        return self._results.get(name)
+
+    @property
+    def is_complete(self) -> bool:
+        return all(event.is_set() for event in self._done.values())
+
+    def _run(self):
+        for name, task in self._tasks:
+            start = time.perf_counter()
+            try:
+                self._results[name] = task()
+            except Exception as e:
+                self.errors[name] = e
+            self.timings[name] = time.perf_counter() - start
+            self._done[name].set()
+        if self.on_complete:
+            self.on_complete(self)
@@ -1,17 +1,258 @@
-import json
+import hashlib
 import os
-from typing import Dict, Set, List
+import threading
+from array import array
+from bisect import bisect_right
+from contextlib import contextmanager
+from typing import Dict, Set, List, Tuple, Optional, Iterable, Iterator
 from datetime import datetime
 
+from models import ChecklistParser, Title1, LazyTitle1, Title2, Section
+from state_storage import create_state_storage
+from save_scheduler import SaveScheduler
+
+
+class ProgressIndex:
+    """Checked-item counters per section, title2 and title1.
+
+    Built from the bound checklist and then updated by StateManager on every
+    item change, so progress and completion queries are O(1). Title1 nodes
+    are registered one at a time, so a lazily loaded subtree is only indexed
+    once it has been parsed.
+    """
+
+    def __init__(self, title1_nodes: List[Title1], item_total: int):
+        self.title1_nodes: List[Title1] = list(title1_nodes)
+        title2_total = section_total = 0
+        for title1 in title1_nodes:
+            title2_count, section_count = title1.get_node_counts()
+            title2_total += title2_count
+            section_total += section_count
+        self.title2_nodes: List[Optional[Title2]] = [None] * title2_total
+        self.sections: List[Optional[Section]] = [None] * section_total
+        self.registered = [False] * len(self.title1_nodes)
+
+        # Owner ordinal of each item / section / title2 one level up
+        self.item_section = array('i', [-1]) * item_total
+        self.section_title2 = array('i', [-1]) * section_total
+        self.title2_title1 = array('i', [-1]) * title2_total
+
+        self.section_checked = array('i', [0]) * section_total
+        self.title2_checked = array('i', [0]) * title2_total
+        self.title1_checked = array('i', [0]) * len(self.title1_nodes)
+
+    def register_title1(self, title1: Title1, bits: bytearray):
+        """Index the subtree of a title1 and count its checked items"""
+        for title2 in title1.get_title2_children():
+            self.title2_nodes[title2.ordinal] = title2
+            self.title2_title1[title2.ordinal] = title1.ordinal
+            for section in title2.get_sections():
+                self.sections[section.ordinal] = section
+                self.section_title2[section.ordinal] = title2.ordinal
+                if section.item_count:
+                    self.item_section[section.item_start:section.item_start + section.item_count] = \
+                        array('i', [section.ordinal]) * section.item_count
+        self.registered[title1.ordinal] = True
+        self._recount_title1(title1, bits)
+
+    def recount(self, bits: bytearray):
+        """Recompute all counters from the item flags"""
+        for title1 in self.title1_nodes:
+            if self.registered[title1.ordinal]:
+                self._recount_title1(title1, bits)
+
+    def _recount_title1(self, title1: Title1, bits: bytearray):
+        title1_count = 0
+        for title2 in title1.get_title2_children():
+            title2_count = 0
+            for section in title2.get_sections():
+                count = bits.count(1, section.item_start, section.item_start + section.item_count)
+                self.section_checked[section.ordinal] = count
+                title2_count += count
+            self.title2_checked[title2.ordinal] = title2_count
+            title1_count += title2_count
+        self.title1_checked[title1.ordinal] = title1_count
+
+    def update(self, index: int, delta: int):
+        """Apply a +1/-1 change of the item with the given index"""
+        self.update_section(self.item_section[index], delta)
+
+    def update_section(self, section_ordinal: int, delta: int):
+        """Apply a change of `delta` checked items in the given section"""
+        if section_ordinal < 0 or not delta:
+            return
+        self.section_checked[section_ordinal] += delta
+        title2_ordinal = self.section_title2[section_ordinal]
+        self.title2_checked[title2_ordinal] += delta
+        self.title1_checked[self.title2_title1[title2_ordinal]] += delta
+
+    def get_checked_count(self, node) -> Optional[int]:
+        """Get the checked count of a node, or None if it is not indexed here"""
+        ordinal = node.ordinal
+        if isinstance(node, Section):
+            nodes, counts = self.sections, self.section_checked
+        elif isinstance(node, Title2):
+            nodes, counts = self.title2_nodes, self.title2_checked
+        else:
+            nodes, counts = self.title1_nodes, self.title1_checked
+        if 0 <= ordinal < len(nodes) and nodes[ordinal] is node:
+            if nodes is self.title1_nodes and not self.registered[ordinal]:
+                return None
+            return counts[ordinal]
+        return None
+
+
+class StateBatch:
+    """Item changes collected by StateManager.batch().
+
+    Flags are updated immediately, progress counters and persistence once
+    when the batch commits. changed_sections holds the ids of sections whose
+    state actually differs after the commit.
+    """
+
+    def __init__(self, state_manager: 'StateManager'):
+        self.state_manager = state_manager
+        self.changed_sections: Set[str] = set()
+        # First-seen value of every touched item / unindexed key, for net diff and rollback
+        self._original_bits: Dict[int, int] = {}
+        self._original_keys: Dict[str, bool] = {}
+
+    def set_item_checked(self, section_id: str, item_text: str, checked: bool):
+        """Set checked state for an item"""
+        manager = self.state_manager
+        indices = manager._key_index.get((section_id, item_text))
+        if indices is not None:
+            self.set_index_checked(indices[0], checked)
+            return
+
+        key = manager._generate_item_key(section_id, item_text)
+        with manager._state_lock:
+            self._original_keys.setdefault(key, key in manager._unindexed)
+            if checked:
+                manager._unindexed.add(key)
+            else:
+                manager._unindexed.discard(key)
+
+    def set_index_checked(self, index: int, checked: bool):
+        """Set checked state for the item with the given index (and items sharing its key)"""
+        manager = self.state_manager
+        manager._ensure_indexed(index)
+        with manager._state_lock:
+            bits = manager._bits
+            for sibling in manager._sibling_indices(index):
+                self._original_bits.setdefault(sibling, bits[sibling])
+                bits[sibling] = 1 if checked else 0
+
+    def set_section_checked(self, section_id: str, items: Iterable[str], checked: bool):
+        """Set checked state for all given items of a section"""
+        for item in items:
+            self.set_item_checked(section_id, item, checked)
+
+    def commit(self) -> Set[str]:
+        """Update progress counters and persist the net changes once"""
+        manager = self.state_manager
+        bits = manager._bits
+        progress = manager.progress
+
+        changes = []
+        section_deltas: Dict[int, int] = {}
+        for index, original in self._original_bits.items():
+            value = bits[index]
+            if value == original:
+                continue
+            changes.append((index, value == 1))
+            self.changed_sections.add(manager._item_keys[index][0])
+            if progress:
+                section_ordinal = progress.item_section[index]
+                section_deltas[section_ordinal] = section_deltas.get(section_ordinal, 0) + (1 if value else -1)
+
+        if progress:
+            for section_ordinal, delta in section_deltas.items():
+                progress.update_section(section_ordinal, delta)
+
+        keys_changed = False
+        for key, original in self._original_keys.items():
+            if (key in manager._unindexed) != original:
+                keys_changed = True
+                self.changed_sections.add(manager._split_item_key(key)[0])
+
+        if keys_changed:
+            manager.save_state()
+        elif changes:
+            manager._save_changes(changes)
+        return self.changed_sections
+
+    def rollback(self):
+        """Restore every touched item to its state before the batch"""
+        with self.state_manager._state_lock:
+            bits = self.state_manager._bits
+            for index, original in self._original_bits.items():
+                bits[index] = original
+            unindexed = self.state_manager._unindexed
+            for key, original in self._original_keys.items():
+                if original:
+                    unindexed.add(key)
+                else:
+                    unindexed.discard(key)
 
-class StateManager:
-    """Manages checklist state (checked items, progress, etc.)"""
 
-    def __init__(self, data_dir: str = "data", company_name: str = ""):
+class StateManager:
+    """Manages checklist state (checked items, progress, etc.)
+
+    Checked state is kept in a bytearray with one flag per checklist item,
+    addressed by the dense item index assigned by ChecklistParser. The
+    (section_id, item_text) API and the "section_id::item_text" keys of the
+    JSON state file are adapters on top of that index. Items of a section
+    that repeat the same text share one key, so their flags always change
+    together.
+
+    Subtrees of lazily loaded title1 nodes (models.LazyTitle1) are indexed
+    when they are first parsed; until then their checked keys are kept
+    with the unindexed ones.
+
+    storage_mode selects how state is persisted: "json" rewrites the state
+    file on every save, "journal" appends each change to a journal next to
+    it (see state_storage.JournalStateStorage), "sqlite" keeps all companies
+    in one database in data_dir (see state_storage.SqliteStateStorage).
+
+    save_state() doesn't write on the calling thread: a SaveScheduler
+    coalesces requests and writes after save_delay seconds of quiet on a
+    worker thread. Call flush() (or close()) before exiting. Pass
+    save_delay=None to write synchronously. Item flags and unindexed keys
+    are changed under _state_lock, and the state written is a snapshot
+    taken under it, so a save never sees a half-applied change.
+
+    read_only=True loads the state (replaying a journal in memory) and never
+    writes: nothing is saved, compacted or bound to the storage, so another
+    process can keep editing the same company.
+    """
+
+    def __init__(self, data_dir: str = "data", company_name: str = "",
+                 title1_nodes: Optional[List] = None, storage_mode: str = "json",
+                 save_delay: Optional[float] = 0.5, read_only: bool = False):
         self.data_dir = data_dir
         self.company_name = company_name
-        self.checked_items: Set[str] = set()
+        self.read_only = read_only
         self.state_file = self._get_state_file_path()
+        self.storage = create_state_storage(storage_mode, self.state_file,
+                                            data_dir=data_dir, company_name=company_name)
+        self._save_scheduler = SaveScheduler(self._save_snapshot, save_delay) \
+            if save_delay is not None and not read_only else None
+        # Guards _bits / _unindexed against the save and compaction threads
+        self._state_lock = threading.RLock()
+        # Journal records read at load time, replayed once a checklist is bound
+        self._pending_journal: Tuple[Optional[str], List[Tuple[int, bool]]] = (None, [])
+
+        # Bound checklist: item index -> flag, item index <-> (section_id, item_text)
+        self._bits = bytearray()
+        self._item_keys: List[Tuple[str, str]] = []
+        # (section_id, item_text) -> every item index with that key
+        self._key_index: Dict[Tuple[str, str], List[int]] = {}
+        # Checked keys that don't match any item of the bound checklist
+        self._unindexed: Set[str] = set()
+        self.progress: Optional[ProgressIndex] = None
+        self._title1_nodes: List[Title1] = []
+        self._title1_starts: List[int] = []
 
         # Ensure data directory exists
         os.makedirs(data_dir, exist_ok=True)
@@ -19,6 +260,9 @@ class StateManager:
         # Load existing state if available
         self.load_state()
 
+        if title1_nodes is not None:
+            self.bind_checklist(title1_nodes)
+
     def _get_state_file_path(self) -> str:
         """Get path for state file based on company name"""
         if self.company_name:
@@ -30,102 +274,400 @@ class StateManager:
         """Generate unique key for checklist item"""
         return f"{section_id}::{item_text}"
 
+    @staticmethod
+    def _split_item_key(key: str) -> Tuple[str, str]:
+        """Split a "section_id::item_text" key back into its parts"""
+        section_id, _, item_text = key.partition("::")
+        return section_id, item_text
+
+    def bind_checklist(self, title1_nodes: List):
+        """Index checked state by the dense item indices of the given checklist"""
+        if not ChecklistParser.is_indexed(title1_nodes):
+            ChecklistParser.assign_item_indices(title1_nodes)
+
+        checked_keys = self.checked_items
+        total_items = sum(title1.item_count for title1 in title1_nodes)
+
+        self._bits = bytearray(total_items)
+        self._item_keys = [("", "")] * total_items
+        self._key_index = {}
+        self._title1_nodes = list(title1_nodes)
+        self._title1_starts = [title1.item_start for title1 in title1_nodes]
+        self.progress = ProgressIndex(title1_nodes, total_items)
+        self._apply_keys(checked_keys)
+
+        for title1 in title1_nodes:
+            if isinstance(title1, LazyTitle1) and not title1.is_materialized:
+                title1.on_materialize.append(self._index_title1)
+            else:
+                self._index_title1(title1)
+        self._replay_pending_journal()
+
+    def _index_title1(self, title1: Title1):
+        """Index the items of one title1 and move its pending keys into the flags"""
+        ordinal = title1.ordinal
+        if self.progress is None or not (0 <= ordinal < len(self._title1_nodes)) \
+                or self._title1_nodes[ordinal] is not title1:
+            # Node of a checklist bound earlier
+            return
+        if self.progress.registered[ordinal]:
+            return
+        for title2 in title1.get_title2_children():
+            for section in title2.get_sections():
+                for position, item in enumerate(section.items):
+                    index = section.item_start + position
+                    key = (section.id, item)
+                    self._item_keys[index] = key
+                    self._key_index.setdefault(key, []).append(index)
+
+        with self._state_lock:
+            for key in list(self._unindexed):
+                indices = self._key_index.get(self._split_item_key(key))
+                if indices is not None and title1.item_start <= indices[0] < title1.item_start + title1.item_count:
+                    for index in indices:
+                        self._bits[index] = 1
+                    self._unindexed.discard(key)
+        self.progress.register_title1(title1, self._bits)
+
+    def _ensure_indexed(self, index: int):
+        """Parse the lazy title1 that owns an item index, if it isn't indexed yet"""
+        if self.progress is None or self.progress.item_section[index] >= 0:
+            return
+        position = bisect_right(self._title1_starts, index) - 1
+        if position >= 0:
+            # Materializing runs _index_title1 through on_materialize
+            self._title1_nodes[position].get_title2_children()
+
+    def _replay_pending_journal(self):
+        """Apply journal records read at load time to the bound checklist"""
+        signature = self._checklist_signature()
+        journal_signature, changes = self._pending_journal
+        self._pending_journal = (None, [])
+        if changes and journal_signature == signature:
+            for index, checked in changes:
+                if index < len(self._bits):
+                    self._ensure_indexed(index)
+                    self._set_index(index, checked)
+        elif changes:
+            print("Warning: State journal was written for a different checklist, ignoring it")
+
+        if self.read_only:
+            return
+        self.storage.bind(signature, self._build_state_data)
+        if journal_signature is not None:
+            # Fold the replayed journal into the snapshot
+            self.save_state()
+
+    def _checklist_signature(self) -> str:
+        """Fingerprint of the bound item order, stored with journal records.
+
+        Combines the per-title1 item digests, which lazy title1 nodes know
+        without parsing their subtree.
+        """
+        digest = hashlib.sha1()
+        for title1 in self._title1_nodes:
+            digest.update(title1.get_items_digest().encode('ascii'))
+        return digest.hexdigest()[:16]
+
+    def _apply_keys(self, keys: Iterable[str]):
+        """Replace current state with the given "section_id::item_text" keys"""
+        bits = bytearray(len(self._bits))
+        unindexed = set()
+        for key in keys:
+            indices = self._key_index.get(self._split_item_key(key))
+            if indices is None:
+                unindexed.add(key)
+            else:
+                for index in indices:
+                    bits[index] = 1
+        with self._state_lock:
+            self._bits = bits
+            self._unindexed = unindexed
+        if self.progress:
+            self.progress.recount(self._bits)
+
+    @property
+    def checked_items(self) -> Set[str]:
+        """All checked items as "section_id::item_text" keys"""
+        return set(self._ordered_checked_keys())
+
+    @checked_items.setter
+    def checked_items(self, keys: Iterable[str]):
+        self._apply_keys(keys)
+
+    @property
+    def item_count(self) -> int:
+        """Number of items in the bound checklist"""
+        return len(self._bits)
+
+    def get_item_index(self, section_id: str, item_text: str) -> Optional[int]:
+        """Get the dense item index for an item, or None if it is not indexed.
+
+        For an item text that occurs more than once in the section this is
+        the first occurrence.
+        """
+        indices = self._key_index.get((section_id, item_text))
+        return indices[0] if indices else None
+
+    def _sibling_indices(self, index: int) -> List[int]:
+        """The item index and every other index with the same key"""
+        return self._key_index.get(self._item_keys[index], [index])
+
+    def is_index_checked(self, index: int) -> bool:
+        """Check if the item with the given index is checked"""
+        self._ensure_indexed(index)
+        return self._bits[index] == 1
+
+    def set_index_checked(self, index: int, checked: bool, save: bool = True):
+        """Set checked state for the item with the given index"""
+        self._ensure_indexed(index)
+        changes = [(sibling, checked) for sibling in self._sibling_indices(index)
+                   if self._set_index(sibling, checked)]
+        if changes and save:
+            self._save_changes(changes)
+
+    def _save_changes(self, changes: List[Tuple[int, bool]]):
+        """Persist item changes, incrementally if the storage supports it"""
+        if self.read_only:
+            return
+        try:
+            records = [(index, self._generate_item_key(*self._item_keys[index]), checked)
+                       for index, checked in changes]
+            if self.storage.append_changes(records):
+                return
+        except Exception as e:
+            print(f"Error saving state: {e}")
+        self.save_state()
+
+    def _set_index(self, index: int, checked: bool) -> bool:
+        """Update the flag of an item and its progress counters; returns True if it changed"""
+        value = 1 if checked else 0
+        if self._bits[index] == value:
+            return False
+        with self._state_lock:
+            self._bits[index] = value
+        if self.progress:
+            self.progress.update(index, 1 if value else -1)
+        return True
+
+    def count_checked(self, node) -> int:
+        """Get number of checked items under a checklist node"""
+        if self.progress:
+            count = self.progress.get_checked_count(node)
+            if count is not None:
+                return count
+            if isinstance(node, LazyTitle1) and not node.is_materialized \
+                    and 0 <= node.ordinal < len(self._title1_nodes) \
+                    and self._title1_nodes[node.ordinal] is node:
+                # Checked keys of an unparsed subtree are all still pending
+                with self._state_lock:
+                    unindexed = list(self._unindexed)
+                return node.count_item_keys(unindexed)
+
+        end = node.item_start + node.item_count
+        if node.item_start >= 0 and end <= len(self._bits):
+            return self._bits.count(1, node.item_start, end)
+
+        # Node is not part of the bound checklist: fall back to key lookups
+        if isinstance(node, Section):
+            sections = [node]
+        elif isinstance(node, Title2):
+            sections = node.get_sections()
+        else:
+            sections = [section for title2 in node.get_title2_children()
+                        for section in title2.get_sections()]
+        return sum(1 for section in sections for item in section.items
+                   if self.is_item_checked(section.id, item))
+
     def is_item_checked(self, section_id: str, item_text: str) -> bool:
         """Check if an item is checked"""
+        indices = self._key_index.get((section_id, item_text))
+        if indices is not None:
+            return self._bits[indices[0]] == 1
+        return self._generate_item_key(section_id, item_text) in self._unindexed
+
+    def _set_item(self, section_id: str, item_text: str, checked: bool) -> Optional[List[int]]:
+        """Update checked state for an item in memory; returns its indices if indexed"""
+        indices = self._key_index.get((section_id, item_text))
+        if indices is not None:
+            for index in indices:
+                self._set_index(index, checked)
+            return indices
+
         key = self._generate_item_key(section_id, item_text)
-        return key in self.checked_items
+        with self._state_lock:
+            if checked:
+                self._unindexed.add(key)
+            else:
+                self._unindexed.discard(key)
+        return None
 
     def set_item_checked(self, section_id: str, item_text: str, checked: bool):
         """Set checked state for an item and save"""
-        key = self._generate_item_key(section_id, item_text)
-        if checked:
-            self.checked_items.add(key)
-        else:
-            self.checked_items.discard(key)
+        indices = self._set_item(section_id, item_text, checked)
 
         # Auto-save after state change
-        self.save_state()
+        if indices is not None:
+            self._save_changes([(index, checked) for index in indices])
+        else:
+            self.save_state()
 
     def set_item_checked_no_save(self, section_id: str, item_text: str, checked: bool):
         """Set checked state for an item without saving (performance optimization)"""
-        key = self._generate_item_key(section_id, item_text)
-        if checked:
-            self.checked_items.add(key)
-        else:
-            self.checked_items.discard(key)
+        self._set_item(section_id, item_text, checked)
 
     def toggle_item(self, section_id: str, item_text: str):
         """Toggle checked state for an item"""
         current_state = self.is_item_checked(section_id, item_text)
         self.set_item_checked(section_id, item_text, not current_state)
 
-    def check_all_section(self, section_id: str, items: List[str]):
+    @contextmanager
+    def batch(self) -> Iterator[StateBatch]:
+        """Apply many changes as one transaction.
+
+        Progress counters are updated and state is persisted once when the
+        block exits; if it raises, all changes are rolled back. Counters are
+        not updated inside the block.
+        """
+        batch = StateBatch(self)
+        try:
+            yield batch
+        except BaseException:
+            batch.rollback()
+            raise
+        batch.commit()
+
+    def apply_changes(self, changes: Iterable[Tuple[str, str, bool]]) -> Set[str]:
+        """Apply (section_id, item_text, checked) changes in one batch.
+
+        Returns the ids of sections whose state actually changed.
+        """
+        with self.batch() as batch:
+            for section_id, item_text, checked in changes:
+                batch.set_item_checked(section_id, item_text, checked)
+        return batch.changed_sections
+
+    def check_all_section(self, section_id: str, items: List[str]) -> Set[str]:
         """Check all items in a section"""
-        for item in items:
-            self.set_item_checked(section_id, item, True)
+        return self.apply_changes((section_id, item, True) for item in items)
 
-    def uncheck_all_section(self, section_id: str, items: List[str]):
+    def uncheck_all_section(self, section_id: str, items: List[str]) -> Set[str]:
         """Uncheck all items in a section"""
-        for item in items:
-            self.set_item_checked(section_id, item, False)
+        return self.apply_changes((section_id, item, False) for item in items)
 
     def get_section_progress(self, section_id: str, items: List[str]) -> tuple[int, int]:
         """Get progress for a section (checked_count, total_count)"""
+        section = self._find_section(section_id, items)
+        if section is not None:
+            return self.count_checked(section), section.item_count
+
+        # Section is not indexed (yet): fall back to key lookups
         checked_count = sum(1 for item in items if self.is_item_checked(section_id, item))
         return checked_count, len(items)
 
+    def _find_section(self, section_id: str, items: List[str]) -> Optional[Section]:
+        """Indexed section node with the given id and items, found through its first item"""
+        if self.progress is None or not items:
+            return None
+        indices = self._key_index.get((section_id, items[0]))
+        if not indices:
+            return None
+        ordinal = self.progress.item_section[indices[0]]
+        section = self.progress.sections[ordinal] if ordinal >= 0 else None
+        if section is None or section.id != section_id or section.item_count != len(items):
+            return None
+        return section
+
     def get_overall_progress(self, title1_nodes) -> tuple[int, int]:
         """Get overall progress across all title1 nodes"""
         total_checked = 0
         total_items = 0
 
         for title1 in title1_nodes:
-            for title2 in title1.get_title2_children():
-                for section in title2.get_sections():
-                    checked, total = self.get_section_progress(section.id, section.items)
-                    total_checked += checked
-                    total_items += total
+            total_checked += self.count_checked(title1)
+            total_items += title1.get_total_items_count()
 
         return total_checked, total_items
 
-    def save_state(self):
-        """Save current state to file"""
-        state_data = {
+    def _ordered_checked_keys(self) -> List[str]:
+        """Checked keys in checklist order, followed by keys outside the checklist"""
+        # Snapshot, so UI-thread changes can't interfere while the keys are built
+        with self._state_lock:
+            bits = bytes(self._bits)
+            unindexed = sorted(self._unindexed)
+        keys = []
+        item_keys = self._item_keys
+        index = bits.find(1)
+        while index != -1:
+            keys.append(self._generate_item_key(*item_keys[index]))
+            index = bits.find(1, index + 1)
+        keys.extend(unindexed)
+        # Repeated item texts of a section share one key
+        return list(dict.fromkeys(keys))
+
+    def _build_state_data(self) -> Dict:
+        """Build the JSON state document"""
+        return {
             "company_name": self.company_name,
-            "checked_items": list(self.checked_items),
+            "checked_items": self._ordered_checked_keys(),
             "last_saved": datetime.now().isoformat(),
             "version": "1.0"
         }
 
+    def save_state(self):
+        """Save current state to file (in the background if a save scheduler is used)"""
+        if self.read_only:
+            return
+        if self._save_scheduler:
+            self._save_scheduler.mark_dirty()
+        else:
+            self._write_state()
+
+    def _save_snapshot(self):
+        """Write current state through the storage backend; errors propagate"""
+        self.storage.save(self._build_state_data)
+
+    def _write_state(self):
+        """Write current state through the storage backend"""
         try:
-            with open(self.state_file, 'w', encoding='utf-8') as f:
-                json.dump(state_data, f, ensure_ascii=False, indent=2)
+            self._save_snapshot()
         except Exception as e:
             print(f"Error saving state: {e}")
 
+    def flush(self):
+        """Write any pending state now and wait until it is on disk"""
+        if self._save_scheduler:
+            self._save_scheduler.flush()
+
+    def close(self):
+        """Flush pending state and release storage resources"""
+        if self._save_scheduler:
+            self._save_scheduler.close()
+        self.storage.close()
+
     def load_state(self):
         """Load state from file"""
-        if not os.path.exists(self.state_file):
-            return
-
         try:
-            with open(self.state_file, 'r', encoding='utf-8') as f:
-                state_data = json.load(f)
+            self._pending_journal = self.storage.read_journal()
+            state_data = self.storage.load()
+            if state_data is not None:
+                self._apply_keys(state_data.get('checked_items', []))
+                loaded_company = state_data.get('company_name', '')
 
-            self.checked_items = set(state_data.get('checked_items', []))
-            loaded_company = state_data.get('company_name', '')
+                # If company name doesn't match, this might be an old state file
+                if loaded_company and loaded_company != self.company_name:
+                    print(f"Warning: State file company '{loaded_company}' doesn't match current '{self.company_name}'")
 
-            # If company name doesn't match, this might be an old state file
-            if loaded_company and loaded_company != self.company_name:
-                print(f"Warning: State file company '{loaded_company}' doesn't match current '{self.company_name}'")
+            if self.progress:
+                self._replay_pending_journal()
 
         except Exception as e:
             print(f"Error loading state: {e}")
-            self.checked_items = set()
+            self._apply_keys([])
 
     def clear_state(self):
         """Clear all checked items"""
-        self.checked_items.clear()
+        self._apply_keys([])
         self.save_state()
 
     def export_summary(self, title1_nodes) -> str:
@@ -137,7 +679,7 @@ class StateManager:
         lines.append("=" * 50)
 
         for title1 in title1_nodes:
-            title1_checked, title1_total = self.get_overall_progress([title1])
+            title1_checked = self.count_checked(title1)
 
             if title1_checked > 0:
                 lines.append(f"\n📋 {title1.label}")
@@ -148,7 +690,7 @@ class StateManager:
                     title2_total = title2.get_total_items_count()
 
                     if title2_checked > 0:
-                        status = "✓" if title2.is_completed(self) else f"{title2_checked}/{title2_total}"
+                        status = "✓" if title2_checked == title2_total else f"{title2_checked}/{title2_total}"
                         lines.append(f"  {status} {title2.label}")
 
                         for section in title2.get_sections():
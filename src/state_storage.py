@@ -0,0 +1,387 @@
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+from datetime import datetime
+from typing import Dict, List, Tuple, Optional, Callable
+
+
+JOURNAL_HEADER = "# easy_report journal v1"
+STATE_DB_NAME = "state.db"
+
+
+def write_file_atomic(file_path: str, data: bytes, fsync: bool = True):
+    """Replace a file atomically: write a temp file, fsync it, rename it over the target.
+
+    A crash leaves either the old or the new file, never a truncated one.
+    """
+    directory = os.path.dirname(file_path) or "."
+    fd, temp_path = tempfile.mkstemp(prefix=os.path.basename(file_path) + ".",
+                                     suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(temp_path, file_path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+class JsonStateStorage:
+    """Stores the whole state as a single JSON snapshot (state_<company>.json)"""
+
+    def __init__(self, state_file: str):
+        self.state_file = state_file
+
+    def load(self) -> Optional[Dict]:
+        """Load the snapshot, or None if there is none"""
+        if not os.path.exists(self.state_file):
+            return None
+        with open(self.state_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def read_journal(self) -> Tuple[Optional[str], List[Tuple[int, bool]]]:
+        """Get (checklist signature, changes) recorded since the snapshot"""
+        return None, []
+
+    def bind(self, signature: str, build_state: Callable[[], Dict]):
+        """Set the checklist signature item indices refer to and the snapshot source"""
+
+    def write_snapshot(self, state_data: Dict):
+        """Write the full state"""
+        data = json.dumps(state_data, ensure_ascii=False, indent=2).encode('utf-8')
+        write_file_atomic(self.state_file, data)
+
+    def save(self, build_state: Callable[[], Dict]):
+        """Persist the full state produced by build_state"""
+        self.write_snapshot(build_state())
+
+    def append_changes(self, changes: List[Tuple[int, str, bool]]) -> bool:
+        """Record (index, key, checked) item changes incrementally.
+
+        Returns False if a full save is needed instead.
+        """
+        return False
+
+    def close(self):
+        """Release any open files"""
+
+
+class JournalStateStorage(JsonStateStorage):
+    """JSON snapshot plus an append-only journal of item changes.
+
+    Every change appends one "+<index>" / "-<index>" line to
+    state_<company>.journal, so saving costs the same no matter how big the
+    checklist is. Once the journal grows past compact_threshold bytes it is
+    folded back into the snapshot on a background thread. Records hold
+    absolute values, so replaying the whole journal over a snapshot that
+    already contains some of it still gives the right state.
+    """
+
+    def __init__(self, state_file: str, compact_threshold: int = 64 * 1024,
+                 fsync: bool = False):
+        super().__init__(state_file)
+        self.journal_file = os.path.splitext(state_file)[0] + ".journal"
+        self.compact_threshold = compact_threshold
+        self.fsync = fsync
+        self.signature: Optional[str] = None
+        self.build_state: Optional[Callable[[], Dict]] = None
+
+        self._lock = threading.Lock()
+        self._compact_lock = threading.Lock()
+        self._journal = None
+        self._compacting = False
+
+    def _header(self) -> bytes:
+        return f"{JOURNAL_HEADER} {self.signature}\n".encode('utf-8')
+
+    def read_journal(self) -> Tuple[Optional[str], List[Tuple[int, bool]]]:
+        """Get (checklist signature, changes) recorded since the snapshot"""
+        if not os.path.exists(self.journal_file):
+            return None, []
+
+        with open(self.journal_file, 'rb') as f:
+            content = f.read().decode('utf-8', errors='replace')
+
+        lines = content.split("\n")
+        # A line without a trailing newline was cut off by a crash
+        lines.pop()
+
+        signature = None
+        changes = []
+        for line in lines:
+            if line.startswith(JOURNAL_HEADER):
+                signature = line[len(JOURNAL_HEADER):].strip()
+            elif line[:1] in ("+", "-") and line[1:].isdigit():
+                changes.append((int(line[1:]), line[0] == "+"))
+        return signature, changes
+
+    def bind(self, signature: str, build_state: Callable[[], Dict]):
+        """Set the checklist signature item indices refer to and the snapshot source"""
+        self.signature = signature
+        self.build_state = build_state
+
+    def save(self, build_state: Callable[[], Dict]):
+        """Write a snapshot and drop the journal records it contains"""
+        self._compact(build_state)
+
+    def append_changes(self, changes: List[Tuple[int, str, bool]]) -> bool:
+        """Append item changes to the journal"""
+        if self.signature is None:
+            return False
+
+        records = "".join(f"{'+' if checked else '-'}{index}\n" for index, _, checked in changes)
+        with self._lock:
+            if self._journal is None:
+                if not os.path.exists(self.journal_file):
+                    write_file_atomic(self.journal_file, self._header(), fsync=self.fsync)
+                self._journal = open(self.journal_file, 'ab')
+            self._journal.write(records.encode('ascii'))
+            self._journal.flush()
+            if self.fsync:
+                os.fsync(self._journal.fileno())
+            needs_compaction = (self._journal.tell() > self.compact_threshold
+                                and not self._compacting and self.build_state is not None)
+            if needs_compaction:
+                self._compacting = True
+
+        if needs_compaction:
+            threading.Thread(target=self._compact_in_background, args=(self.build_state,),
+                             daemon=True).start()
+        return True
+
+    def _compact(self, build_state: Callable[[], Dict]):
+        """Fold the journal into the snapshot; errors propagate to the caller"""
+        with self._compact_lock:
+            self._compact_locked(build_state)
+
+    def _compact_in_background(self, build_state: Callable[[], Dict]):
+        try:
+            self._compact(build_state)
+        except Exception as e:
+            # The journal still holds every record, so nothing is lost
+            print(f"Error compacting state journal: {e}")
+
+    def _compact_locked(self, build_state: Callable[[], Dict]):
+        try:
+            with self._lock:
+                self._compacting = True
+                offset = self._journal_size()
+
+            # Records appended from here on stay in the journal
+            self.write_snapshot(build_state())
+
+            with self._lock:
+                tail = b""
+                if offset and os.path.exists(self.journal_file):
+                    with open(self.journal_file, 'rb') as f:
+                        f.seek(offset)
+                        tail = f.read()
+                if self._journal is not None:
+                    self._journal.close()
+                    self._journal = None
+                # Without a bound checklist the records can't be read back yet
+                if self.signature is not None:
+                    write_file_atomic(self.journal_file, self._header() + tail, fsync=self.fsync)
+        finally:
+            self._compacting = False
+
+    def _journal_size(self) -> int:
+        if self._journal is not None:
+            self._journal.flush()
+        try:
+            return os.path.getsize(self.journal_file)
+        except OSError:
+            return 0
+
+    def close(self):
+        """Close the journal file"""
+        with self._lock:
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+
+
+class SqliteStateStorage(JsonStateStorage):
+    """Keeps the state of every company in one SQLite database.
+
+    Companies are looked up through a unique index on their name and each
+    checked item is one (company_id, item_key) row, so a toggle is a single
+    INSERT/DELETE. The database runs in WAL mode; the connection is shared
+    with the save scheduler thread behind a lock.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS companies (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL UNIQUE,
+            last_saved TEXT,
+            version TEXT
+        );
+        CREATE TABLE IF NOT EXISTS checked_items (
+            company_id INTEGER NOT NULL REFERENCES companies(id) ON DELETE CASCADE,
+            item_key TEXT NOT NULL,
+            PRIMARY KEY (company_id, item_key)
+        ) WITHOUT ROWID;
+    """
+
+    def __init__(self, db_path: str, company_name: str):
+        super().__init__(db_path)
+        self.db_path = db_path
+        self.company_name = company_name
+        self._lock = threading.Lock()
+        self._connection = connect_state_db(db_path)
+
+    def _company_id(self, create: bool = False) -> Optional[int]:
+        row = self._connection.execute(
+            "SELECT id FROM companies WHERE name = ?", (self.company_name,)).fetchone()
+        if row:
+            return row[0]
+        if not create:
+            return None
+        cursor = self._connection.execute(
+            "INSERT INTO companies (name, version) VALUES (?, ?)", (self.company_name, "1.0"))
+        return cursor.lastrowid
+
+    def load(self) -> Optional[Dict]:
+        """Load the company's state, or None if it has none"""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT id, last_saved, version FROM companies WHERE name = ?",
+                (self.company_name,)).fetchone()
+            if row is None:
+                return None
+            company_id, last_saved, version = row
+            keys = [key for (key,) in self._connection.execute(
+                "SELECT item_key FROM checked_items WHERE company_id = ?", (company_id,))]
+        return {
+            "company_name": self.company_name,
+            "checked_items": keys,
+            "last_saved": last_saved,
+            "version": version
+        }
+
+    def write_snapshot(self, state_data: Dict):
+        """Replace the company's checked items"""
+        with self._lock, self._connection:
+            company_id = self._company_id(create=True)
+            self._connection.execute(
+                "UPDATE companies SET last_saved = ?, version = ? WHERE id = ?",
+                (state_data.get("last_saved"), state_data.get("version", "1.0"), company_id))
+            self._connection.execute("DELETE FROM checked_items WHERE company_id = ?", (company_id,))
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO checked_items (company_id, item_key) VALUES (?, ?)",
+                ((company_id, key) for key in state_data.get("checked_items", [])))
+
+    def append_changes(self, changes: List[Tuple[int, str, bool]]) -> bool:
+        """Insert/delete the changed item rows in one transaction"""
+        with self._lock, self._connection:
+            company_id = self._company_id(create=True)
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO checked_items (company_id, item_key) VALUES (?, ?)",
+                ((company_id, key) for _, key, checked in changes if checked))
+            self._connection.executemany(
+                "DELETE FROM checked_items WHERE company_id = ? AND item_key = ?",
+                ((company_id, key) for _, key, checked in changes if not checked))
+            self._connection.execute(
+                "UPDATE companies SET last_saved = ? WHERE id = ?",
+                (datetime.now().isoformat(), company_id))
+        return True
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._connection.close()
+
+
+def connect_state_db(db_path: str) -> sqlite3.Connection:
+    """Open the state database in WAL mode, creating the schema if needed"""
+    connection = sqlite3.connect(db_path, check_same_thread=False)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.execute("PRAGMA foreign_keys=ON")
+    connection.executescript(SqliteStateStorage.SCHEMA)
+    return connection
+
+
+def list_companies(db_path: str, name_filter: str = "") -> List[Dict]:
+    """List companies in the state database with their checked item counts"""
+    connection = connect_state_db(db_path)
+    try:
+        rows = connection.execute(
+            """
+            SELECT c.name, c.last_saved, COUNT(i.item_key)
+            FROM companies c LEFT JOIN checked_items i ON i.company_id = c.id
+            WHERE c.name LIKE ?
+            GROUP BY c.id
+            ORDER BY c.name
+            """, (f"%{name_filter}%",)).fetchall()
+    finally:
+        connection.close()
+    return [{"company_name": name, "last_saved": last_saved, "checked_count": count}
+            for name, last_saved, count in rows]
+
+
+def import_json_states(data_dir: str, db_path: Optional[str] = None,
+                       overwrite: bool = False) -> int:
+    """Import existing state_<company>.json files into the state database.
+
+    Companies already in the database are skipped unless overwrite is set.
+    Journals are not imported: open the company once in journal mode to fold
+    its journal into the JSON file first. Returns the number of companies
+    imported.
+    """
+    db_path = db_path or os.path.join(data_dir, STATE_DB_NAME)
+    imported = 0
+    for file_name in sorted(os.listdir(data_dir)):
+        if not (file_name.startswith("state_") and file_name.endswith(".json")):
+            continue
+
+        file_path = os.path.join(data_dir, file_name)
+        if os.path.exists(os.path.splitext(file_path)[0] + ".journal"):
+            print(f"Warning: {file_name} has an unfolded journal, importing the snapshot only")
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                state_data = json.load(f)
+        except Exception as e:
+            print(f"Error importing {file_name}: {e}")
+            continue
+
+        company_name = state_data.get("company_name") or file_name[len("state_"):-len(".json")]
+        storage = SqliteStateStorage(db_path, company_name)
+        try:
+            if storage.load() is not None and not overwrite:
+                continue
+            storage.write_snapshot(state_data)
+            imported += 1
+        finally:
+            storage.close()
+    return imported
+
+
+def create_state_storage(storage_mode: str, state_file: str, data_dir: str = "data",
+                         company_name: str = "") -> JsonStateStorage:
+    """Create the storage backend for the given mode ("json", "journal" or "sqlite")"""
+    if storage_mode == "journal":
+        return JournalStateStorage(state_file)
+    if storage_mode == "json":
+        return JsonStateStorage(state_file)
+    if storage_mode == "sqlite":
+        return SqliteStateStorage(os.path.join(data_dir, STATE_DB_NAME), company_name)
+    raise ValueError(f"Unknown storage mode: {storage_mode}")
+
+
+if __name__ == "__main__":
+    import sys
+
+    # python src/state_storage.py <data_dir>: one-shot import of JSON state files
+    source_dir = sys.argv[1] if len(sys.argv) > 1 else "data"
+    count = import_json_states(source_dir)
+    print(f"[OK] Imported {count} companies into {os.path.join(source_dir, STATE_DB_NAME)}")
@@ -0,0 +1,305 @@
+import time
+from typing import Iterator, List, Optional
+
+import customtkinter as ctk
+
+from models import Title1, Section
+from wrap_layout import WrapLengthManager
+
+
+class _SummaryCard:
+    """One title1 card of the summary and the generator that fills it"""
+
+    def __init__(self, index: int, title1: Title1):
+        self.index = index
+        self.title1 = title1
+        self.frame: Optional[ctk.CTkFrame] = None
+        self.content: Optional[ctk.CTkFrame] = None
+        self.toggle_button: Optional[ctk.CTkButton] = None
+        self.builder: Optional[Iterator[None]] = None
+        self.expanded = True
+        self.complete = False
+
+
+class HierarchicalSummary:
+    """Final review summary of checked items, built incrementally.
+
+    All title1 cards are created up front with just their headers. Their
+    title2, section and item widgets are created by one generator per card,
+    advanced from idle callbacks for at most FRAME_BUDGET seconds at a time
+    so the window keeps responding. Cards can be collapsed; a collapsed
+    card's generator is paused, so its items are only built once it is
+    expanded again.
+    """
+
+    # Seconds of widget building per idle callback
+    FRAME_BUDGET = 0.012
+    # Horizontal space between the summary frame edge and item text
+    ITEM_WRAP_INSET = 155
+
+    def __init__(self, parent_frame, title1_nodes: List[Title1], state_manager,
+                 collapsed: bool = False):
+        self.parent_frame = parent_frame
+        self.state_manager = state_manager
+        self.cards: List[_SummaryCard] = []
+        self._after_id = None
+        # 라벨마다 <Configure>를 바인딩하지 않고 요약 프레임 너비 하나만 추적
+        self._wrap = WrapLengthManager(parent_frame, inset=self.ITEM_WRAP_INSET)
+
+        # 항목마다 폰트를 만들지 않고 공유
+        self._title2_font = ctk.CTkFont(size=16, weight="bold")
+        self._section_font = ctk.CTkFont(size=14, weight="bold")
+        self._bullet_font = ctk.CTkFont(size=13, weight="bold")
+        self._item_font = ctk.CTkFont(size=13)
+
+        for index, title1 in enumerate(title1_nodes):
+            card = _SummaryCard(index, title1)
+            card.expanded = not collapsed
+            self._create_card(card)
+            self.cards.append(card)
+
+        # Cards still to be built, in build order
+        self._pending: List[_SummaryCard] = list(self.cards)
+        self._schedule()
+
+    @property
+    def is_complete(self) -> bool:
+        """Whether every expanded card has been fully built"""
+        return not any(card.expanded for card in self._pending)
+
+    def toggle(self, index: int):
+        """Collapse or expand a title1 card"""
+        card = self.cards[index]
+        if card.expanded:
+            self.collapse(index)
+        else:
+            self.expand(index)
+
+    def expand(self, index: int):
+        """Show a card's content, building the rest of it first"""
+        card = self.cards[index]
+        card.expanded = True
+        card.content.grid()
+        card.toggle_button.configure(text="▼")
+        if not card.complete:
+            # 방금 펼친 카드를 먼저 채움
+            self._pending.remove(card)
+            self._pending.insert(0, card)
+            self._schedule()
+
+    def collapse(self, index: int):
+        """Hide a card's content and pause building it"""
+        card = self.cards[index]
+        card.expanded = False
+        card.content.grid_remove()
+        card.toggle_button.configure(text="▶")
+
+    def cancel(self):
+        """Stop building (e.g. when the review screen is torn down)"""
+        if self._after_id is not None:
+            try:
+                self.parent_frame.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+
+    # Incremental building
+
+    def _schedule(self):
+        if self._after_id is None and not self.is_complete:
+            self._after_id = self.parent_frame.after_idle(self._build_step)
+
+    def _build_step(self):
+        """Advance the card generators until the frame budget is used up"""
+        self._after_id = None
+        if not self.parent_frame.winfo_exists():
+            return
+
+        deadline = time.perf_counter() + self.FRAME_BUDGET
+        for card in list(self._pending):
+            if not card.expanded:
+                continue
+            if card.builder is None:
+                card.builder = self._build_card_content(card)
+            for _ in card.builder:
+                if time.perf_counter() >= deadline:
+                    self._schedule()
+                    return
+            card.complete = True
+            self._pending.remove(card)
+        self._schedule()
+
+    # Widgets
+
+    def _create_card(self, card: _SummaryCard):
+        # Main section card
+        card.frame = ctk.CTkFrame(
+            self.parent_frame,
+            fg_color="white",
+            corner_radius=12,
+            border_width=1,
+            border_color="#E8E8E8"
+        )
+        card.frame.grid(row=card.index, column=0, padx=10, pady=(0, 15), sticky="ew")
+        card.frame.grid_columnconfigure(0, weight=1)
+
+        # Section header with numbering and collapse toggle
+        section_header = ctk.CTkFrame(
+            card.frame,
+            fg_color="#F8F9FA",
+            corner_radius=10
+        )
+        section_header.grid(row=0, column=0, padx=12, pady=(12, 8), sticky="ew")
+        section_header.grid_columnconfigure(1, weight=1)
+
+        card.toggle_button = ctk.CTkButton(
+            section_header,
+            text="▼" if card.expanded else "▶",
+            command=lambda: self.toggle(card.index),
+            font=ctk.CTkFont(size=14),
+            width=28,
+            height=28,
+            corner_radius=6,
+            fg_color="transparent",
+            text_color="#555555",
+            hover_color="#E8E8E8"
+        )
+        card.toggle_button.grid(row=0, column=0, padx=(10, 0), pady=12)
+
+        title1_label = ctk.CTkLabel(
+            section_header,
+            text=f"{card.index + 1}. {card.title1.label}",
+            font=ctk.CTkFont(size=18, weight="bold"),
+            anchor="w",
+            text_color="#1A1A1A"
+        )
+        title1_label.grid(row=0, column=1, padx=(5, 15), pady=12, sticky="w")
+
+        # 접힌 상태에서도 보이도록 체크된 항목 수 표시 (진행 카운터로 O(1))
+        count_label = ctk.CTkLabel(
+            section_header,
+            text=f"{self.state_manager.count_checked(card.title1)}개 항목",
+            font=ctk.CTkFont(size=13),
+            text_color="#666666"
+        )
+        count_label.grid(row=0, column=2, padx=15, pady=12, sticky="e")
+
+        card.content = ctk.CTkFrame(card.frame, fg_color="transparent")
+        card.content.grid(row=1, column=0, sticky="ew")
+        card.content.grid_columnconfigure(0, weight=1)
+        if not card.expanded:
+            card.content.grid_remove()
+
+        # Card bottom padding
+        ctk.CTkLabel(card.frame, text="", height=8).grid(row=2, column=0)
+
+    def _build_card_content(self, card: _SummaryCard) -> Iterator[None]:
+        """Create a card's title2/section/item widgets, yielding after each one"""
+        content = card.content
+        content_row = 0
+
+        # Title2 subsections with improved layout
+        for title2_idx, title2 in enumerate(card.title1.get_title2_children()):
+            # Title2 header with modern styling
+            title2_header = ctk.CTkLabel(
+                content,
+                text=f"📂 {title2_idx + 1}.{card.index + 1} {title2.label}",
+                font=self._title2_font,
+                anchor="w",
+                text_color="#333333"
+            )
+            title2_header.grid(row=content_row, column=0, padx=25, pady=(8, 4), sticky="w")
+            content_row += 1
+            yield
+
+            # Process sections with enhanced display
+            has_content = False
+            for section in title2.get_sections():
+                # 체크된 항목이 없는 섹션은 항목을 훑지 않고 건너뜀
+                if self.state_manager.count_checked(section) == 0:
+                    continue
+                has_content = True
+                yield from self._build_section(content, content_row, section)
+                content_row += 1
+
+            if not has_content:
+                # Styled "no content" message
+                no_content_frame = ctk.CTkFrame(
+                    content,
+                    fg_color="#F5F5F5",
+                    corner_radius=6
+                )
+                no_content_frame.grid(row=content_row, column=0, padx=35, pady=(2, 8), sticky="ew")
+
+                no_content_label = ctk.CTkLabel(
+                    no_content_frame,
+                    text="체크된 항목이 없습니다",
+                    font=self._item_font,
+                    text_color="#999999"
+                )
+                no_content_label.grid(row=0, column=0, pady=8)
+                content_row += 1
+                yield
+
+    def _build_section(self, content, content_row: int, section: Section) -> Iterator[None]:
+        checked_items = [item for item in section.items
+                         if self.state_manager.is_item_checked(section.id, item)]
+
+        # Section container with subtle background
+        section_container = ctk.CTkFrame(
+            content,
+            fg_color="#F8F9FA",
+            corner_radius=8,
+            border_width=1,
+            border_color="#E8E8E8"
+        )
+        section_container.grid(row=content_row, column=0, padx=25, pady=(2, 8), sticky="ew")
+        section_container.grid_columnconfigure(0, weight=1)
+
+        # Section title
+        section_title = ctk.CTkLabel(
+            section_container,
+            text=f"📝 {section.label}",
+            font=self._section_font,
+            anchor="w",
+            justify="left",
+            text_color="#444444",
+            wraplength=1000
+        )
+        section_title.grid(row=0, column=0, padx=15, pady=(10, 6), sticky="ew")
+        yield
+
+        # Items with bullet points and left alignment
+        for idx, item in enumerate(checked_items, 1):
+            item_container = ctk.CTkFrame(
+                section_container,
+                fg_color="transparent"
+            )
+            item_container.grid(row=idx, column=0, padx=10, pady=1, sticky="ew")
+            item_container.grid_columnconfigure(1, weight=1)
+
+            # Bullet point
+            bullet_label = ctk.CTkLabel(
+                item_container,
+                text="•",
+                font=self._bullet_font,
+                text_color="#007ACC",
+                width=15
+            )
+            bullet_label.grid(row=0, column=0, sticky="nw", pady=(2, 0), padx=(5, 0))
+
+            # Item text with word wrapping and left alignment
+            item_label = ctk.CTkLabel(
+                item_container,
+                text=item,
+                font=self._item_font,
+                anchor="w",
+                justify="left",
+                text_color="#28A745"
+            )
+            item_label.grid(row=0, column=1, sticky="ew", padx=(5, 10), pady=2)
+            self._wrap.register(item_label)
+            yield
+
+        # Bottom padding for section
+        ctk.CTkLabel(section_container, text="", height=8).grid(row=len(checked_items) + 1, column=0)
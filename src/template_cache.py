@@ -0,0 +1,277 @@
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from document_backend import FieldInventory
+from checklist_cache import get_user_cache_dir
+from state_storage import write_file_atomic
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+# Bump whenever the entry layout changes
+CACHE_VERSION = 2
+CACHE_FILE_NAME = "templates.json"
+TEMPLATE_EXTENSIONS = (".hwp", ".hwpx")
+
+
+def file_content_hash(file_path: str) -> str:
+    """sha256 of a file's content"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@contextmanager
+def _file_lock(lock_path: str):
+    """Exclusive lock on lock_path, shared with other processes (e.g. batch workers)"""
+    with open(lock_path, 'a+b') as f:
+        if os.name == "nt":
+            f.seek(0)
+            # LK_LOCK retries for about 10 seconds, then raises OSError
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _plan_key(section_ids: Iterable[str], fixed_fields: Iterable[str]) -> str:
+    text = "\n".join(section_ids) + "\x00" + "\n".join(fixed_fields)
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+@dataclass(frozen=True)
+class TemplatePlan:
+    """How a checklist maps onto a template's fields, compiled once per template.
+
+    Conversions write exactly the fields listed here, in template order,
+    without asking the document which fields exist.
+    """
+    # Fields to write, in template order
+    fields: Tuple[str, ...]
+    # Fixed fields (company name, report date, ...) the template has
+    fixed_fields: Tuple[str, ...]
+    # Checklist sections the template has fields for, in template order
+    section_fields: Tuple[str, ...]
+    # Sections in the checklist
+    section_count: int
+
+    @classmethod
+    def compile(cls, inventory: FieldInventory, section_ids: List[str],
+                fixed_fields: Iterable[str] = ()) -> "TemplatePlan":
+        fixed = set(fixed_fields)
+        sections = set(section_ids)
+        return cls(
+            fields=tuple(name for name in inventory.names if name in fixed or name in sections),
+            fixed_fields=tuple(name for name in inventory.names if name in fixed),
+            section_fields=tuple(name for name in inventory.names if name in sections and name not in fixed),
+            section_count=len(section_ids),
+        )
+
+    def to_dict(self) -> Dict:
+        return {"fields": list(self.fields), "fixed_fields": list(self.fixed_fields),
+                "section_fields": list(self.section_fields), "section_count": self.section_count}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "TemplatePlan":
+        return cls(tuple(data["fields"]), tuple(data["fixed_fields"]),
+                   tuple(data["section_fields"]), data["section_count"])
+
+
+class TemplateInventoryCache:
+    """Field inventories of report templates, keyed by content hash.
+
+    Entries survive restarts (a JSON file in the user cache dir) and don't
+    depend on the template's path or mtime, so a template that was copied
+    or re-downloaded is still known. Each entry also keeps compiled
+    conversion plans (TemplatePlan) per checklist, keyed by a digest of its
+    section ids. Plans are kept in memory as well; a template whose content
+    changed has a new hash and so gets new ones. Content hashes are reused
+    while a file's size and mtime stay the same.
+
+    The cache is safe to use from several threads, and several processes
+    may share the cache file: saving merges in what others wrote.
+    """
+
+    def __init__(self, cache_file: Optional[str] = None):
+        self.cache_file = cache_file or os.path.join(get_user_cache_dir(), CACHE_FILE_NAME)
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict] = self._load()
+        # (content hash, plan key) -> plan
+        self._plans: Dict[Tuple[str, str], TemplatePlan] = {}
+        # path -> (size, mtime, content hash)
+        self._hashes: Dict[str, Tuple[int, int, str]] = {}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def content_hash(self, file_path: str) -> str:
+        """file_content_hash, remembered until the file's size or mtime changes"""
+        stat = os.stat(file_path)
+        path = os.path.abspath(file_path)
+        with self._lock:
+            known = self._hashes.get(path)
+        if known is not None and known[:2] == (stat.st_size, stat.st_mtime_ns):
+            return known[2]
+        content_hash = file_content_hash(file_path)
+        with self._lock:
+            self._hashes[path] = (stat.st_size, stat.st_mtime_ns, content_hash)
+        return content_hash
+
+    def lookup(self, file_path: str, content_hash: Optional[str] = None) -> Optional[FieldInventory]:
+        """Cached inventory of a template, or None if its content is unknown"""
+        content_hash = content_hash or self.content_hash(file_path)
+        with self._lock:
+            entry = self._entries.get(content_hash)
+            if entry is None:
+                return None
+            return FieldInventory(list(entry["names"]), dict(entry["counts"]))
+
+    def store(self, file_path: str, inventory: FieldInventory, content_hash: Optional[str] = None):
+        content_hash = content_hash or self.content_hash(file_path)
+        with self._lock:
+            self._entries[content_hash] = {
+                "file_name": os.path.basename(file_path),
+                "names": inventory.names,
+                "counts": inventory.counts,
+                "plans": {},
+            }
+            self._save()
+
+    def get_plan(self, file_path: str, section_ids: List[str], fixed_fields: Iterable[str] = (),
+                 content_hash: Optional[str] = None) -> Optional[TemplatePlan]:
+        """Compiled plan of a checklist for the template; None if the template is unknown"""
+        content_hash = content_hash or self.content_hash(file_path)
+        fixed_fields = tuple(fixed_fields)
+        key = _plan_key(section_ids, fixed_fields)
+        with self._lock:
+            plan = self._plans.get((content_hash, key))
+            if plan is not None:
+                return plan
+
+            entry = self._entries.get(content_hash)
+            if entry is None:
+                return None
+            data = entry["plans"].get(key)
+            if data is not None:
+                plan = TemplatePlan.from_dict(data)
+            else:
+                plan = TemplatePlan.compile(FieldInventory(entry["names"], entry["counts"]),
+                                            section_ids, fixed_fields)
+                entry["plans"][key] = plan.to_dict()
+                self._save()
+            self._plans[(content_hash, key)] = plan
+            return plan
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == CACHE_VERSION:
+                return data["templates"]
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"[WARN] Ignoring template cache {self.cache_file}: {e}")
+        return {}
+
+    def _save(self):
+        """Write the entries, merged with what other processes saved meanwhile; needs _lock"""
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            with _file_lock(self.cache_file + ".lock"):
+                for content_hash, entry in self._load().items():
+                    known = self._entries.setdefault(content_hash, entry)
+                    if known is not entry:
+                        for key, plan in entry.get("plans", {}).items():
+                            known["plans"].setdefault(key, plan)
+                data = json.dumps({"version": CACHE_VERSION, "templates": self._entries},
+                                  ensure_ascii=False, indent=2).encode('utf-8')
+                write_file_atomic(self.cache_file, data, fsync=False)
+        except OSError as e:
+            print(f"[WARN] Could not write template cache: {e}")
+
+
+class TemplateIndexer:
+    """Fills the template cache for a directory of templates ahead of time.
+
+    run() skips templates whose content is already cached and reads the
+    others with read_inventory on a worker pool. warm() only hashes the
+    templates, so cached inventories and plans are found without opening
+    anything. Meant to run off the UI thread (e.g. as a startup prefetch
+    task).
+    """
+
+    def __init__(self, cache: TemplateInventoryCache, templates_dir: str,
+                 read_inventory: Optional[Callable[[str], FieldInventory]] = None, workers: int = 2):
+        self.cache = cache
+        self.templates_dir = templates_dir
+        self.read_inventory = read_inventory
+        self.workers = workers
+
+    def find_templates(self) -> List[str]:
+        return [os.path.join(self.templates_dir, file_name)
+                for file_name in sorted(os.listdir(self.templates_dir))
+                if file_name.lower().endswith(TEMPLATE_EXTENSIONS)]
+
+    def warm(self) -> int:
+        """Remember the content hashes of the templates; returns how many are cached"""
+        known = 0
+        for file_path in self.find_templates():
+            try:
+                if self.cache.lookup(file_path, self.cache.content_hash(file_path)) is not None:
+                    known += 1
+            except OSError as e:
+                print(f"[WARN] Could not hash template {file_path}: {e}")
+        return known
+
+    def run(self) -> int:
+        """Index unknown templates with read_inventory; returns how many were added"""
+        unknown = []
+        for file_path in self.find_templates():
+            content_hash = self.cache.content_hash(file_path)
+            if self.cache.lookup(file_path, content_hash) is None:
+                unknown.append((file_path, content_hash))
+
+        indexed = 0
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = [(file_path, content_hash, executor.submit(self.read_inventory, file_path))
+                       for file_path, content_hash in unknown]
+            for file_path, content_hash, future in futures:
+                try:
+                    self.cache.store(file_path, future.result(), content_hash)
+                    indexed += 1
+                except Exception as e:
+                    print(f"[WARN] Could not index template {file_path}: {e}")
+        return indexed
+
+
+_default_cache: Optional[TemplateInventoryCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_template_cache() -> TemplateInventoryCache:
+    """The application's shared template cache"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = TemplateInventoryCache()
+        return _default_cache
@@ -133,13 +133,21 @@ class FirstScreen(ctk.CTkFrame):
                 if current_dir not in sys.path:
                     sys.path.insert(0, current_dir)
                 
-                from hwp_converter import HWPConverter, check_hwp_available
+                # 이미 분석한 템플릿(내용 해시 기준)은 한글을 띄우지 않고 바로 표시
+                from template_cache import get_template_cache
+                template_cache = get_template_cache()
+                inventory = template_cache.lookup(file_path)
+                if inventory is not None:
+                    self.after(0, lambda: self.display_field_validation_result(inventory.names))
+                    return
+                
+                from hwp_converter import HWPConverter, check_hwp_available, requires_hwp_program
                 
-                if not check_hwp_available():
+                if requires_hwp_program(file_path) and not check_hwp_available():
                     self.after(0, lambda: self.show_hwp_warning("한글(HWP) 프로그램이 설치되어 있지 않습니다."))
                     return
                 
-                converter = HWPConverter()
+                converter = HWPConverter(template_cache=template_cache)
                 fields = converter.detect_hwp_fields(file_path)
                 
                 # UI 스레드에서 결과 표시
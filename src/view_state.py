@@ -0,0 +1,132 @@
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set
+
+from models import Title1, Title2, Section
+
+
+@dataclass
+class ViewChanges:
+    """Parts of the checklist screen touched by a selection or state change"""
+    # Positions of sidebar (title1) buttons to restyle
+    sidebar: Set[int] = field(default_factory=set)
+    # Positions of stepper (title2) buttons to restyle
+    steps: Set[int] = field(default_factory=set)
+    # Ids of sections on the current page whose checkboxes must be re-synced
+    sections: Set[str] = field(default_factory=set)
+    # The stepper and header show another title1
+    title1_changed: bool = False
+    # The checklist view shows another title2 page
+    page_changed: bool = False
+
+    def __bool__(self) -> bool:
+        return bool(self.sidebar or self.steps or self.sections or
+                    self.title1_changed or self.page_changed)
+
+
+class ChecklistViewModel:
+    """Selection and derived display state of the checklist screen.
+
+    Remembers what the screen last showed (selected title1/title2, which
+    steps were completed) so that a navigation or item change can be turned
+    into the few widgets that actually need reconfiguring.
+    """
+
+    def __init__(self, title1_nodes: List[Title1], state_manager=None):
+        self.title1_nodes = title1_nodes
+        self.state_manager = state_manager
+        self.title1_index = -1
+        self.title2_index = -1
+        self.title2_nodes: List[Title2] = []
+        self.page_sections: List[Section] = []
+        # Section id -> step position, for the sections of the current title1
+        self._section_steps: Dict[str, int] = {}
+        self._page_section_ids: Set[str] = set()
+        self._step_completed: List[bool] = []
+
+    @property
+    def current_title1(self) -> Optional[Title1]:
+        if 0 <= self.title1_index < len(self.title1_nodes):
+            return self.title1_nodes[self.title1_index]
+        return None
+
+    @property
+    def current_title2(self) -> Optional[Title2]:
+        if 0 <= self.title2_index < len(self.title2_nodes):
+            return self.title2_nodes[self.title2_index]
+        return None
+
+    def is_step_completed(self, position: int) -> bool:
+        """Completion of a step as last reported to the view"""
+        return self._step_completed[position]
+
+    def reset(self, title1_index: int, title2_index: int) -> ViewChanges:
+        """Forget what was shown; everything is reported as changed"""
+        self.title1_index = -1
+        self.title2_index = -1
+        changes = self.select(title1_index, title2_index)
+        changes.sidebar = set(range(len(self.title1_nodes)))
+        return changes
+
+    def select(self, title1_index: int, title2_index: int) -> ViewChanges:
+        """Move the selection and report what it touched"""
+        changes = ViewChanges()
+
+        if title1_index != self.title1_index:
+            changes.sidebar = {index for index in (self.title1_index, title1_index)
+                               if 0 <= index < len(self.title1_nodes)}
+            changes.title1_changed = True
+            self.title1_index = title1_index
+            self._load_title1()
+            changes.steps = set(range(len(self.title2_nodes)))
+        elif title2_index != self.title2_index:
+            changes.steps = {index for index in (self.title2_index, title2_index)
+                             if 0 <= index < len(self.title2_nodes)}
+
+        if changes.title1_changed or title2_index != self.title2_index:
+            changes.page_changed = True
+            self.title2_index = title2_index
+            title2 = self.current_title2
+            self.page_sections = title2.get_sections() if title2 else []
+            self._page_section_ids = {section.id for section in self.page_sections}
+
+        return changes
+
+    def items_changed(self, section_ids: Iterable[str], refresh_sections: bool = True) -> ViewChanges:
+        """Report the widgets affected by item changes in the given sections.
+
+        With refresh_sections=False visible sections are not reported, e.g.
+        when the changed checkbox already shows its new state.
+        """
+        changes = ViewChanges()
+        for section_id in section_ids:
+            if refresh_sections and section_id in self._page_section_ids:
+                changes.sections.add(section_id)
+            position = self._section_steps.get(section_id)
+            if position is None or position in changes.steps:
+                continue
+            completed = self._is_completed(self.title2_nodes[position])
+            if completed != self._step_completed[position]:
+                self._step_completed[position] = completed
+                changes.steps.add(position)
+        return changes
+
+    def item_toggled(self, section_id: str, item_text: str) -> ViewChanges:
+        """Report the widgets affected by a checkbox the user just toggled.
+
+        The checkbox itself is up to date; its section is only refreshed if
+        the item text repeats there, since all occurrences share one state.
+        """
+        section = next((section for section in self.page_sections if section.id == section_id), None)
+        repeated = section is not None and section.items.count(item_text) > 1
+        return self.items_changed([section_id], refresh_sections=repeated)
+
+    def _load_title1(self):
+        title1 = self.current_title1
+        self.title2_nodes = title1.get_title2_children() if title1 else []
+        self._section_steps = {section.id: position
+                               for position, title2 in enumerate(self.title2_nodes)
+                               for section in title2.get_sections()}
+        self._step_completed = [self._is_completed(title2) for title2 in self.title2_nodes]
+
+    def _is_completed(self, title2: Title2) -> bool:
+        return bool(self.state_manager) and title2.is_completed(self.state_manager)
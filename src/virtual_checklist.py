@@ -0,0 +1,439 @@
+import math
+import tkinter as tk
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+import customtkinter as ctk
+
+from models import Section
+from wrap_layout import WrapLengthManager
+
+# Row kinds
+ROW_HEADER = 0
+ROW_ITEM = 1
+
+# Mouse wheel events (Button-4/5 on X11)
+WHEEL_SEQUENCES = ("<MouseWheel>", "<Button-4>", "<Button-5>")
+
+
+class _PooledRow:
+    """A row widget on the canvas, rebound to different checklist rows"""
+
+    def __init__(self, frame: ctk.CTkFrame, window_id: int):
+        self.frame = frame
+        self.window_id = window_id
+        self.row_index = -1
+        self.section: Optional[Section] = None
+        self.item = ""
+        # Filled in by the row builders
+        self.label: Optional[ctk.CTkLabel] = None
+        self.checkbox: Optional[ctk.CTkCheckBox] = None
+
+
+class VirtualChecklistView(ctk.CTkFrame):
+    """Scrollable checklist that only creates widgets for visible rows.
+
+    The sections of a title2 page are flattened into rows (one header per
+    section, one row per item) with precomputed y offsets. A pool of row
+    widgets, sized to the viewport rather than to the item count, is
+    rebound to whichever rows are visible when the user scrolls.
+    show_sections() switches to another page and reuses the same pool.
+    """
+
+    # Row geometry in unscaled pixels
+    HEADER_HEIGHT = 64
+    ITEM_PADDING_Y = 20
+    ITEM_MIN_HEIGHT = 40
+    ITEM_TEXT_INSET = 120
+    SECTION_GAP = 16
+    MIN_WRAP_WIDTH = 50
+
+    def __init__(self, master, is_item_checked: Callable[[str, str], bool],
+                 on_toggle_item: Callable[[str, str], None],
+                 on_toggle_section: Callable[[Section], None],
+                 empty_text: str = "", **kwargs):
+        kwargs.setdefault("fg_color", "transparent")
+        super().__init__(master, **kwargs)
+        self.is_item_checked = is_item_checked
+        self.on_toggle_item = on_toggle_item
+        self.on_toggle_section = on_toggle_section
+        self.empty_text = empty_text
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+
+        self._canvas = tk.Canvas(self, highlightthickness=0, borderwidth=0, yscrollincrement=20,
+                                 bg=self._apply_appearance_mode(self._detect_color_of_master()))
+        self._canvas.grid(row=0, column=0, sticky="nsew")
+        self._scrollbar = ctk.CTkScrollbar(self, command=self._canvas.yview)
+        self._scrollbar.grid(row=0, column=1, sticky="ns")
+        self._canvas.configure(yscrollcommand=self._on_canvas_scroll)
+
+        self._item_font = ctk.CTkFont(size=15)
+        # Item label wraplengths follow the canvas width, applied once per layout
+        self._wrap = WrapLengthManager(self, inset=self.ITEM_TEXT_INSET,
+                                       min_width=self.MIN_WRAP_WIDTH, bind=False)
+        self._header_font = ctk.CTkFont(size=17, weight="bold")
+        self._empty_label = ctk.CTkLabel(self._canvas, text=empty_text, font=ctk.CTkFont(size=16))
+        # Wheel events over the canvas and its rows go to a bind tag of this view,
+        # so nothing is bound globally and destroy() can remove the bindings
+        self._wheel_tag = f"VirtualChecklistWheel{self._w}"
+        self._wheel_funcids = [self.bind_class(self._wheel_tag, sequence, self._on_mousewheel)
+                               for sequence in WHEEL_SEQUENCES]
+        self._add_wheel_tag(self._canvas)
+        self._empty_window = self._canvas.create_window(0, 0, window=self._empty_label,
+                                                        anchor="n", state="hidden")
+
+        # Current page: (kind, section, item position) per row and row top offsets
+        self._sections: List[Section] = []
+        self._rows: List[Tuple[int, Section, int]] = []
+        self._offsets: List[int] = []
+        self._heights: List[int] = []
+        self._total_height = 0
+        self._width = 0
+
+        # Row widget pools per kind, and the rows they are bound to
+        self._free: Dict[int, List[_PooledRow]] = {ROW_HEADER: [], ROW_ITEM: []}
+        self._bound: Dict[int, _PooledRow] = {}
+
+        self._render_pending = False
+        self._layout_pending = False
+        self._canvas.bind("<Configure>", self._on_canvas_configure)
+
+    def destroy(self):
+        for sequence, funcid in zip(WHEEL_SEQUENCES, self._wheel_funcids):
+            self.unbind_class(self._wheel_tag, sequence)
+            self.deletecommand(funcid)
+        super().destroy()
+
+    # Page content
+
+    def show_sections(self, sections: List[Section]):
+        """Show the given sections, reusing the row widgets of the previous page"""
+        self._sections = list(sections)
+        self._release_all()
+        self._canvas.yview_moveto(0)
+        self._layout()
+
+    def refresh(self, section_ids: Optional[Iterable[str]] = None):
+        """Re-read checked state for the visible rows, optionally only of the given sections"""
+        if section_ids is not None:
+            section_ids = set(section_ids)
+        for pooled in self._bound.values():
+            if pooled.checkbox is not None and (section_ids is None or pooled.section.id in section_ids):
+                self._update_checkbox(pooled)
+
+    def get_pool_size(self) -> int:
+        """Number of row widgets created so far"""
+        return len(self._bound) + sum(len(rows) for rows in self._free.values())
+
+    # Layout
+
+    def _scaling(self) -> float:
+        return self._get_widget_scaling()
+
+    def _wrap_width(self) -> int:
+        return max(self.MIN_WRAP_WIDTH, int(self._width / self._scaling()) - self.ITEM_TEXT_INSET)
+
+    def _count_lines(self, text: str, wrap_width: int) -> int:
+        """Estimate the number of lines Tk wraps a label text into"""
+        measure = self._item_font.measure
+        if measure(text) <= wrap_width:
+            return 1
+        lines = 1
+        line_width = 0
+        space_width = measure(" ")
+        for word in text.split(" "):
+            word_width = measure(word)
+            if line_width and line_width + space_width + word_width > wrap_width:
+                lines += 1
+                line_width = 0
+            if word_width > wrap_width:
+                # Tk breaks overlong words at the wrap length
+                lines += math.ceil(word_width / wrap_width) - 1
+                word_width %= wrap_width
+            line_width += (space_width if line_width else 0) + word_width
+        return lines
+
+    def _layout(self):
+        """Compute row offsets for the current page and width"""
+        self._layout_pending = False
+        if not self.winfo_exists():
+            return
+        scaling = self._scaling()
+        wrap_width = self._wrap_width()
+        line_height = self._item_font.metrics("linespace")
+
+        self._rows = []
+        self._heights = []
+        for section in self._sections:
+            self._rows.append((ROW_HEADER, section, -1))
+            self._heights.append(self.HEADER_HEIGHT)
+            for position, item in enumerate(section.items):
+                text_height = self._count_lines(item, wrap_width) * line_height + self.ITEM_PADDING_Y
+                self._rows.append((ROW_ITEM, section, position))
+                self._heights.append(max(self.ITEM_MIN_HEIGHT, text_height))
+            self._heights[-1] += self.SECTION_GAP
+
+        self._offsets = []
+        y = 0
+        for index, height in enumerate(self._heights):
+            height = int(round(height * scaling))
+            self._heights[index] = height
+            self._offsets.append(y)
+            y += height
+        self._total_height = y
+
+        self._canvas.configure(scrollregion=(0, 0, self._width, max(y, 1)))
+        self._wrap.update_width(self._width)
+        self._canvas.itemconfigure(self._empty_window, state="normal" if not self._rows else "hidden")
+        self._canvas.coords(self._empty_window, self._width / 2, 40 * scaling)
+
+        # Geometry changed: rebind every visible row
+        self._release_all()
+        self._render()
+
+    def _schedule_layout(self):
+        if not self._layout_pending:
+            self._layout_pending = True
+            self.after_idle(self._layout)
+
+    def _schedule_render(self):
+        if not self._render_pending:
+            self._render_pending = True
+            self.after_idle(self._render)
+
+    # Rendering
+
+    def _visible_range(self) -> range:
+        top = self._canvas.canvasy(0)
+        bottom = top + self._canvas.winfo_height()
+        first = max(0, bisect_right(self._offsets, top) - 1)
+        last = bisect_right(self._offsets, bottom)
+        return range(first, min(last, len(self._rows)))
+
+    def _render(self):
+        """Bind pooled widgets to the rows inside the viewport"""
+        self._render_pending = False
+        if not self.winfo_exists():
+            return
+        visible = self._visible_range()
+
+        for row_index in [index for index in self._bound if index not in visible]:
+            self._release(row_index)
+
+        for row_index in visible:
+            if row_index not in self._bound:
+                self._bind_row(row_index)
+
+    def _bind_row(self, row_index: int):
+        kind, section, position = self._rows[row_index]
+        free = self._free[kind]
+        pooled = free.pop() if free else self._create_row(kind)
+        pooled.row_index = row_index
+        pooled.section = section
+
+        if kind == ROW_HEADER:
+            pooled.label.configure(text=section.label)
+        else:
+            pooled.item = section.items[position]
+            pooled.label.configure(text=pooled.item)
+            self._update_checkbox(pooled)
+
+        self._canvas.coords(pooled.window_id, 0, self._offsets[row_index])
+        self._canvas.itemconfigure(pooled.window_id, state="normal", width=self._width,
+                                   height=self._heights[row_index])
+        self._bound[row_index] = pooled
+
+    def _release(self, row_index: int):
+        pooled = self._bound.pop(row_index)
+        self._canvas.itemconfigure(pooled.window_id, state="hidden")
+        pooled.row_index = -1
+        pooled.section = None
+        kind = ROW_HEADER if pooled.checkbox is None else ROW_ITEM
+        self._free[kind].append(pooled)
+
+    def _release_all(self):
+        for row_index in list(self._bound):
+            self._release(row_index)
+
+    def _update_checkbox(self, pooled: _PooledRow):
+        if self.is_item_checked(pooled.section.id, pooled.item):
+            pooled.checkbox.select()
+        else:
+            pooled.checkbox.deselect()
+
+    # Row widgets
+
+    def _create_row(self, kind: int) -> _PooledRow:
+        frame = ctk.CTkFrame(self._canvas, corner_radius=0, fg_color="#FAFAFA")
+        frame.grid_columnconfigure(1 if kind == ROW_ITEM else 0, weight=1)
+        window_id = self._canvas.create_window(0, 0, window=frame, anchor="nw", state="hidden")
+        pooled = _PooledRow(frame, window_id)
+        if kind == ROW_HEADER:
+            self._build_header_row(pooled)
+        else:
+            self._build_item_row(pooled)
+        self._add_wheel_tag(frame)
+        return pooled
+
+    def _add_wheel_tag(self, widget):
+        """Route wheel events over a widget and its descendants to _on_mousewheel"""
+        widget.bindtags((self._wheel_tag,) + widget.bindtags())
+        for child in widget.winfo_children():
+            self._add_wheel_tag(child)
+
+    def _build_header_row(self, pooled: _PooledRow):
+        # 섹션 제목과 전체 선택/해제 버튼
+        pooled.label = ctk.CTkLabel(
+            pooled.frame,
+            text="",
+            font=self._header_font,
+            anchor="w",
+            text_color="#1A1A1A"
+        )
+        pooled.label.grid(row=0, column=0, padx=(28, 0), pady=(16, 12), sticky="w")
+
+        def toggle_section():
+            if pooled.section is not None:
+                self.on_toggle_section(pooled.section)
+
+        bulk_button = ctk.CTkButton(
+            pooled.frame,
+            text="전체 선택/해제",
+            command=toggle_section,
+            font=ctk.CTkFont(size=13),
+            height=32,
+            width=110,
+            corner_radius=6,
+            fg_color="#f0f0f0",
+            text_color="#333333",
+            hover_color="#e0e0e0"
+        )
+        bulk_button.grid(row=0, column=1, padx=(10, 28), pady=(16, 12), sticky="e")
+
+    def _build_item_row(self, pooled: _PooledRow):
+        def toggle():
+            if pooled.section is not None:
+                self.on_toggle_item(pooled.section.id, pooled.item)
+
+        pooled.checkbox = ctk.CTkCheckBox(
+            pooled.frame,
+            text="",
+            command=toggle,
+            font=self._item_font,
+            width=24,
+            checkbox_width=20,
+            checkbox_height=20,
+            corner_radius=4,
+            border_width=2,
+            fg_color="#007ACC",
+            hover_color="#005A9F",
+            checkmark_color="white"
+        )
+        pooled.checkbox.grid(row=0, column=0, padx=(32, 12), pady=6, sticky="nw")
+
+        pooled.label = ctk.CTkLabel(
+            pooled.frame,
+            text="",
+            font=self._item_font,
+            anchor="w",
+            justify="left",
+            text_color="#2D2D2D"
+        )
+        pooled.label.grid(row=0, column=1, padx=(0, 24), pady=6, sticky="ew")
+        self._wrap.register(pooled.label)
+
+    # Events
+
+    def _on_canvas_configure(self, event):
+        if event.width != self._width:
+            # Wrapping changes with the width: recompute row heights once resizing settles
+            self._width = event.width
+            self._schedule_layout()
+        else:
+            self._schedule_render()
+
+    def _on_canvas_scroll(self, first, last):
+        self._scrollbar.set(first, last)
+        self._schedule_render()
+
+    def _on_mousewheel(self, event):
+        if self._total_height <= self._canvas.winfo_height():
+            return
+        if event.num == 4:
+            delta = -1
+        elif event.num == 5:
+            delta = 1
+        else:
+            delta = -int(event.delta / 120) or (-1 if event.delta > 0 else 1)
+        self._canvas.yview_scroll(delta * 3, "units")
+
+
+class ChecklistPageCache:
+    """Bounded LRU cache of built checklist pages.
+
+    Every title2 page gets its own VirtualChecklistView, so switching back
+    to a cached page is a grid_remove()/grid() swap that keeps its layout
+    and scroll position; its checkboxes are re-synced when it is shown.
+    Pages are keyed by position, e.g. (title1 index, title2 index), as ids
+    are not guaranteed to be unique across the checklist.
+    When max_pages is reached the least recently used view is reassigned
+    to the new page instead of building another one. max_rows bounds the
+    row widgets kept by all cached pages together.
+    """
+
+    def __init__(self, create_view: Callable[[], VirtualChecklistView],
+                 max_pages: int = 8, max_rows: Optional[int] = None):
+        self.create_view = create_view
+        self.max_pages = max(1, max_pages)
+        self.max_rows = max_rows
+        self.current: Optional[VirtualChecklistView] = None
+        self._views: 'OrderedDict[Hashable, VirtualChecklistView]' = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._views)
+
+    def is_cached_view(self, widget) -> bool:
+        """Whether a widget is one of the cached page views"""
+        return any(view is widget for view in self._views.values())
+
+    def show(self, key: Hashable, sections: List[Section]) -> VirtualChecklistView:
+        """Show the page with the given key, building it from sections if needed"""
+        view = self._views.get(key)
+        if view is not None:
+            self._views.move_to_end(key)
+            view.refresh()
+        else:
+            if len(self._views) >= self.max_pages:
+                # Reuse the least recently used page and its row widgets
+                _, view = self._views.popitem(last=False)
+            else:
+                view = self.create_view()
+            self._views[key] = view
+            view.show_sections(sections)
+
+        if view is not self.current:
+            if self.current is not None:
+                self.current.grid_remove()
+            view.grid()
+            self.current = view
+        self._trim_rows()
+        return view
+
+    def _trim_rows(self):
+        """Drop least recently used pages while the cached row widgets exceed max_rows"""
+        if self.max_rows is None:
+            return
+        while len(self._views) > 1 and \
+                sum(view.get_pool_size() for view in self._views.values()) > self.max_rows:
+            _, view = self._views.popitem(last=False)
+            view.destroy()
+
+    def clear(self):
+        """Destroy all cached pages"""
+        for view in self._views.values():
+            view.destroy()
+        self._views.clear()
+        self.current = None
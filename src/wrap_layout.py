@@ -0,0 +1,74 @@
+import tkinter as tk
+from typing import Dict, Optional
+
+
+class WrapLengthManager:
+    """Keeps the wraplength of many labels in step with one container's width.
+
+    Instead of a <Configure> callback per label, only the container's width
+    is watched. Changes are debounced and then applied to all registered
+    labels in one pass; labels that already have the right value are not
+    reconfigured, so no extra layout work is triggered.
+
+    Each label is registered with an inset: the horizontal space between
+    the container edge and the text (paddings, bullets, checkboxes).
+    Values are in unscaled pixels, like the CTk widget options.
+    """
+
+    # Milliseconds without width changes before wraplengths are applied
+    DEBOUNCE_MS = 60
+
+    def __init__(self, container, inset: int = 30, min_width: int = 50, bind: bool = True):
+        self.container = container
+        self.inset = inset
+        self.min_width = min_width
+        self.width = 0
+        # label -> [inset, applied wraplength]
+        self._labels: Dict[object, list] = {}
+        self._after_id = None
+        if bind:
+            container.bind("<Configure>", self._on_configure, add="+")
+
+    def register(self, label, inset: Optional[int] = None):
+        """Manage a label's wraplength; it gets the current value right away"""
+        entry = [self.inset if inset is None else inset, None]
+        self._labels[label] = entry
+        if self.width:
+            self._apply_to(label, entry)
+
+    def unregister(self, label):
+        self._labels.pop(label, None)
+
+    def update_width(self, width: int):
+        """Set the container width (in screen pixels) and apply it now"""
+        self.width = width
+        self.apply()
+
+    def apply(self):
+        """Give every registered label the wraplength for the current width"""
+        self._after_id = None
+        for label, entry in list(self._labels.items()):
+            try:
+                self._apply_to(label, entry)
+            except tk.TclError:
+                # Label was destroyed
+                del self._labels[label]
+
+    def _apply_to(self, label, entry: list):
+        wraplength = int(self.width / self._scaling()) - entry[0]
+        if wraplength < self.min_width or wraplength == entry[1]:
+            return
+        entry[1] = wraplength
+        label.configure(wraplength=wraplength)
+
+    def _scaling(self) -> float:
+        get_scaling = getattr(self.container, "_get_widget_scaling", None)
+        return get_scaling() if get_scaling else 1.0
+
+    def _on_configure(self, event):
+        if event.width == self.width:
+            return
+        self.width = event.width
+        if self._after_id is not None:
+            self.container.after_cancel(self._after_id)
+        self._after_id = self.container.after(self.DEBOUNCE_MS, self.apply)
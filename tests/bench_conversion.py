@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Conversion cost by checklist size: python tests/bench_conversion.py [--sizes 1000,4000,16000]
+
+Builds synthetic checklists, checks every other item and converts them
+with the in-memory document backend, so only the converter's own work is
+measured. Per-item cost should stay flat as the checklist grows.
+"""
+
+import sys
+import os
+import io
+import argparse
+import tempfile
+import time
+from contextlib import redirect_stdout
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from models import ChecklistParser, ChecklistIndex
+from state_manager import StateManager
+from document_backend import InMemoryDocumentBackend
+from hwp_converter import HWPConverter
+from conversion_payload import ConversionPayload
+
+ITEMS_PER_SECTION = 10
+SECTIONS_PER_TITLE2 = 10
+
+
+def make_checklist(item_count: int):
+    sections = [{"id": f"s{n}", "label": f"Section {n}", "type": "section",
+                 "items": [f"item {n}-{i}" for i in range(ITEMS_PER_SECTION)]}
+                for n in range(item_count // ITEMS_PER_SECTION)]
+    title2_nodes = [{"id": f"t2_{n}", "label": f"Step {n}", "type": "title2",
+                     "children": sections[start:start + SECTIONS_PER_TITLE2]}
+                    for n, start in enumerate(range(0, len(sections), SECTIONS_PER_TITLE2))]
+    return [{"id": "t1", "label": "Report", "type": "title1", "children": title2_nodes}]
+
+
+def measure(item_count: int, work_dir: str, repeat: int):
+    title1_nodes = ChecklistParser.parse_nodes(make_checklist(item_count))
+    index = ChecklistIndex.of(title1_nodes)
+    state_manager = StateManager(data_dir=work_dir, company_name=f"bench{item_count}",
+                                 title1_nodes=title1_nodes, save_delay=None)
+    with state_manager.batch() as batch:
+        for section in index.sections:
+            for item in section.items[::2]:
+                batch.set_item_checked(section.id, item, True)
+
+    template = os.path.join(work_dir, "report.hwp")
+    open(template, 'wb').close()
+    document = InMemoryDocumentBackend(fields=["company_name", "report_date"] + index.get_section_ids())
+    converter = HWPConverter(document=document)
+
+    best_payload = best_convert = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        payload = ConversionPayload.from_state_manager(state_manager, title1_nodes)
+        best_payload = min(best_payload, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        with redirect_stdout(io.StringIO()):
+            success, message = converter.convert_checklist_to_hwp(template, "ACME", payload, title1_nodes)
+        best_convert = min(best_convert, time.perf_counter() - start)
+        assert success, message
+    state_manager.close()
+    return best_payload, best_convert
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1000,4000,16000", help="checklist item counts")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    per_item = []
+    print(f"{'items':>8} {'payload':>10} {'convert':>10} {'us/item':>9}")
+    with tempfile.TemporaryDirectory() as work_dir:
+        for size in sizes:
+            payload_seconds, convert_seconds = measure(size, work_dir, args.repeat)
+            per_item.append((payload_seconds + convert_seconds) / size * 1e6)
+            print(f"{size:>8} {payload_seconds * 1000:>8.1f}ms {convert_seconds * 1000:>8.1f}ms "
+                  f"{per_item[-1]:>9.2f}")
+
+    # Linear: per-item cost of the largest checklist stays within a small factor of the smallest
+    growth = per_item[-1] / per_item[0]
+    print(f"Per-item cost grew x{growth:.2f} for x{sizes[-1] / sizes[0]:.0f} items")
+    return 0 if growth < 3 else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import sys
+import os
+import json
+import tempfile
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from models import ChecklistParser
+from state_manager import StateManager
+from batch_report import run_batch, MANIFEST_NAME
+
+from test_state_index import SAMPLE_CHECKLIST
+
+
+def _write_json(file_path, data):
+    with open(file_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+
+
+def test_batch_text_reports():
+    """Every state file gets a report and a manifest entry; failures are recorded"""
+    with tempfile.TemporaryDirectory() as work_dir:
+        checklist_file = os.path.join(work_dir, "checklist.json")
+        states_dir = os.path.join(work_dir, "states")
+        output_dir = os.path.join(work_dir, "reports")
+        os.makedirs(states_dir)
+        _write_json(checklist_file, SAMPLE_CHECKLIST)
+        _write_json(os.path.join(states_dir, "state_ACME.json"),
+                    {"company_name": "ACME",
+                     "checked_items": ["mgt::검토 및 평가계획 수립", "prepare_issues::평가표 미작성"]})
+        _write_json(os.path.join(states_dir, "state_Beta.json"),
+                    {"company_name": "Beta", "checked_items": []})
+        with open(os.path.join(states_dir, "state_Broken.json"), 'w', encoding='utf-8') as f:
+            f.write("{not json")
+
+        # Beta has a change in its journal that isn't in the snapshot yet (GUI still open)
+        gui_state = StateManager(data_dir=states_dir, company_name="Beta", storage_mode="journal",
+                                 title1_nodes=ChecklistParser.parse_nodes(SAMPLE_CHECKLIST), save_delay=None)
+        gui_state.set_item_checked("worker", "교육 참여", True)
+        gui_state.close()
+        state_files = {}
+        for file_name in ("state_Beta.json", "state_Beta.journal"):
+            with open(os.path.join(states_dir, file_name), 'rb') as f:
+                state_files[file_name] = f.read()
+
+        for workers in (1, 2):
+            manifest = run_batch(checklist_file, states_dir, output_dir, workers=workers)
+            with open(os.path.join(output_dir, MANIFEST_NAME), encoding='utf-8') as f:
+                assert json.load(f) == manifest
+
+            results = {os.path.basename(result["state_file"]): result for result in manifest["results"]}
+            assert (manifest["succeeded"], manifest["failed"]) == (2, 1)
+            assert results["state_ACME.json"]["checked_items"] == 2
+            assert results["state_Beta.json"]["checked_items"] == 1
+            assert results["state_Broken.json"]["error"].startswith("JSONDecodeError")
+            assert all(result["seconds"] >= 0 for result in manifest["results"])
+            assert all(result["timings"] == {} for result in manifest["results"])
+
+            with open(results["state_ACME.json"]["output"], encoding='utf-8') as f:
+                report = f.read()
+            assert report.startswith("ACME\n")
+            assert "- 검토 및 평가계획 수립" in report and "- 평가표 미작성" in report
+            assert "교육 참여" not in report
+
+        # Reading states for a report doesn't write them back: snapshot and journal are untouched
+        assert sorted(os.listdir(states_dir)) == ["state_ACME.json", "state_Beta.journal",
+                                                  "state_Beta.json", "state_Broken.json"]
+        for file_name, content in state_files.items():
+            with open(os.path.join(states_dir, file_name), 'rb') as f:
+                assert f.read() == content
+
+
+if __name__ == "__main__":
+    test_batch_text_reports()
+    print("🎉 Batch report test completed successfully!")
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import sys
+import os
+import json
+import tempfile
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from models import ChecklistParser, ChecklistIndex, LazyTitle1
+from state_manager import StateManager
+import checklist_cache
+from checklist_cache import load_checklist, get_cache_path
+
+from test_state_index import SAMPLE_CHECKLIST
+
+
+def _write_checklist(file_path, data):
+    with open(file_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+
+
+def test_compiled_cache():
+    """Cache hits give the same indexed tree; stale caches are rebuilt"""
+    with tempfile.TemporaryDirectory() as data_dir:
+        checklist_file = os.path.join(data_dir, "checklist.json")
+        _write_checklist(checklist_file, SAMPLE_CHECKLIST)
+
+        parsed = ChecklistParser.load_from_file(checklist_file)
+        first = load_checklist(checklist_file)
+        assert os.path.exists(get_cache_path(checklist_file))
+
+        cached = load_checklist(checklist_file)
+        assert [node.to_dict() for node in cached] == [node.to_dict() for node in parsed]
+        prepare = cached[1].get_title2_children()[0].get_sections()[0]
+        assert (prepare.item_start, prepare.ordinal) == (3, 2)
+        assert prepare.parent.parent is cached[1]
+        assert cached is not first
+
+        # A cache file that is not ours (e.g. an old pickled header) is rebuilt, not loaded
+        with open(get_cache_path(checklist_file), 'wb') as f:
+            f.write(b"\x80\x04garbage")
+        assert [node.to_dict() for node in load_checklist(checklist_file)] == \
+            [node.to_dict() for node in parsed]
+
+        # Same content with a new mtime (e.g. PyInstaller extraction) still hits
+        os.utime(checklist_file, (0, 0))
+        assert [node.to_dict() for node in load_checklist(checklist_file)] == \
+            [node.to_dict() for node in parsed]
+        # ... and the cache takes the new mtime, so the source is not hashed again
+        file_hash = checklist_cache._file_hash
+        hashed = []
+        checklist_cache._file_hash = lambda path: (hashed.append(path), file_hash(path))[1]
+        try:
+            assert [node.to_dict() for node in load_checklist(checklist_file)] == \
+                [node.to_dict() for node in parsed]
+        finally:
+            checklist_cache._file_hash = file_hash
+        assert hashed == []
+
+        changed = json.loads(json.dumps(SAMPLE_CHECKLIST))
+        changed[0]["children"][0]["children"][1]["items"].append("추가 항목")
+        _write_checklist(checklist_file, changed)
+        reloaded = load_checklist(checklist_file)
+        assert reloaded[0].get_title2_children()[0].get_sections()[1].items[-1] == "추가 항목"
+        assert reloaded[1].item_start == 4
+
+
+def test_lazy_loading():
+    """Lazy title1 subtrees are parsed on first access and bound to state then"""
+    with tempfile.TemporaryDirectory() as data_dir:
+        checklist_file = os.path.join(data_dir, "checklist.json")
+        _write_checklist(checklist_file, SAMPLE_CHECKLIST)
+        with open(os.path.join(data_dir, "state_ACME.json"), 'w', encoding='utf-8') as f:
+            json.dump({"company_name": "ACME", "checked_items": ["prepare_issues::실시규정 미비"]},
+                      f, ensure_ascii=False)
+
+        eager = ChecklistParser.load_from_file(checklist_file)
+        lazy = ChecklistParser.load_from_file(checklist_file, lazy=True)
+        assert all(isinstance(node, LazyTitle1) for node in lazy)
+        assert [(node.id, node.item_start, node.item_count) for node in lazy] == \
+            [(node.id, node.item_start, node.item_count) for node in eager]
+        assert ChecklistParser.validate_structure(lazy)
+        assert not any(node.is_materialized for node in lazy)
+
+        state_manager = StateManager(data_dir=data_dir, company_name="ACME",
+                                     title1_nodes=lazy, save_delay=None)
+        assert not lazy[1].is_materialized
+        assert state_manager.checked_items == {"prepare_issues::실시규정 미비"}
+        assert state_manager._checklist_signature() == StateManager(
+            data_dir=data_dir, company_name="ACME", title1_nodes=eager, save_delay=None
+        )._checklist_signature()
+
+        # Progress, repr and equality of an unparsed title1 come from its skeleton
+        assert lazy[1].get_checked_items_count(state_manager) == 1
+        assert lazy[1].is_completed(state_manager) is False
+        assert "prepare" not in repr(lazy[1])
+        assert lazy[1] == ChecklistParser.load_from_file(checklist_file, lazy=True)[1]
+        assert lazy[0] != lazy[1]
+        assert not any(node.is_materialized for node in lazy)
+
+        # Parsing indexes its pending keys
+        prepare = lazy[1].get_title2_children()[0].get_sections()[0]
+        assert lazy[1].is_materialized and not lazy[0].is_materialized
+        assert lazy[1].get_checked_items_count(state_manager) == 1
+        assert (prepare.item_start, prepare.ordinal) == (3, 2)
+        assert prepare.parent.parent is lazy[1]
+        assert state_manager.get_item_index("prepare_issues", "실시규정 미비") == 3
+
+        # Changes under an unparsed title1 stay pending until it is parsed
+        state_manager.set_item_checked("worker", "교육 참여", True)
+        assert not lazy[0].is_materialized
+        assert state_manager.is_item_checked("worker", "교육 참여")
+        assert state_manager.get_overall_progress(lazy) == (2, 6)
+        assert not lazy[0].is_materialized
+        lazy[0].get_title2_children()
+        assert state_manager.get_item_index("worker", "교육 참여") == 2
+        assert state_manager.get_overall_progress(lazy) == (2, 6)
+        assert state_manager.is_index_checked(2)
+        assert [node.to_dict() for node in lazy] == [node.to_dict() for node in eager]
+        state_manager.close()
+
+
+def test_lazy_skeleton_cache():
+    """Lazy loads reuse cached skeletons instead of scanning the file again"""
+    with tempfile.TemporaryDirectory() as data_dir:
+        checklist_file = os.path.join(data_dir, "checklist.json")
+        _write_checklist(checklist_file, SAMPLE_CHECKLIST)
+
+        scanned = load_checklist(checklist_file, lazy=True)
+        skeleton_path = get_cache_path(checklist_file, extension=".skeleton")
+        assert os.path.exists(skeleton_path)
+
+        cached = load_checklist(checklist_file, lazy=True)
+        assert cached is not scanned and cached == scanned
+        assert [node.item_hashes for node in cached] == [node.item_hashes for node in scanned]
+        assert cached[1].count_item_keys(["prepare_issues::평가표 미작성", "mgt::교육 참여"]) == 1
+        assert not any(node.is_materialized for node in cached)
+        assert [node.to_dict() for node in cached] == \
+            [node.to_dict() for node in ChecklistParser.load_from_file(checklist_file)]
+
+        changed = json.loads(json.dumps(SAMPLE_CHECKLIST))
+        changed[1]["children"][0]["children"][0]["items"].append("추가 항목")
+        _write_checklist(checklist_file, changed)
+        reloaded = load_checklist(checklist_file, lazy=True)
+        assert reloaded[1].item_count == 4
+        assert reloaded[1].get_title2_children()[0].get_sections()[0].items[-1] == "추가 항목"
+
+
+def test_checklist_index():
+    """Id lookups, paths, ranges and flat arrays; duplicate ids fail validation"""
+    title1_nodes = ChecklistParser.parse_nodes(SAMPLE_CHECKLIST)
+    index = title1_nodes.checklist_index
+    assert ChecklistIndex.of(title1_nodes) is index
+
+    prepare = index.get_section("prepare_issues")
+    assert prepare is title1_nodes[1].get_title2_children()[0].get_sections()[0]
+    assert [node.id for node in index.get_path("prepare_issues")] == ["risk", "prepare", "prepare_issues"]
+    assert index.get_section("mustdo") is None and "mustdo" in index
+    assert index.get_section_range("worker") == (2, 1)
+    assert index.get_section_ids() == ["mgt", "worker", "prepare_issues"]
+    assert len(index.items) == 6
+    assert index.get_item(4) == (prepare, "역할 분담 불명확")
+    assert [node.id for node in index.nodes][:3] == ["summary", "mustdo", "mgt"]
+    assert ChecklistParser.validate_structure(title1_nodes)
+
+    duplicated = json.loads(json.dumps(SAMPLE_CHECKLIST))
+    duplicated[1]["children"][0]["children"][0]["id"] = "worker"
+    title1_nodes = ChecklistParser.parse_nodes(duplicated)
+    assert title1_nodes.duplicate_ids == {"worker"}
+    assert not ChecklistParser.validate_structure(title1_nodes)
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        checklist_file = os.path.join(data_dir, "checklist.json")
+        _write_checklist(checklist_file, duplicated)
+        lazy = ChecklistParser.load_from_file(checklist_file, lazy=True)
+        assert not ChecklistParser.validate_structure(lazy)
+        assert not any(node.is_materialized for node in lazy)
+        assert load_checklist(checklist_file).duplicate_ids == {"worker"}
+
+
+if __name__ == "__main__":
+    test_compiled_cache()
+    test_lazy_loading()
+    test_lazy_skeleton_cache()
+    test_checklist_index()
+    print("🎉 Checklist loading test completed successfully!")
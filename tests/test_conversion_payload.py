@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import sys
+import os
+import pickle
+import tempfile
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from models import ChecklistParser
+from state_manager import StateManager
+from conversion_payload import ConversionPayload
+
+from test_state_index import SAMPLE_CHECKLIST
+
+
+def test_payload_from_state_manager():
+    """Checked items grouped by section in checklist order, as an immutable snapshot"""
+    title1_nodes = ChecklistParser.parse_nodes(SAMPLE_CHECKLIST)
+    with tempfile.TemporaryDirectory() as data_dir:
+        state_manager = StateManager(data_dir=data_dir, company_name="ACME",
+                                     title1_nodes=title1_nodes, save_delay=None)
+        state_manager.set_item_checked("prepare_issues", "평가표 미작성", True)
+        state_manager.set_item_checked("prepare_issues", "실시규정 미비", True)
+        state_manager.set_item_checked("mgt", "검토 및 평가계획 수립", True)
+
+        payload = ConversionPayload.from_state_manager(state_manager, title1_nodes)
+        assert payload.company_name == "ACME"
+        assert payload.sections == (
+            ("mgt", ("검토 및 평가계획 수립",)),
+            ("worker", ()),
+            ("prepare_issues", ("실시규정 미비", "평가표 미작성")),
+        )
+        assert payload.section_ids == ["mgt", "worker", "prepare_issues"]
+        assert payload.checked_items("missing") == ()
+        assert payload.checked_count == 3
+
+        # Later edits don't reach the snapshot
+        state_manager.set_item_checked("worker", "교육 참여", True)
+        assert payload.checked_items("worker") == ()
+        try:
+            payload.company_name = "Other"
+            assert False, "payload is mutable"
+        except AttributeError:
+            pass
+
+        # Same payload from the state file's key list, and across processes
+        keys = ["prepare_issues::평가표 미작성", "mgt::검토 및 평가계획 수립",
+                "prepare_issues::실시규정 미비", "old_section::삭제된 항목"]
+        assert ConversionPayload.from_checked_keys(keys, title1_nodes, "ACME") == payload
+        copy = pickle.loads(pickle.dumps(payload))
+        assert copy == payload and copy.checked_items("mgt") == ("검토 및 평가계획 수립",)
+        state_manager.close()
+
+
+if __name__ == "__main__":
+    test_payload_from_state_manager()
+    print("🎉 Conversion payload test completed successfully!")
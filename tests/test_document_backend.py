@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import sys
+import os
+import tempfile
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from models import ChecklistParser
+from document_backend import ComDocumentBackend, InMemoryDocumentBackend, FieldInventory
+from hwp_converter import HWPConverter
+
+from test_state_index import SAMPLE_CHECKLIST
+
+
+def test_field_inventory():
+    """Distinct names in document order with their counts"""
+    inventory = FieldInventory.from_occurrences(["company_name", "mgt", "company_name", "worker"])
+    assert inventory.names == ["company_name", "mgt", "worker"]
+    assert inventory.counts == {"company_name": 2, "mgt": 1, "worker": 1}
+    assert "mgt" in inventory and "missing" not in inventory
+    assert inventory.position("worker") == 2 and inventory.position("missing") is None
+
+
+class LoadingHwp:
+    """Automation object that keeps its blank document active for a few polls after Open"""
+
+    def __init__(self, busy_polls):
+        self.busy_polls = busy_polls
+        self._opened = ""
+
+    def Open(self, file_path):
+        self._opened = file_path
+        return True
+
+    @property
+    def Path(self):
+        if self.busy_polls > 0:
+            self.busy_polls -= 1
+            return ""
+        return os.path.abspath(self._opened)
+
+    def GetFieldList(self, number, option):
+        # The blank document answers right away, just without fields
+        return "company_name\x02mgt" if self.busy_polls == 0 else ""
+
+
+def test_com_open_waits_for_ready():
+    """open() polls until the opened file is the active document instead of sleeping a fixed time"""
+    hwp = LoadingHwp(busy_polls=3)
+    document = ComDocumentBackend(hwp, ready_timeout=5, poll_interval=0.01)
+    document.open("report.hwp")
+    assert hwp.busy_polls == 0
+    assert 0.02 <= document.ready_wait < 1
+    assert document.list_fields() == ["company_name", "mgt"]
+
+    # A document that never becomes ready fails after the timeout
+    document = ComDocumentBackend(LoadingHwp(busy_polls=10 ** 6), ready_timeout=0.05, poll_interval=0.01)
+    try:
+        document.open("report.hwp")
+        assert False, "readiness timeout was not raised"
+    except TimeoutError as e:
+        assert "report.hwp" in str(e)
+
+
+def test_conversion_in_memory():
+    """The converter fills fields through the backend; results and calls are recorded"""
+    title1_nodes = ChecklistParser.parse_nodes(SAMPLE_CHECKLIST)
+    with tempfile.TemporaryDirectory() as work_dir:
+        template = os.path.join(work_dir, "report.hwp")
+        open(template, 'wb').close()
+        document = InMemoryDocumentBackend(
+            fields=["company_name", "report_date", "mgt", "worker", "prepare_issues"])
+        converter = HWPConverter(document=document)
+
+        assert converter.detect_hwp_fields(template) == \
+            ["company_name", "report_date", "mgt", "worker", "prepare_issues"]
+        # The inventory is read with one list call, not a probe per name
+        assert document.calls == {"open": 1, "list_fields": 1}
+
+        section_ids = converter.get_all_section_ids(title1_nodes)
+        document.fields.remove("worker")
+        document.fields.append("unused_field")
+        assert converter.validate_field_mapping(template, section_ids) == \
+            {"mgt": True, "worker": False, "prepare_issues": True}
+        document.fields = ["company_name", "report_date", "mgt", "worker", "prepare_issues"]
+
+        checked = {"checked_items": ["mgt::검토 및 평가계획 수립",
+                                     "prepare_issues::실시규정 미비",
+                                     "prepare_issues::평가표 미작성"]}
+        success, message = converter.convert_checklist_to_hwp(template, "ACME", checked, title1_nodes)
+        assert success, message
+
+        saved = document.saved[converter.output_path]
+        assert saved["company_name"] == "ACME"
+        assert saved["mgt"] == "- 검토 및 평가계획 수립"
+        assert saved["worker"] == "(체크된 항목 없음)"
+        assert saved["prepare_issues"] == "- 실시규정 미비\n- 평가표 미작성"
+        # Bulk fill: every field in one call, no per-item round trips
+        assert document.calls["put_field_texts"] == 1 and "insert_text" not in document.calls
+        # Timing report of the conversion
+        assert {"session", "open", "ready_wait", "fill", "save", "total"} <= set(converter.timings)
+        assert "ready_wait 0.00s" in converter.format_timings()
+
+        # Item-by-item filling gives the same document
+        per_item = InMemoryDocumentBackend(fields=document.fields)
+        converter = HWPConverter(document=per_item, bulk_fill=False)
+        success, message = converter.convert_checklist_to_hwp(template, "ACME", checked, title1_nodes)
+        assert success, message
+        assert per_item.saved[converter.output_path] == saved
+        assert per_item.calls["insert_text"] == 3 and per_item.calls["insert_paragraph"] == 1
+        assert document.visible
+        # Nothing is written to disk
+        assert os.listdir(work_dir) == ["report.hwp"]
+
+        success, message = converter.convert_checklist_to_hwp(
+            os.path.join(work_dir, "missing.hwp"), "ACME", checked, title1_nodes)
+        assert not success
+
+
+if __name__ == "__main__":
+    test_field_inventory()
+    test_com_open_waits_for_ready()
+    test_conversion_in_memory()
+    print("🎉 Document backend test completed successfully!")
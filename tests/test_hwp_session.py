@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import sys
+import os
+import threading
+import time
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from hwp_session import HwpSessionPool
+
+
+class FakeHwp:
+    def __init__(self, number):
+        self.number = number
+        self.alive = True
+        self.open_document = None
+        self.thread = threading.current_thread()
+
+
+class FakeHwpBackend:
+    """Records the instance lifecycle instead of starting the word processor"""
+
+    def __init__(self):
+        self.created = []
+        self.quit_instances = []
+        self.resets = 0
+        self.threads_stopped = 0
+
+    def thread_started(self):
+        pass
+
+    def thread_stopped(self):
+        self.threads_stopped += 1
+
+    def create(self):
+        hwp = FakeHwp(len(self.created))
+        self.created.append(hwp)
+        return hwp
+
+    def is_alive(self, hwp):
+        return hwp.alive
+
+    def reset(self, hwp):
+        self.resets += 1
+        hwp.open_document = None
+
+    def quit(self, hwp):
+        self.quit_instances.append(hwp.number)
+
+
+def _open(document):
+    def job(hwp):
+        assert hwp.open_document is None, "document of the previous job was not closed"
+        assert hwp.thread is threading.current_thread()
+        hwp.open_document = document
+        return hwp.number
+    return job
+
+
+def test_session_reuse_and_recycle():
+    """Instances are reused, reset between jobs, replaced when dead and recycled"""
+    backend = FakeHwpBackend()
+    pool = HwpSessionPool(backend, size=1, idle_timeout=30, max_jobs=3)
+
+    assert [pool.run(_open(f"doc{n}")) for n in range(3)] == [0, 0, 0]
+    assert backend.resets == 3 and backend.quit_instances == [0]
+
+    # A failing job still resets the document
+    try:
+        pool.run(lambda hwp: 1 / 0)
+        assert False, "job error was not raised"
+    except ZeroDivisionError:
+        pass
+    assert pool.run(_open("after error")) == 1
+
+    # Health check replaces an instance that stopped responding
+    backend.created[1].alive = False
+    assert pool.run(_open("after crash")) == 2
+    assert backend.quit_instances == [0, 1]
+
+    pool.close()
+    assert backend.quit_instances == [0, 1, 2] and backend.threads_stopped == 1
+    try:
+        pool.run(_open("closed"))
+        assert False, "closed pool accepted a job"
+    except RuntimeError:
+        pass
+
+
+def test_session_idle_timeout():
+    """Idle sessions quit their instance; the next job starts a new one"""
+    backend = FakeHwpBackend()
+    pool = HwpSessionPool(backend, size=2, idle_timeout=0.05, max_jobs=10)
+
+    release = threading.Event()
+    slow = pool.submit(lambda hwp: release.wait(5) and hwp.number)
+    assert pool.run(_open("parallel"), timeout=5) == 1
+    release.set()
+    assert slow.result(5) == 0
+
+    deadline = time.monotonic() + 5
+    while pool.sessions and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not pool.sessions
+    assert sorted(backend.quit_instances) == [0, 1] and backend.threads_stopped == 2
+    assert pool.run(_open("later")) == 2
+    pool.close()
+
+
+if __name__ == "__main__":
+    test_session_reuse_and_recycle()
+    test_session_idle_timeout()
+    print("🎉 HWP session test completed successfully!")
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import sys
+import os
+import tempfile
+import zipfile
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from models import ChecklistParser
+from hwpx_backend import HwpxDocumentBackend
+from hwp_converter import HWPConverter
+
+from test_state_index import SAMPLE_CHECKLIST
+
+SECTION_XML = """<?xml version="1.0" encoding="UTF-8" standalone="yes" ?>
+<hs:sec xmlns:hs="http://www.hancom.co.kr/hwpml/2011/section" xmlns:hp="http://www.hancom.co.kr/hwpml/2011/paragraph">
+  <hp:p id="0" paraPrIDRef="1" styleIDRef="0">
+    <hp:run charPrIDRef="3"><hp:t>회사: </hp:t></hp:run>
+    <hp:run charPrIDRef="3"><hp:ctrl><hp:fieldBegin id="11" type="CLICK_HERE" name="company_name"/></hp:ctrl><hp:t>여기에</hp:t></hp:run>
+    <hp:run charPrIDRef="5"><hp:t> 입력</hp:t></hp:run>
+    <hp:run charPrIDRef="3"><hp:ctrl><hp:fieldEnd beginIDRef="11" fieldid="1"/></hp:ctrl></hp:run>
+    <hp:run charPrIDRef="3"><hp:t> 귀하</hp:t></hp:run>
+    <hp:linesegarray><hp:lineseg textpos="0"/></hp:linesegarray>
+  </hp:p>
+  <hp:p id="0" paraPrIDRef="2" styleIDRef="0">
+    <hp:run charPrIDRef="3"><hp:tbl><hp:tr><hp:tc><hp:subList>
+      <hp:p id="0" paraPrIDRef="4" styleIDRef="0">
+        <hp:run charPrIDRef="7"><hp:ctrl><hp:fieldBegin id="12" type="CLICK_HERE" name="prepare_issues"/></hp:ctrl></hp:run>
+        <hp:run charPrIDRef="8"><hp:t>첫 줄</hp:t></hp:run>
+      </hp:p>
+      <hp:p id="0" paraPrIDRef="4" styleIDRef="0">
+        <hp:run charPrIDRef="8"><hp:t>둘째 줄</hp:t></hp:run>
+        <hp:run charPrIDRef="7"><hp:ctrl><hp:fieldEnd beginIDRef="12" fieldid="2"/></hp:ctrl></hp:run>
+      </hp:p>
+      <hp:p id="0" paraPrIDRef="4" styleIDRef="0"><hp:run charPrIDRef="7"><hp:t>표 아래</hp:t></hp:run></hp:p>
+    </hp:subList></hp:tc></hp:tr></hp:tbl></hp:run>
+  </hp:p>
+  <hp:p id="0" paraPrIDRef="1" styleIDRef="0">
+    <hp:run charPrIDRef="3"><hp:ctrl><hp:fieldBegin id="13" type="CLICK_HERE" name="worker"/></hp:ctrl></hp:run>
+    <hp:run charPrIDRef="3"><hp:ctrl><hp:fieldEnd beginIDRef="13" fieldid="3"/></hp:ctrl></hp:run>
+  </hp:p>
+</hs:sec>
+"""
+
+
+# Two fields in one paragraph; "c" ends in the paragraph where "d" begins
+SHARED_PARAGRAPH_XML = """<?xml version="1.0" encoding="UTF-8" standalone="yes" ?>
+<hs:sec xmlns:hs="http://www.hancom.co.kr/hwpml/2011/section" xmlns:hp="http://www.hancom.co.kr/hwpml/2011/paragraph">
+  <hp:p id="0" paraPrIDRef="1" styleIDRef="0">
+    <hp:run charPrIDRef="3"><hp:ctrl><hp:fieldBegin id="21" type="CLICK_HERE" name="a"/></hp:ctrl></hp:run>
+    <hp:run charPrIDRef="3"><hp:ctrl><hp:fieldEnd beginIDRef="21" fieldid="1"/></hp:ctrl><hp:t> / </hp:t></hp:run>
+    <hp:run charPrIDRef="3"><hp:ctrl><hp:fieldBegin id="22" type="CLICK_HERE" name="b"/></hp:ctrl></hp:run>
+    <hp:run charPrIDRef="3"><hp:ctrl><hp:fieldEnd beginIDRef="22" fieldid="2"/></hp:ctrl><hp:t> 끝</hp:t></hp:run>
+  </hp:p>
+  <hp:p id="0" paraPrIDRef="1" styleIDRef="0">
+    <hp:run charPrIDRef="3"><hp:ctrl><hp:fieldBegin id="23" type="CLICK_HERE" name="c"/></hp:ctrl><hp:t>c1</hp:t></hp:run>
+  </hp:p>
+  <hp:p id="0" paraPrIDRef="1" styleIDRef="0">
+    <hp:run charPrIDRef="3"><hp:t>c2</hp:t><hp:ctrl><hp:fieldEnd beginIDRef="23" fieldid="3"/></hp:ctrl></hp:run>
+    <hp:run charPrIDRef="3"><hp:ctrl><hp:fieldBegin id="24" type="CLICK_HERE" name="d"/></hp:ctrl></hp:run>
+    <hp:run charPrIDRef="3"><hp:ctrl><hp:fieldEnd beginIDRef="24" fieldid="4"/></hp:ctrl></hp:run>
+  </hp:p>
+</hs:sec>
+"""
+
+
+def _write_template(file_path, section_xml=SECTION_XML):
+    with zipfile.ZipFile(file_path, "w", zipfile.ZIP_DEFLATED) as package:
+        package.writestr("version.xml", "<version/>")
+        package.writestr(zipfile.ZipInfo("mimetype"), "application/hwp+zip")
+        package.writestr("Contents/section0.xml", section_xml)
+
+
+def test_hwpx_fields():
+    """Fields are read and written in place, one paragraph per line"""
+    with tempfile.TemporaryDirectory() as work_dir:
+        template = os.path.join(work_dir, "report.hwpx")
+        _write_template(template)
+
+        document = HwpxDocumentBackend()
+        document.open(template)
+        assert document.list_fields() == ["company_name", "prepare_issues", "worker"]
+        assert document.get_field_text("company_name") == "여기에 입력"
+        assert document.get_field_text("prepare_issues") == "첫 줄\n둘째 줄"
+        assert not document.move_to_field("missing")
+
+        document.put_field_text("company_name", "ACME")
+        document.put_field_text("prepare_issues", "")
+        document.move_to_field("prepare_issues")
+        document.insert_text("- 하나")
+        document.insert_paragraph()
+        document.insert_text("- 둘")
+        document.put_field_text("worker", "한 줄\n두 줄\n세 줄")
+        output = os.path.join(work_dir, "out.hwpx")
+        document.save_as(output)
+
+        with zipfile.ZipFile(output) as package:
+            infos = package.infolist()
+            assert infos[0].filename == "mimetype" and infos[0].compress_type == zipfile.ZIP_STORED
+            assert [info.filename for info in infos[1:]] == ["version.xml", "Contents/section0.xml"]
+            section = package.read("Contents/section0.xml").decode("utf-8")
+        assert "<hp:p " in section and "linesegarray" not in section.split("prepare_issues")[0]
+
+        reopened = HwpxDocumentBackend()
+        reopened.open(output)
+        assert reopened.list_fields() == ["company_name", "prepare_issues", "worker"]
+        assert reopened.get_field_text("company_name") == "ACME"
+        assert reopened.get_field_text("prepare_issues") == "- 하나\n- 둘"
+        assert reopened.get_field_text("worker") == "한 줄\n두 줄\n세 줄"
+        # Text around the fields and paragraph styles are kept
+        assert "회사: " in section and " 귀하" in section and "표 아래" in section
+        assert section.count('paraPrIDRef="4"') == 3
+        assert section.count('paraPrIDRef="1"') == 4
+
+
+def test_hwpx_fields_sharing_paragraphs():
+    """Multi-line writes to fields whose paragraphs are moved by an earlier write"""
+    with tempfile.TemporaryDirectory() as work_dir:
+        template = os.path.join(work_dir, "report.hwpx")
+        _write_template(template, SHARED_PARAGRAPH_XML)
+
+        document = HwpxDocumentBackend()
+        document.open(template)
+        document.put_field_texts({"a": "x\ny", "b": "p\nq", "c": "c\nd\ne", "d": "f\ng"})
+        output = os.path.join(work_dir, "out.hwpx")
+        document.save_as(output)
+        assert document.get_field_text("b") == "p\nq"
+
+        reopened = HwpxDocumentBackend()
+        reopened.open(output)
+        assert reopened.list_fields() == ["a", "b", "c", "d"]
+        assert [reopened.get_field_text(name) for name in "abcd"] == ["x\ny", "p\nq", "c\nd\ne", "f\ng"]
+        with zipfile.ZipFile(output) as package:
+            section = package.read("Contents/section0.xml").decode("utf-8")
+        assert section.index(" / ") < section.index(">p<") and section.index(">q<") < section.index(" 끝")
+
+
+def test_hwpx_conversion():
+    """HWPX templates are converted without the word processor"""
+    title1_nodes = ChecklistParser.parse_nodes(SAMPLE_CHECKLIST)
+    with tempfile.TemporaryDirectory() as work_dir:
+        template = os.path.join(work_dir, "report.hwpx")
+        _write_template(template)
+        converter = HWPConverter()
+        assert converter.detect_hwp_fields(template) == ["company_name", "prepare_issues", "worker"]
+
+        checked = {"checked_items": ["prepare_issues::실시규정 미비", "prepare_issues::평가표 미작성"]}
+        success, message = converter.convert_checklist_to_hwp(template, "ACME", checked, title1_nodes)
+        assert success, message
+
+        assert converter.output_path.endswith(".hwpx")
+        document = HwpxDocumentBackend()
+        document.open(converter.output_path)
+        assert document.get_field_text("company_name") == "ACME"
+        assert document.get_field_text("prepare_issues") == "- 실시규정 미비\n- 평가표 미작성"
+        assert document.get_field_text("worker") == "(체크된 항목 없음)"
+
+        # A failed save reports an error and leaves the template alone
+        with open(template, 'rb') as f:
+            original = f.read()
+        success, message = converter.convert_checklist_to_hwp(template, "missing/ACME", checked, title1_nodes)
+        assert not success
+        with open(template, 'rb') as f:
+            assert f.read() == original
+
+
+if __name__ == "__main__":
+    test_hwpx_fields()
+    test_hwpx_fields_sharing_paragraphs()
+    test_hwpx_conversion()
+    print("🎉 HWPX backend test completed successfully!")
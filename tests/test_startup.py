@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import sys
+import os
+import builtins
+import threading
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from startup import ImportTimer, Prefetcher
+
+
+def test_import_timer():
+    """First imports are timed with self and inclusive times; the hook is removed"""
+    original_import = builtins.__import__
+    sys.modules.pop("wrap_layout", None)
+    timer = ImportTimer()
+    timer.install()
+    try:
+        import wrap_layout  # noqa: F401
+        import os.path  # already imported, not timed  # noqa: F401
+    finally:
+        timer.uninstall()
+    assert builtins.__import__ is original_import
+
+    inclusive, own = timer.timings["wrap_layout"]
+    assert 0 <= own <= inclusive
+    assert "os.path" not in timer.timings
+    assert timer.slowest(1)[0][2] == max(own for _, own in timer.timings.values())
+
+
+def test_prefetcher():
+    """Tasks run in order on one thread; results, failures and missing modules"""
+    release = threading.Event()
+    completed = []
+    prefetcher = Prefetcher(on_complete=completed.append)
+    prefetcher.add("checklist", lambda: ["title1"])
+    prefetcher.add("slow", lambda: release.wait(5))
+    prefetcher.add("broken", lambda: 1 / 0)
+    prefetcher.add_import("module_that_does_not_exist")
+    prefetcher.add_import("json")
+
+    # result() starts the prefetch and returns as soon as that task is done
+    assert prefetcher.result("checklist") == ["title1"]
+    assert not prefetcher.is_complete
+    release.set()
+
+    try:
+        prefetcher.result("broken", timeout=5)
+        assert False, "task error was not raised"
+    except ZeroDivisionError:
+        pass
+    assert prefetcher.result("import module_that_does_not_exist", timeout=5) is None
+    assert prefetcher.result("import json", timeout=5) is sys.modules["json"]
+    prefetcher._thread.join(5)
+    assert completed == [prefetcher] and prefetcher.is_complete
+    assert list(prefetcher.timings) == ["checklist", "slow", "broken",
+                                        "import module_that_does_not_exist", "import json"]
+
+
+if __name__ == "__main__":
+    test_import_timer()
+    test_prefetcher()
+    print("🎉 Startup test completed successfully!")
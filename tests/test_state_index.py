@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import sys
+import os
+import json
+import tempfile
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from models import ChecklistParser
+from state_manager import StateManager
+
+SAMPLE_CHECKLIST = [
+    {
+        "id": "summary", "label": "컨설팅 결과 총평서", "type": "title1",
+        "children": [
+            {
+                "id": "mustdo", "label": "이것만은 꼭 해주세요!", "type": "title2",
+                "children": [
+                    {"id": "mgt", "label": "경영층", "type": "section",
+                     "items": ["위험성평가 준비사항 확인", "검토 및 평가계획 수립"]},
+                    {"id": "worker", "label": "근로자", "type": "section",
+                     "items": ["교육 참여"]}
+                ]
+            }
+        ]
+    },
+    {
+        "id": "risk", "label": "위험성평가", "type": "title1",
+        "children": [
+            {
+                "id": "prepare", "label": "사전준비", "type": "title2",
+                "children": [
+                    {"id": "prepare_issues", "label": "문제점", "type": "section",
+                     "items": ["실시규정 미비", "역할 분담 불명확", "평가표 미작성"]}
+                ]
+            }
+        ]
+    }
+]
+
+
+def test_item_indices():
+    """Items get dense indices in document order"""
+    title1_nodes = ChecklistParser.parse_nodes(SAMPLE_CHECKLIST)
+
+    sections = [section for title1 in title1_nodes
+                for title2 in title1.get_title2_children()
+                for section in title2.get_sections()]
+    assert [section.item_start for section in sections] == [0, 2, 3]
+    assert title1_nodes[1].item_start == 3
+    assert title1_nodes[1].item_count == 3
+
+
+def test_bitset_state_round_trip():
+    """Key API and JSON checked_items format work on top of the bitset"""
+    title1_nodes = ChecklistParser.parse_nodes(SAMPLE_CHECKLIST)
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        state_file = os.path.join(data_dir, "state_ACME.json")
+        with open(state_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                "company_name": "ACME",
+                "checked_items": ["worker::교육 참여", "old_section::삭제된 항목"]
+            }, f, ensure_ascii=False)
+
+        state_manager = StateManager(data_dir=data_dir, company_name="ACME",
+                                     title1_nodes=title1_nodes)
+        assert state_manager.item_count == 6
+        assert state_manager.is_index_checked(2)
+        assert state_manager.is_item_checked("worker", "교육 참여")
+
+        state_manager.set_item_checked("prepare_issues", "평가표 미작성", True)
+        assert state_manager.get_item_index("prepare_issues", "평가표 미작성") == 5
+        assert state_manager.get_overall_progress(title1_nodes) == (2, 6)
+        state_manager.flush()
+
+        with open(state_file, 'r', encoding='utf-8') as f:
+            saved = json.load(f)
+        # Checklist order first, unknown keys are preserved
+        assert saved["checked_items"] == [
+            "worker::교육 참여", "prepare_issues::평가표 미작성", "old_section::삭제된 항목"
+        ]
+        state_manager.close()
+
+
+def test_progress_counters():
+    """Section / title2 / title1 counters follow every change"""
+    title1_nodes = ChecklistParser.parse_nodes(SAMPLE_CHECKLIST)
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        state_manager = StateManager(data_dir=data_dir, company_name="ACME",
+                                     title1_nodes=title1_nodes)
+        title2 = title1_nodes[0].get_title2_children()[0]
+        mgt, worker = title2.get_sections()
+
+        for item in mgt.items:
+            state_manager.set_item_checked_no_save(mgt.id, item, True)
+        state_manager.set_item_checked_no_save(mgt.id, mgt.items[0], True)
+        assert mgt.get_checked_count(state_manager) == 2
+        assert mgt.is_completed(state_manager)
+        assert not title2.is_completed(state_manager)
+
+        state_manager.toggle_item(worker.id, worker.items[0])
+        assert title2.is_completed(state_manager)
+        assert title1_nodes[0].is_completed(state_manager)
+        assert state_manager.get_overall_progress(title1_nodes) == (3, 6)
+        assert state_manager.get_section_progress(mgt.id, mgt.items) == (2, 2)
+        assert state_manager.get_section_progress("missing", ["없는 항목"]) == (0, 1)
+
+        state_manager.set_item_checked(mgt.id, mgt.items[1], False)
+        assert state_manager.get_section_progress(mgt.id, mgt.items) == (1, 2)
+        assert title2.get_checked_items_count(state_manager) == 2
+        assert title1_nodes[0].get_checked_items_count(state_manager) == 2
+        state_manager.close()
+
+
+def test_batch_changes():
+    """Batches update counters once, persist once and roll back on error"""
+    title1_nodes = ChecklistParser.parse_nodes(SAMPLE_CHECKLIST)
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        state_manager = StateManager(data_dir=data_dir, company_name="ACME",
+                                     title1_nodes=title1_nodes, storage_mode="journal")
+        prepare = title1_nodes[1].get_title2_children()[0].get_sections()[0]
+
+        changed = state_manager.check_all_section(prepare.id, prepare.items)
+        assert changed == {"prepare_issues"}
+        assert prepare.is_completed(state_manager)
+        with open(os.path.join(data_dir, "state_ACME.journal"), 'rb') as f:
+            assert f.read().splitlines()[1:] == [b"+3", b"+4", b"+5"]
+
+        # Net-zero and repeated changes are not reported
+        changed = state_manager.apply_changes([
+            ("prepare_issues", "실시규정 미비", True),
+            ("mgt", "검토 및 평가계획 수립", True),
+            ("mgt", "검토 및 평가계획 수립", False),
+        ])
+        assert changed == set()
+
+        try:
+            with state_manager.batch() as batch:
+                batch.set_section_checked(prepare.id, prepare.items, False)
+                raise RuntimeError("cancel")
+        except RuntimeError:
+            pass
+        assert state_manager.get_overall_progress(title1_nodes) == (3, 6)
+        assert state_manager.is_item_checked("prepare_issues", "평가표 미작성")
+        state_manager.close()
+
+
+def test_repeated_item_text():
+    """Items repeating a text in one section share their key and change together"""
+    checklist = [{"id": "t1", "label": "T1", "type": "title1", "children": [
+        {"id": "t2", "label": "T2", "type": "title2", "children": [
+            {"id": "dup", "label": "Dup", "type": "section", "items": ["x", "x", "y"]}]}]}]
+    title1_nodes = ChecklistParser.parse_nodes(checklist)
+    title2 = title1_nodes[0].get_title2_children()[0]
+    section = title2.get_sections()[0]
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        state_manager = StateManager(data_dir=data_dir, company_name="ACME",
+                                     title1_nodes=title1_nodes, save_delay=None)
+        state_manager.check_all_section(section.id, section.items)
+        assert section.get_checked_count(state_manager) == 3
+        assert section.is_completed(state_manager) and title2.is_completed(state_manager)
+
+        state_manager.set_index_checked(1, False)
+        assert not state_manager.is_index_checked(0)
+        assert state_manager.get_overall_progress(title1_nodes) == (1, 3)
+
+        state_manager.set_item_checked("dup", "x", True)
+        assert state_manager.checked_items == {"dup::x", "dup::y"}
+        state_manager.close()
+
+        reloaded = StateManager(data_dir=data_dir, company_name="ACME",
+                                title1_nodes=title1_nodes, save_delay=None)
+        assert reloaded.get_overall_progress(title1_nodes) == (3, 3)
+        reloaded.close()
+
+
+if __name__ == "__main__":
+    test_item_indices()
+    test_bitset_state_round_trip()
+    test_progress_counters()
+    test_batch_changes()
+    test_repeated_item_text()
+    print("🎉 State index test completed successfully!")
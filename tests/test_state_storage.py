@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import sys
+import os
+import json
+import time
+import tempfile
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from models import ChecklistParser
+from state_manager import StateManager
+from save_scheduler import SaveScheduler
+from state_storage import import_json_states, list_companies
+
+from test_state_index import SAMPLE_CHECKLIST
+
+
+def test_journal_replay():
+    """Toggles go to the journal and are replayed on the next load"""
+    title1_nodes = ChecklistParser.parse_nodes(SAMPLE_CHECKLIST)
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        state_manager = StateManager(data_dir=data_dir, company_name="ACME",
+                                     title1_nodes=title1_nodes, storage_mode="journal")
+        state_manager.set_item_checked("mgt", "검토 및 평가계획 수립", True)
+        state_manager.set_item_checked("prepare_issues", "실시규정 미비", True)
+        state_manager.set_item_checked("mgt", "검토 및 평가계획 수립", False)
+
+        journal_file = os.path.join(data_dir, "state_ACME.journal")
+        assert not os.path.exists(os.path.join(data_dir, "state_ACME.json"))
+        with open(journal_file, 'rb') as f:
+            assert f.read().splitlines()[1:] == [b"+1", b"+3", b"-1"]
+
+        # Simulate a crash in the middle of the next record
+        state_manager.storage.close()
+        with open(journal_file, 'ab') as f:
+            f.write(b"+5")
+
+        reloaded = StateManager(data_dir=data_dir, company_name="ACME",
+                                title1_nodes=ChecklistParser.parse_nodes(SAMPLE_CHECKLIST),
+                                storage_mode="journal")
+        assert reloaded.checked_items == {"prepare_issues::실시규정 미비"}
+        reloaded.flush()
+
+        # Binding folded the journal into the snapshot
+        with open(os.path.join(data_dir, "state_ACME.json"), 'r', encoding='utf-8') as f:
+            assert json.load(f)["checked_items"] == ["prepare_issues::실시규정 미비"]
+        with open(journal_file, 'rb') as f:
+            assert len(f.read().splitlines()) == 1
+        reloaded.close()
+
+
+def test_journal_compaction():
+    """A journal past the size threshold is compacted in the background"""
+    title1_nodes = ChecklistParser.parse_nodes(SAMPLE_CHECKLIST)
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        state_manager = StateManager(data_dir=data_dir, company_name="ACME",
+                                     title1_nodes=title1_nodes, storage_mode="journal")
+        state_manager.storage.compact_threshold = 200
+
+        for _ in range(50):
+            state_manager.toggle_item("worker", "교육 참여")
+        state_manager.toggle_item("worker", "교육 참여")
+
+        deadline = time.time() + 5
+        while state_manager.storage._compacting and time.time() < deadline:
+            time.sleep(0.01)
+
+        journal_file = os.path.join(data_dir, "state_ACME.journal")
+        assert os.path.getsize(journal_file) < 200
+        state_manager.close()
+
+        reloaded = StateManager(data_dir=data_dir, company_name="ACME",
+                                title1_nodes=ChecklistParser.parse_nodes(SAMPLE_CHECKLIST),
+                                storage_mode="journal")
+        assert reloaded.is_item_checked("worker", "교육 참여")
+        reloaded.close()
+
+
+def test_save_scheduler_coalesces():
+    """A burst of saves becomes one atomic background write"""
+    title1_nodes = ChecklistParser.parse_nodes(SAMPLE_CHECKLIST)
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        state_manager = StateManager(data_dir=data_dir, company_name="ACME",
+                                     title1_nodes=title1_nodes, save_delay=0.2)
+        writes = []
+        write_snapshot = state_manager.storage.write_snapshot
+        state_manager.storage.write_snapshot = lambda data: (writes.append(data), write_snapshot(data))
+
+        for item in title1_nodes[1].get_title2_children()[0].get_sections()[0].items:
+            state_manager.set_item_checked("prepare_issues", item, True)
+        assert writes == []
+
+        state_manager.flush()
+        assert len(writes) == 1
+        assert os.listdir(data_dir) == ["state_ACME.json"]
+        with open(os.path.join(data_dir, "state_ACME.json"), 'r', encoding='utf-8') as f:
+            assert len(json.load(f)["checked_items"]) == 3
+
+        state_manager.save_state()
+        deadline = time.time() + 5
+        while len(writes) < 2 and time.time() < deadline:
+            time.sleep(0.05)
+        assert len(writes) == 2
+        state_manager.close()
+
+
+def test_failed_save_is_retried():
+    """A background write that fails is written again instead of being dropped"""
+    title1_nodes = ChecklistParser.parse_nodes(SAMPLE_CHECKLIST)
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        state_manager = StateManager(data_dir=data_dir, company_name="ACME",
+                                     title1_nodes=title1_nodes, save_delay=0.05)
+        state_manager._save_scheduler.RETRY_DELAY = 0.1
+        attempts = []
+        write_snapshot = state_manager.storage.write_snapshot
+
+        def flaky_write(data):
+            attempts.append(data)
+            if len(attempts) == 1:
+                raise OSError("disk busy")
+            write_snapshot(data)
+
+        state_manager.storage.write_snapshot = flaky_write
+        state_manager.set_item_checked("worker", "교육 참여", True)
+
+        deadline = time.time() + 5
+        while len(attempts) < 2 and time.time() < deadline:
+            time.sleep(0.02)
+        state_manager.flush()
+        assert len(attempts) == 2
+        with open(os.path.join(data_dir, "state_ACME.json"), 'r', encoding='utf-8') as f:
+            assert json.load(f)["checked_items"] == ["worker::교육 참여"]
+        state_manager.close()
+
+
+def test_close_waits_for_taken_write():
+    """close() waits for a write the worker has taken but not started yet"""
+    class SlowStartScheduler(SaveScheduler):
+        def _write(self):
+            # The worker is preempted between taking the request and writing
+            time.sleep(0.1)
+            super()._write()
+
+    closed = []
+    writes = []
+
+    def write():
+        time.sleep(0.05)
+        writes.append(bool(closed))
+
+    scheduler = SlowStartScheduler(write, delay=0)
+    scheduler.mark_dirty()
+    deadline = time.time() + 5
+    while scheduler.is_dirty and time.time() < deadline:
+        time.sleep(0.005)
+    scheduler.close()
+    closed.append(True)
+    assert writes == [False]
+    time.sleep(0.2)
+    assert writes == [False]
+
+
+def test_sqlite_storage():
+    """All companies share one database; JSON state files can be imported"""
+    with tempfile.TemporaryDirectory() as data_dir:
+        with open(os.path.join(data_dir, "state_Old Corp.json"), 'w', encoding='utf-8') as f:
+            json.dump({"company_name": "Old Corp", "checked_items": ["worker::교육 참여"]},
+                      f, ensure_ascii=False)
+        assert import_json_states(data_dir) == 1
+        assert import_json_states(data_dir) == 0
+
+        state_manager = StateManager(data_dir=data_dir, company_name="(주)새회사",
+                                     title1_nodes=ChecklistParser.parse_nodes(SAMPLE_CHECKLIST),
+                                     storage_mode="sqlite")
+        state_manager.set_item_checked("mgt", "위험성평가 준비사항 확인", True)
+        state_manager.check_all_section("worker", ["교육 참여"])
+        state_manager.set_item_checked("mgt", "위험성평가 준비사항 확인", False)
+        state_manager.close()
+
+        companies = list_companies(os.path.join(data_dir, "state.db"))
+        assert [(c["company_name"], c["checked_count"]) for c in companies] == [
+            ("(주)새회사", 1), ("Old Corp", 1)
+        ]
+        assert [c["company_name"] for c in list_companies(
+            os.path.join(data_dir, "state.db"), "새회사")] == ["(주)새회사"]
+
+        reloaded = StateManager(data_dir=data_dir, company_name="Old Corp",
+                                title1_nodes=ChecklistParser.parse_nodes(SAMPLE_CHECKLIST),
+                                storage_mode="sqlite")
+        assert reloaded.checked_items == {"worker::교육 참여"}
+        reloaded.close()
+
+
+if __name__ == "__main__":
+    test_journal_replay()
+    test_journal_compaction()
+    test_save_scheduler_coalesces()
+    test_failed_save_is_retried()
+    test_close_waits_for_taken_write()
+    test_sqlite_storage()
+    print("🎉 State storage test completed successfully!")
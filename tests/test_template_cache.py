@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import sys
+import os
+import shutil
+import tempfile
+import threading
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from models import ChecklistParser
+from document_backend import FieldInventory, InMemoryDocumentBackend
+from hwp_converter import HWPConverter
+from template_cache import TemplateInventoryCache, TemplateIndexer, TemplatePlan
+
+from test_state_index import SAMPLE_CHECKLIST
+
+
+def _write(file_path, content):
+    with open(file_path, 'wb') as f:
+        f.write(content)
+
+
+def test_template_cache():
+    """Inventories are keyed by content, persisted and give conversion plans"""
+    with tempfile.TemporaryDirectory() as work_dir:
+        cache_file = os.path.join(work_dir, "cache", "templates.json")
+        template = os.path.join(work_dir, "report.hwp")
+        _write(template, b"template v1")
+
+        cache = TemplateInventoryCache(cache_file)
+        assert cache.lookup(template) is None
+        cache.store(template, FieldInventory.from_occurrences(["company_name", "worker", "mgt", "worker"]))
+
+        # A copy under another name is the same template; changed content is not
+        copy = os.path.join(work_dir, "copy.hwp")
+        shutil.copy(template, copy)
+        reloaded = TemplateInventoryCache(cache_file)
+        assert reloaded.lookup(copy).counts == {"company_name": 1, "worker": 2, "mgt": 1}
+        plan = reloaded.get_plan(copy, ["mgt", "worker", "prepare_issues"], ["company_name", "report_date"])
+        assert plan == TemplatePlan(fields=("company_name", "worker", "mgt"), fixed_fields=("company_name",),
+                                    section_fields=("worker", "mgt"), section_count=3)
+        # Compiled plans are kept on disk too
+        assert TemplateInventoryCache(cache_file).get_plan(
+            template, ["mgt", "worker", "prepare_issues"], ["company_name", "report_date"]) == plan
+        _write(copy, b"template v2")
+        os.utime(copy, ns=(0, 0))
+        assert reloaded.lookup(copy) is None
+        assert reloaded.get_plan(copy, ["mgt"]) is None
+
+        # The indexer reads only templates it doesn't know yet
+        templates_dir = os.path.join(work_dir, "templates")
+        os.makedirs(templates_dir)
+        shutil.copy(template, os.path.join(templates_dir, "a.hwp"))
+        _write(os.path.join(templates_dir, "b.hwpx"), b"other template")
+        _write(os.path.join(templates_dir, "broken.hwp"), b"broken")
+        _write(os.path.join(templates_dir, "notes.txt"), b"not a template")
+        read = []
+
+        def read_inventory(file_path):
+            read.append(os.path.basename(file_path))
+            if file_path.endswith("broken.hwp"):
+                raise ValueError("unreadable")
+            return FieldInventory.from_occurrences(["company_name"])
+
+        # Warming only hashes: nothing is read, known templates are counted
+        assert TemplateIndexer(reloaded, templates_dir).warm() == 1 and read == []
+
+        indexer = TemplateIndexer(reloaded, templates_dir, read_inventory)
+        assert indexer.run() == 1
+        assert sorted(read) == ["b.hwpx", "broken.hwp"]
+        assert TemplateInventoryCache(cache_file).lookup(os.path.join(templates_dir, "b.hwpx")).names == ["company_name"]
+
+
+def test_shared_cache_file():
+    """Caches sharing a file (e.g. batch worker processes) keep each other's entries"""
+    with tempfile.TemporaryDirectory() as work_dir:
+        cache_file = os.path.join(work_dir, "templates.json")
+        templates = []
+        for number in range(8):
+            templates.append(os.path.join(work_dir, f"report{number}.hwp"))
+            _write(templates[-1], f"template {number}".encode())
+
+        first = TemplateInventoryCache(cache_file)
+        second = TemplateInventoryCache(cache_file)
+        first.store(templates[0], FieldInventory.from_occurrences(["company_name", "mgt"]))
+        second.store(templates[1], FieldInventory.from_occurrences(["worker"]))
+        plan = first.get_plan(templates[0], ["mgt"], ["company_name"])
+        second.store(templates[2], FieldInventory.from_occurrences(["mgt"]))
+
+        reloaded = TemplateInventoryCache(cache_file)
+        assert len(reloaded) == 3
+        assert reloaded.lookup(templates[1]).names == ["worker"]
+        assert reloaded._entries[reloaded.content_hash(templates[0])]["plans"]
+        assert reloaded.get_plan(templates[0], ["mgt"], ["company_name"]) == plan
+
+        # Concurrent writers, each with its own cache instance
+        caches = [TemplateInventoryCache(cache_file) for _ in templates[3:]]
+        threads = [threading.Thread(target=cache.store,
+                                    args=(template, FieldInventory.from_occurrences(["mgt"])))
+                   for cache, template in zip(caches, templates[3:])]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(TemplateInventoryCache(cache_file)) == len(templates)
+
+
+def test_converter_uses_cache():
+    """Known templates are not opened for detection and conversions run from the compiled plan"""
+    title1_nodes = ChecklistParser.parse_nodes(SAMPLE_CHECKLIST)
+    with tempfile.TemporaryDirectory() as work_dir:
+        template = os.path.join(work_dir, "report.hwp")
+        _write(template, b"template")
+        cache = TemplateInventoryCache(os.path.join(work_dir, "templates.json"))
+        document = InMemoryDocumentBackend(fields=["company_name", "report_date", "prepare_issues"])
+        converter = HWPConverter(document=document, template_cache=cache, bulk_fill=False)
+
+        assert converter.detect_hwp_fields(template) == ["company_name", "report_date", "prepare_issues"]
+        assert converter.detect_hwp_fields(template) == ["company_name", "report_date", "prepare_issues"]
+        assert document.calls["open"] == 1
+
+        checked = {"checked_items": ["prepare_issues::평가표 미작성"]}
+        success, message = converter.convert_checklist_to_hwp(template, "ACME", checked, title1_nodes)
+        assert success, message
+        assert "1/3" in message
+        assert document.saved[converter.output_path]["prepare_issues"] == "- 평가표 미작성"
+        # Only the planned section with items is entered; nothing is probed or listed again
+        assert document.calls["move_to_field"] == 1
+        assert document.calls["list_fields"] == 1
+
+        # A template seen for the first time is compiled from the document it opens
+        other = os.path.join(work_dir, "other.hwp")
+        _write(other, b"other template")
+        document.fields = ["mgt", "company_name"]
+        converter = HWPConverter(document=document, template_cache=cache)
+        success, message = converter.convert_checklist_to_hwp(other, "ACME", checked, title1_nodes)
+        assert success and "1/3" in message
+        assert document.calls["list_fields"] == 2
+        assert document.saved[converter.output_path] == {"mgt": "(체크된 항목 없음)", "company_name": "ACME"}
+        assert converter.compile_template(other, converter.get_all_section_ids(title1_nodes)) == \
+            TemplatePlan(("mgt", "company_name"), ("company_name",), ("mgt",), 3)
+        assert document.calls["list_fields"] == 2 and document.calls["open"] == 3
+
+
+if __name__ == "__main__":
+    test_template_cache()
+    test_shared_cache_file()
+    test_converter_uses_cache()
+    print("🎉 Template cache test completed successfully!")
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import sys
+import os
+import tempfile
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from models import ChecklistParser
+from state_manager import StateManager
+from view_state import ChecklistViewModel
+
+from test_state_index import SAMPLE_CHECKLIST
+
+SECOND_STEP = {
+    "id": "assess", "label": "평가 실시", "type": "title2",
+    "children": [
+        {"id": "assess_issues", "label": "문제점", "type": "section",
+         "items": ["유해위험요인 누락"]}
+    ]
+}
+
+
+def test_targeted_changes():
+    """Selections and item changes report only the widgets they touch"""
+    checklist = [dict(title1) for title1 in SAMPLE_CHECKLIST]
+    checklist[1]["children"] = SAMPLE_CHECKLIST[1]["children"] + [SECOND_STEP]
+    title1_nodes = ChecklistParser.parse_nodes(checklist)
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        state_manager = StateManager(data_dir=data_dir, title1_nodes=title1_nodes, save_delay=None)
+
+        view_model = ChecklistViewModel(title1_nodes, state_manager)
+        changes = view_model.reset(0, 0)
+        assert changes.sidebar == {0, 1} and changes.title1_changed and changes.page_changed
+        assert [section.id for section in view_model.page_sections] == ["mgt", "worker"]
+
+        changes = view_model.select(1, 0)
+        assert changes.sidebar == {0, 1} and changes.steps == {0, 1}
+        assert changes.title1_changed and changes.page_changed
+
+        # Same title1: only the two step buttons change, the sidebar stays
+        changes = view_model.select(1, 1)
+        assert changes.sidebar == set() and changes.steps == {0, 1}
+        assert not changes.title1_changed and changes.page_changed
+        assert not view_model.select(1, 1)
+
+        # Completing a step off the current page restyles that step only
+        items = title1_nodes[1].get_title2_children()[0].get_sections()[0].items
+        changed = state_manager.apply_changes(("prepare_issues", item, True) for item in items[:2])
+        assert not view_model.items_changed(changed)
+        changed = state_manager.apply_changes([("prepare_issues", items[2], True)])
+        changes = view_model.items_changed(changed)
+        assert changes.steps == {0} and changes.sections == set()
+        assert view_model.is_step_completed(0)
+
+        changes = view_model.items_changed(state_manager.check_all_section("assess_issues", ["유해위험요인 누락"]))
+        assert changes.steps == {1} and changes.sections == {"assess_issues"}
+
+        # A toggled checkbox is already up to date; only the step is restyled
+        state_manager.toggle_item("assess_issues", "유해위험요인 누락")
+        changes = view_model.items_changed(["assess_issues"], refresh_sections=False)
+        assert changes.steps == {1} and changes.sections == set()
+        state_manager.toggle_item("assess_issues", "유해위험요인 누락")
+        changes = view_model.item_toggled("assess_issues", "유해위험요인 누락")
+        assert changes.steps == {1} and changes.sections == set()
+
+        # Sections of another title1 touch nothing here
+        assert not view_model.items_changed(state_manager.check_all_section("worker", ["교육 참여"]))
+        state_manager.close()
+
+
+if __name__ == "__main__":
+    test_targeted_changes()
+    print("🎉 View state test completed successfully!")
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import sys
+import os
+import tkinter as tk
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from wrap_layout import WrapLengthManager
+
+
+class FakeContainer:
+    def __init__(self):
+        self.callbacks = []
+        self.scheduled = {}
+
+    def bind(self, sequence, callback, add=None):
+        self.callbacks.append(callback)
+
+    def after(self, ms, callback):
+        after_id = f"after#{len(self.scheduled)}"
+        self.scheduled[after_id] = callback
+        return after_id
+
+    def after_cancel(self, after_id):
+        del self.scheduled[after_id]
+
+    def _get_widget_scaling(self):
+        return 2.0
+
+    def resize(self, width):
+        event = type("Event", (), {"width": width})()
+        for callback in self.callbacks:
+            callback(event)
+
+    def run_pending(self):
+        scheduled, self.scheduled = self.scheduled, {}
+        for callback in scheduled.values():
+            callback()
+
+
+class FakeLabel:
+    def __init__(self):
+        self.configured = []
+        self.destroyed = False
+
+    def configure(self, wraplength):
+        if self.destroyed:
+            raise tk.TclError("invalid command name")
+        self.configured.append(wraplength)
+
+
+def test_coalesced_wraplength():
+    """Width changes are debounced and applied once, skipping unchanged labels"""
+    container = FakeContainer()
+    manager = WrapLengthManager(container, inset=30)
+    labels = [FakeLabel() for _ in range(3)]
+    for label in labels:
+        manager.register(label)
+    wide = FakeLabel()
+    manager.register(wide, inset=10)
+
+    # A burst of resizes schedules a single pass
+    for width in (600, 700, 800):
+        container.resize(width)
+    assert len(container.scheduled) == 1
+    assert not any(label.configured for label in labels)
+    container.run_pending()
+    assert [label.configured for label in labels] == [[370]] * 3
+    assert wide.configured == [390]
+
+    # Same width: nothing is scheduled; same wraplength: nothing is reconfigured
+    container.resize(800)
+    assert not container.scheduled
+    manager.update_width(801)
+    assert labels[0].configured == [370]
+
+    # Labels registered later get the current value; destroyed ones are dropped
+    late = FakeLabel()
+    manager.register(late)
+    assert late.configured == [370]
+    labels[1].destroyed = True
+    manager.update_width(1000)
+    assert labels[0].configured == [370, 470]
+    assert labels[1] not in manager._labels
+
+    # Below the minimum width labels keep their last value
+    manager.update_width(120)
+    assert labels[0].configured == [370, 470]
+
+
+if __name__ == "__main__":
+    test_coalesced_wraplength()
+    print("🎉 Wrap layout test completed successfully!")